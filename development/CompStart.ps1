@@ -98,6 +98,70 @@ function Get-StartupItem {
     Start-StartupItem -StartItemNumber $ItemNumber -ProgramPath $ItemPath -ArgumentsList $AllArgs
 }
 
+function Get-LaunchPlan {
+    <#
+        .SYNOPSIS
+        Reads in the launch plan for a startup file, if it's up to date.
+
+        .DESCRIPTION
+        The `Get-LaunchPlan` function reads in the launch plan file that CompStart.py writes next to the startup file every time the startup data is saved. The launch plan has the startup items already in launch order, with their arguments already joined into one string, so the startup file doesn't have to be read in. The first line of the launch plan has the SHA-256 digests of the startup file and its journal file, and the launch plan is only used if both still match the files on disk.
+
+        .PARAMETER JSONFile
+        The full path to the startup file.
+
+        .EXAMPLE
+        $PlanItems = Get-LaunchPlan -JSONFile "C:\CompStart\config\startup_data.json"
+        Returns the startup items from "C:\CompStart\config\startup_data.json.plan", or $null if the launch plan is missing or out of date.
+
+        .NOTES
+            The format of the launch plan file is described at the top of the Python module cs_plan.
+    #>
+    param (
+        [Parameter(Mandatory)]
+        [string]$JSONFile
+    )
+
+    $PlanFile = $JSONFile + ".plan"
+    $JournalFile = $JSONFile + ".journal"
+
+    if (-not (Test-Path -LiteralPath $PlanFile)) {
+        return $null
+    }
+
+    # Check the format and version of the launch plan
+    $PlanLines = [System.IO.File]::ReadAllLines($PlanFile)
+    $PlanHeader = $PlanLines[0] -split "`t"
+
+    if (($PlanHeader.Length -ne 4) -or ($PlanHeader[0] -ne "CompStartPlan") -or ($PlanHeader[1] -ne "1")) {
+        return $null
+    }
+
+    # Check the launch plan was written from the startup file and journal file that are on disk now
+    $JSONDigest = (Get-FileHash -LiteralPath $JSONFile -Algorithm SHA256).Hash
+    $JournalDigest = ""
+    if (Test-Path -LiteralPath $JournalFile) {
+        $JournalDigest = (Get-FileHash -LiteralPath $JournalFile -Algorithm SHA256).Hash
+    }
+
+    if (($PlanHeader[2] -ne $JSONDigest) -or ($PlanHeader[3] -ne $JournalDigest)) {
+        return $null
+    }
+
+    # Each line after the header is one startup item, already in launch order
+    $PlanItems = [System.Collections.Generic.List[PSCustomObject]]::new()
+    for ($LineIndex = 1; $LineIndex -lt $PlanLines.Length; $LineIndex++) {
+        $PlanFields = $PlanLines[$LineIndex] -split "`t"
+
+        $PlanItems.Add([PSCustomObject]@{
+            ItemNumber = [int32]$PlanFields[0]
+            FilePath = $PlanFields[1]
+            Arguments = $PlanFields[2]
+        })
+    }
+
+    return ,$PlanItems.ToArray()
+}
+
 # Loop until user answers prompt
 $LoopTrue = $True
 
@@ -127,13 +191,28 @@ do {
         # Concatenate all 3 variables to get the full script path
         $JSONFile = [string]$CurrentLocation + $DataFileLocation + $DataFileName
 
-        # Load JSON data
-        $JSONData = Get-Content -Path $JSONFile | ConvertFrom-Json
-        $StartupData = $JSONData.Items
+        # Use the launch plan if it's up to date, since it doesn't need the JSON data to be parsed
+        $PlanItems = Get-LaunchPlan -JSONFile $JSONFile
 
-        # Loop through startup data array and process each item
-        foreach ($StartupItem in $StartupData) {
-            Get-StartupItem $StartupItem
+        if ($null -ne $PlanItems) {
+            foreach ($PlanItem in $PlanItems) {
+                Start-StartupItem -StartItemNumber $PlanItem.ItemNumber -ProgramPath $PlanItem.FilePath -ArgumentsList $PlanItem.Arguments
+            }
+        }
+        else {
+            # Without a launch plan, the startup items are launched one at a time in ItemNumber order
+            Write-Warning ("No up-to-date launch plan was found for $JSONFile, so the startup items are launched in ItemNumber order. " +
+                "Priority and After are ignored and startup items opening the same program aren't combined. " +
+                "Save the startup file from CompStart.py to write the launch plan again.")
+
+            # Load JSON data
+            $JSONData = Get-Content -Path $JSONFile | ConvertFrom-Json
+            $StartupData = $JSONData.Items
+
+            # Loop through startup data array and process each item
+            foreach ($StartupItem in $StartupData) {
+                Get-StartupItem $StartupItem
+            }
         }
     }
     elseif (($UserPrompt -eq "N") -or ($UserPrompt -eq "n")) {
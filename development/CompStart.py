@@ -1,9 +1,17 @@
 # This will be a command line tool to create and edit the startup_data.json file
-import sys
+# It can also be started with an operations file to apply changes without any menus: CompStart.py --batch OPERATIONS_FILE
+# Each menu action can be profiled by adding --profile or by setting the environment variable COMPSTART_PROFILE, which is explained in the module cs_profile
+import os, sys, atexit
 import dependencies.cs_jsonfn as deps_json
 import dependencies.cs_helper as deps_helper
 import dependencies.cs_chooser as deps_chooser
 import dependencies.cs_pretty as deps_pretty
+import dependencies.cs_journal as deps_journal
+import dependencies.cs_launch as deps_launch
+import dependencies.cs_timing as deps_timing
+import dependencies.cs_batch as deps_batch
+import dependencies.cs_pager as deps_pager
+import dependencies.cs_profile as deps_profile
 
 # Global Variables
 
@@ -13,6 +21,35 @@ is_prod = True
 # Specifies the name of the project root or the start directory
 start_dir = "CompStart"
 
+# Specifies whether single startup item changes are appended to a journal file instead of rewriting the whole startup file
+use_journal = False
+
+# Specifies how many journal records can build up before they are folded back into the startup file
+journal_threshold = 50
+
+# Specifies how the startup file is written to disk, which must be one of the values of the Enum class WriteDurabilityVals:
+# "direct", "atomic", "durable" or "group"
+write_durability = "durable"
+
+# Specifies how many seconds writes can wait to be flushed to disk together when write_durability is "group"
+group_commit_window = 2.0
+
+# Specifies the most startup items that are started at the same time when launching them from CompStart.py
+launch_workers = 4
+
+# Specifies the most seconds to wait for each started program to be ready for input, or 0 to not wait
+# Waiting is only possible on Windows, and a startup item being waited on still counts towards launch_workers
+launch_ready_timeout = 0
+
+# Specifies how many launches are kept in the launch history used for the slowest items report
+launch_history_runs = 20
+
+# Specifies the most folders whose program paths are checked at the same time when checking that every FilePath can be launched
+preflight_workers = 16
+
+# Specifies whether every FilePath is also checked each time the startup data is saved from the editor
+preflight_on_save = False
+
 # If there are any errors, print this out at the end
 final_err_msg = (
     "Please see the error message(s) above and report them to the development team"
@@ -20,6 +57,21 @@ final_err_msg = (
 
 # Program starting point
 if __name__ == "__main__":
+    # Keep the folder the tool was started from, since paths given on the command line are relative to it
+    start_cwd = os.getcwd()
+
+    # Only create a profiler if profiling is turned on, so the menu actions run exactly as before when it's off
+    profile_dir, cli_args = deps_profile.get_profile_dir(sys.argv[1:], start_cwd)
+    action_profiler = None
+    if profile_dir:
+        action_profiler = deps_profile.ActionProfiler(profile_dir)
+
+        # The user can quit the tool from inside a menu action, which still has to be written out
+        atexit.register(action_profiler.stop)
+
+    # Any other command-line arguments mean the tool is being run from a script, so there's no one to answer the menus
+    is_batch = len(cli_args) > 0
+
     # Set the starting directory
     start_dir_result = deps_helper.set_start_dir(start_dir)
     if not start_dir_result:
@@ -28,6 +80,10 @@ if __name__ == "__main__":
             "main > set_start_dir",
         )
         print(f"\n{final_err_msg}")
+
+        if is_batch:
+            sys.exit(1)
+
         input("\nPlease press the enter key when ready to close this window...")
         sys.exit()
 
@@ -35,6 +91,22 @@ if __name__ == "__main__":
     json_path = deps_helper.get_prod_path()
     json_filename = deps_helper.get_startup_filename(default_json=False)
 
+    # Apply the operations file and exit without showing any menus
+    if is_batch:
+        if action_profiler is not None:
+            action_profiler.start("Batch operations")
+
+        batch_status = deps_batch.batch_cli(cli_args, start_cwd, json_path, json_filename)
+
+        if action_profiler is not None:
+            action_profiler.stop()
+
+        sys.exit(batch_status)
+
+    # In journaled storage mode, the journal is folded back into the startup file when the menu loop below ends
+    # If the tool is killed or the computer loses power first, the journal stays on disk and is replayed the next time the startup data is read in
+    # Until then, CompStart.ps1 still uses the launch plan, which is written after every journal save, unless the tool was killed between the two
+
     # Print welcome message
     print(
         "\nWelcome to CompStart: The computer startup tool that will make your life easier"
@@ -51,68 +123,120 @@ if __name__ == "__main__":
         "Create a new startup file",
         "View the startup file",
         "Edit the startup file",
+        "Launch the startup items",
+        "Show the slowest startup items",
+        "Preview how the startup items would be launched",
         # "Add new startup items to the startup file",
     ]
 
-    # Main loop to allow user to navigate program options
-    while not quit_loop:
-        user_choice = deps_chooser.user_menu_chooser(menu_choices)
-
-        match user_choice:
-            case 1:
-                deps_helper.program_info()
-            case 2:
-                # Find out which type of new file the user wants
-                is_default, create_file = deps_chooser.new_file_chooser()
-
-                if create_file:
-                    # Create a new JSON file
-                    status_state, status_message = deps_json.json_creator(
-                        json_path, json_filename, is_default
+    try:
+        # Main loop to allow user to navigate program options
+        while not quit_loop:
+            user_choice = deps_chooser.user_menu_chooser(menu_choices)
+
+            # Profile the menu action the user picked, if profiling is turned on and the choice is one of the menu actions
+            if action_profiler is not None and 1 <= user_choice <= len(menu_choices):
+                action_profiler.start(menu_choices[user_choice - 1])
+
+            match user_choice:
+                case 1:
+                    deps_helper.program_info()
+                case 2:
+                    # Find out which type of new file the user wants
+                    is_default, create_file = deps_chooser.new_file_chooser()
+
+                    if create_file:
+                        # Create a new JSON file
+                        status_state, status_message = deps_json.json_creator(
+                            json_path, json_filename, is_default
+                        )
+
+                    # If there were any errors, let the user know to check the error messages
+                    if not status_state and not status_message.startswith("Skipped"):
+                        status_message = final_err_msg
+
+                    # Print out the status message
+                    print(f"\n{status_message}")
+                case 3:
+                    # Show the startup data a page at a time, reading in only the startup items on each page
+                    status_state, status_message = deps_pager.startup_viewer(
+                        json_path, json_filename
+                    )
+
+                    # If there were any errors, let the user know to check the error messages
+                    if not status_state:
+                        status_message = final_err_msg
+
+                    # Print out the status message
+                    print(f"\n{status_message}")
+
+                case 4:
+                    status_state, status_message = deps_json.json_editor(
+                        json_path, json_filename
+                    )
+
+                    # If there were any errors, let the user know to check the error messages
+                    if not status_state:
+                        status_message = final_err_msg
+
+                    # Print out the status message
+                    print(f"\n{status_message}")
+
+                case 5:
+                    status_state, status_message, launch_results = deps_launch.startup_launcher(
+                        json_path, json_filename
                     )
 
-                # If there were any errors, let the user know to check the error messages
-                if not status_state and not status_message.startswith("Skipped"):
-                    status_message = final_err_msg
-
-                # Print out the status message
-                print(f"\n{status_message}")
-            case 3:
-                # Read in existing JSON file and store the return results of the json_read function, then print out if the read was successful
-                status_state, status_message, json_data = deps_json.json_reader(
-                    json_path, json_filename
-                )
-
-                # If there were any errors, let the user know to check the error messages
-                if not status_state:
-                    status_message = final_err_msg
-
-                # Print out the status message
-                print(f"\n{status_message}")
-
-                # If there was data read in, print it out in a prettified way
-                if status_state:
-                    input("Press enter when ready to view the startup data...")
-                    print(deps_pretty.prettify_json(json_data))
-                    input(
-                        "\nPress enter when ready to return to the previous menu..."
+                    # Show how each startup item was launched, if the startup data could be read in
+                    if launch_results:
+                        print(deps_pretty.prettify_launch_results(launch_results))
+
+                    # If there were any errors, let the user know to check the error messages
+                    if not status_state:
+                        status_message = final_err_msg
+
+                    # Print out the status message
+                    print(f"\n{status_message}")
+
+                case 6:
+                    status_state, status_message = deps_timing.timing_reporter(
+                        json_path, json_filename
                     )
-            case 4:
-                status_state, status_message = deps_json.json_editor(
-                    json_path, json_filename
-                )
-
-                # If there were any errors, let the user know to check the error messages
-                if not status_state:
-                    status_message = final_err_msg
-
-                # Print out the status message
-                print(f"\n{status_message}")
-
-            # case 5:
-            #    deps_json.json_adder(json_path, json_filename)
-            case _:
-                # This case will never really be addressed since the function user_menu_chooser adds an option by default to quit the program
-                # If the user picks that option, the function calls sys.exit so execution should never return to this loop
-                # However, just in case execution does return (i.e., some bug that gets introduced), this will prevent an infinite loop
-                quit_loop = True
+
+                    # If there were any errors, let the user know to check the error messages
+                    if not status_state:
+                        status_message = final_err_msg
+
+                    # Print out the status message
+                    print(f"\n{status_message}")
+
+                case 7:
+                    # Dry run of launching the startup items, showing which ones would share a program start
+                    status_state, status_message, plan_rows = deps_launch.launch_previewer(
+                        json_path, json_filename
+                    )
+
+                    if plan_rows:
+                        print(deps_pretty.prettify_launch_plan(plan_rows))
+
+                    # If there were any errors, let the user know to check the error messages
+                    if not status_state:
+                        status_message = final_err_msg
+
+                    # Print out the status message
+                    print(f"\n{status_message}")
+
+                # case 8:
+                #    deps_json.json_adder(json_path, json_filename)
+                case _:
+                    # This case will never really be addressed since the function user_menu_chooser adds an option by default to quit the program
+                    # If the user picks that option, the function calls sys.exit so execution should never return to this loop
+                    # However, just in case execution does return (i.e., some bug that gets introduced), this will prevent an infinite loop
+                    quit_loop = True
+
+            if action_profiler is not None:
+                action_profiler.stop()
+    finally:
+        # Fold the journal as soon as the menu loop ends, which includes the user quitting from any menu since that raises SystemExit
+        if use_journal:
+            deps_journal.fold_journal(json_path, json_filename)
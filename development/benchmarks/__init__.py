@@ -0,0 +1,2 @@
+# Python init file to make this "benchmarks" folder a module
+# The module will house the benchmark scripts used to measure the performance of CompStart.py and its dependencies
@@ -0,0 +1,72 @@
+# Benchmark for generate_user_batch_edited_data comparing k startup item edits made with one call each to
+# generate_user_edited_data against the same edits made in one call to generate_user_batch_edited_data
+#
+# Usage (from the development folder): python -m benchmarks.bench_batch_edit
+
+import benchmarks.bench_common as bench_common
+
+bench_common.setup_environment()
+
+import dependencies.cs_data_generate as deps_data_gen
+import dependencies.cs_document as deps_document
+import dependencies.cs_enum as deps_enum
+
+ENUM_ITV = deps_enum.ItemTypeVals
+
+
+def make_edits(total_items: int, edit_count: int):
+    """Make edit_count edits spread over the startup data, alternating between deletes and replaces"""
+    edit_list = []
+
+    for edit_index in range(edit_count):
+        startup_item = bench_common.make_startup_item(edit_index * (total_items // edit_count) + 1)
+
+        if edit_index % 2 == 0:
+            edit_list.append((startup_item, ENUM_ITV.DELETE.value))
+        else:
+            startup_item["Name"] = "Changed"
+            edit_list.append((startup_item, ENUM_ITV.REPLACE.value))
+
+    return edit_list
+
+
+def single_edits(edit_list: list, orig_json_data):
+    """Make each edit with its own call, going from the last startup item back so every ItemNumber stays correct"""
+    new_json_data = orig_json_data
+
+    for modified_json_data, item_type in sorted(
+        edit_list, key=lambda edit: edit[0]["ItemNumber"], reverse=True
+    ):
+        new_json_data = deps_data_gen.generate_user_edited_data(
+            modified_json_data, item_type, new_json_data
+        )
+
+    return new_json_data
+
+
+if __name__ == "__main__":
+    print(
+        f"{'Items':>8} {'Edits':>6} {'Dict single (ms)':>17} {'Dict batch (ms)':>16}"
+        f" {'Document single (ms)':>21} {'Document batch (ms)':>20}"
+    )
+
+    total_items = 2000
+    json_data = bench_common.make_startup_data(total_items)
+    json_document = deps_document.StartupDocument.from_json(json_data)
+
+    for edit_count in [1, 10, 100]:
+        edit_list = make_edits(total_items, edit_count)
+
+        dict_single = bench_common.time_call(single_edits, edit_list, json_data, repeat=1)
+        dict_batch = bench_common.time_call(
+            deps_data_gen.generate_user_batch_edited_data, edit_list, json_data, repeat=3
+        )
+        document_single = bench_common.time_call(single_edits, edit_list, json_document, repeat=3)
+        document_batch = bench_common.time_call(
+            deps_data_gen.generate_user_batch_edited_data, edit_list, json_document, repeat=3
+        )
+
+        print(
+            f"{total_items:>8} {edit_count:>6} {dict_single * 1000:17.1f} {dict_batch * 1000:16.1f}"
+            f" {document_single * 1000:21.1f} {document_batch * 1000:20.1f}"
+        )
@@ -0,0 +1,91 @@
+# Shared helper functions for the benchmark scripts
+
+import os, sys, time
+
+# Folder that holds CompStart.py, which is the folder all the benchmarks need to run from
+DEVELOPMENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def setup_environment():
+    """Helper function to set up the environment for a benchmark script
+
+    The dependencies expect the current working directory to be the folder that holds CompStart.py so that the config folder can be found, and expect that folder to be on the module search path. This function takes care of both.
+    """
+    os.chdir(DEVELOPMENT_DIR)
+
+    if DEVELOPMENT_DIR not in sys.path:
+        sys.path.insert(0, DEVELOPMENT_DIR)
+
+
+def make_startup_item(item_number: int):
+    """Helper function to create one synthetic startup item
+
+    Every third startup item is a browser item with a few URL arguments so the synthetic data looks roughly like real startup data.
+
+    Args:
+        item_number (int): The ItemNumber to give the startup item
+
+    Returns:
+        dict: A startup item that is valid against startup_item.schema.json
+    """
+    is_browser = item_number % 3 == 0
+    argument_list = []
+
+    if is_browser:
+        argument_list = ["--new-window"] + [
+            f"https://example.com/{item_number}/{tab}" for tab in range(item_number % 4 + 1)
+        ]
+
+    startup_item = {
+        "ItemNumber": item_number,
+        "Name": f"Program {item_number}",
+        "FilePath": (
+            "C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe"
+            if is_browser
+            else f"C:\\Program Files\\Program{item_number}\\program{item_number}.exe"
+        ),
+        "Description": f"Synthetic startup item number {item_number}",
+        "Browser": is_browser,
+        "ArgumentCount": len(argument_list),
+        "ArgumentList": argument_list,
+    }
+
+    return startup_item
+
+
+def make_startup_data(total_items: int):
+    """Helper function to create synthetic startup data
+
+    Args:
+        total_items (int): The number of startup items to create
+
+    Returns:
+        dict: Full startup data that is valid against startup_data.schema.json
+    """
+    return {
+        "TotalItems": total_items,
+        "Items": [make_startup_item(item_number) for item_number in range(1, total_items + 1)],
+    }
+
+
+def time_call(func, *args, repeat: int = 5, **kwargs):
+    """Helper function to time a function call
+
+    Args:
+        func (function): The function to time
+
+        *args, **kwargs: The arguments to pass to the function
+
+        repeat (int, optional): How many times to call the function. This can only be passed by keyword, so it's never mixed up with the arguments for the function. Defaults to 5.
+
+    Returns:
+        float: The best (lowest) time for a single call, in seconds
+    """
+    best_time = float("inf")
+
+    for run in range(repeat):
+        start_time = time.perf_counter()
+        func(*args, **kwargs)
+        best_time = min(best_time, time.perf_counter() - start_time)
+
+    return best_time
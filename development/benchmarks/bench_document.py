@@ -0,0 +1,65 @@
+# Benchmark for generate_user_edited_data comparing single startup item edits made on a dictionary, which
+# copies the full startup data with deepcopy, against edits made on a StartupDocument, which only copies the
+# path to the changed startup item
+#
+# Usage (from the development folder): python -m benchmarks.bench_document
+
+import tracemalloc
+
+import benchmarks.bench_common as bench_common
+
+bench_common.setup_environment()
+
+import dependencies.cs_data_generate as deps_data_gen
+import dependencies.cs_document as deps_document
+import dependencies.cs_enum as deps_enum
+
+ENUM_ITV = deps_enum.ItemTypeVals
+
+
+def edit_once(orig_json_data, item_type: str, startup_item: dict):
+    """Make a single startup item edit and return the new startup data"""
+    return deps_data_gen.generate_user_edited_data(startup_item, item_type, orig_json_data)
+
+
+def measure_peak(func, *args):
+    """Measure the peak memory allocated while calling func, in bytes"""
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    func(*args)
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return peak_memory
+
+
+if __name__ == "__main__":
+    print(
+        f"{'Items':>8} {'Edit':>8} {'Dict (ms)':>10} {'Document (ms)':>14}"
+        f" {'Dict peak (KiB)':>16} {'Document peak (KiB)':>20}"
+    )
+
+    for total_items in [1000, 10000, 100000]:
+        json_data = bench_common.make_startup_data(total_items)
+        json_document = deps_document.StartupDocument.from_json(json_data)
+        middle_item = bench_common.make_startup_item(total_items // 2)
+        middle_item["Name"] = "Changed"
+
+        edits = [
+            ("Add", ENUM_ITV.ADD.value, bench_common.make_startup_item(total_items + 1)),
+            ("Replace", ENUM_ITV.REPLACE.value, middle_item),
+            ("Delete", ENUM_ITV.DELETE.value, middle_item),
+        ]
+
+        for edit_name, item_type, startup_item in edits:
+            dict_time = bench_common.time_call(edit_once, json_data, item_type, startup_item, repeat=3)
+            document_time = bench_common.time_call(
+                edit_once, json_document, item_type, startup_item, repeat=3
+            )
+            dict_peak = measure_peak(edit_once, json_data, item_type, startup_item)
+            document_peak = measure_peak(edit_once, json_document, item_type, startup_item)
+
+            print(
+                f"{total_items:>8} {edit_name:>8} {dict_time * 1000:10.2f} {document_time * 1000:14.3f}"
+                f" {dict_peak / 1024:16.1f} {document_peak / 1024:20.1f}"
+            )
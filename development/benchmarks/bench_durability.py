@@ -0,0 +1,60 @@
+# Benchmark for json_writer comparing the write latency of each durability level in the Enum class
+# WriteDurabilityVals, so one can be picked per deployment
+#
+# Usage (from the development folder): python -m benchmarks.bench_durability
+
+import os, tempfile, time
+
+import benchmarks.bench_common as bench_common
+
+bench_common.setup_environment()
+
+import CompStart as app_cs
+import dependencies.cs_atomic as deps_atomic
+import dependencies.cs_enum as deps_enum
+import dependencies.cs_jsonfn as deps_json
+
+# Number of saves made in a burst for each durability level
+TOTAL_SAVES = 20
+
+
+def save_burst(json_file: str, json_data_list: list):
+    """Make TOTAL_SAVES saves in a row, alternating between the startup data in json_data_list so every save has changes to write
+
+    Returns:
+        tuple: The (mean, worst) latency of a single save, in seconds, with any group commit at the end of the burst counted as part of the last save
+    """
+    save_times = []
+
+    for save_number in range(TOTAL_SAVES):
+        start_time = time.perf_counter()
+        deps_json.json_writer(json_file, 2, json_data_list[save_number % len(json_data_list)])
+
+        # The burst is over, so flush anything still waiting for a group commit
+        if save_number == TOTAL_SAVES - 1:
+            deps_atomic.group_committer()
+
+        save_times.append(time.perf_counter() - start_time)
+
+    return (sum(save_times) / len(save_times), max(save_times))
+
+
+if __name__ == "__main__":
+    print(f"{'Items':>8} {'Durability':>10} {'Mean (ms)':>10} {'Worst (ms)':>11}")
+
+    with tempfile.TemporaryDirectory(dir=bench_common.DEVELOPMENT_DIR) as temp_dir:
+        json_file = os.path.join(temp_dir, "startup_data.json")
+
+        for total_items in [10, 1000, 10000]:
+            json_data = bench_common.make_startup_data(total_items)
+            changed_data = bench_common.make_startup_data(total_items)
+            changed_data["Items"][0]["Name"] = "Changed"
+
+            for durability in deps_enum.WriteDurabilityVals:
+                app_cs.write_durability = durability.value
+                deps_json.json_writer(json_file, 0, json_data)
+
+                mean_time, worst_time = save_burst(json_file, [changed_data, json_data])
+                print(
+                    f"{total_items:>8} {durability.value:>10} {mean_time * 1000:10.2f} {worst_time * 1000:11.2f}"
+                )
@@ -0,0 +1,68 @@
+# Benchmark for generate_synthetic_startup_file comparing writing synthetic startup data as it's made against
+# building the full startup data in memory first and writing it with json_writer
+#
+# Usage (from the development folder): python -m benchmarks.bench_generate
+
+import os, tempfile, time, tracemalloc
+
+import benchmarks.bench_common as bench_common
+
+bench_common.setup_environment()
+
+import dependencies.cs_data_generate as deps_data_gen
+import dependencies.cs_jsonfn as deps_json
+
+ENUM_JSK = deps_data_gen.ENUM_JSK
+
+
+def in_memory_write(json_file: str, total_items: int):
+    """Build the full startup data as a dictionary and then write it, kept here to compare against"""
+    json_data = {
+        ENUM_JSK.TOTALITEMS.value: total_items,
+        ENUM_JSK.ITEMS.value: list(deps_data_gen.generate_synthetic_items(total_items)),
+    }
+    deps_json.json_writer(json_file, 0, json_data)
+
+
+def measure(func, *args):
+    """Measure the time taken and the peak memory allocated while calling func, in seconds and bytes
+
+    Tracing memory slows down every allocation, so the time is taken from a separate call without it.
+    """
+    start_time = time.perf_counter()
+    func(*args)
+    run_time = time.perf_counter() - start_time
+
+    tracemalloc.start()
+    func(*args)
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return (run_time, peak_memory)
+
+
+if __name__ == "__main__":
+    print(
+        f"{'Items':>8} {'In memory (s)':>14} {'Streamed (s)':>13}"
+        f" {'In memory peak (KiB)':>21} {'Streamed peak (KiB)':>20} {'File (MiB)':>11}"
+    )
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        json_file = os.path.join(temp_dir, "startup_data.json")
+
+        for total_items in [10000, 100000, 500000]:
+            # Building this many startup items in memory takes most of a gigabyte, so only the streamed write is run
+            memory_time, memory_peak = "-", "-"
+            if total_items <= 100000:
+                run_time, peak_memory = measure(in_memory_write, json_file, total_items)
+                memory_time, memory_peak = f"{run_time:.2f}", f"{peak_memory / 1024:.0f}"
+
+            stream_time, stream_peak = measure(
+                deps_data_gen.generate_synthetic_startup_file, json_file, total_items
+            )
+            file_size = os.path.getsize(json_file)
+
+            print(
+                f"{total_items:>8} {memory_time:>14} {stream_time:13.2f}"
+                f" {memory_peak:>21} {stream_peak / 1024:20.0f} {file_size / 2**20:11.1f}"
+            )
@@ -0,0 +1,110 @@
+# Benchmark for how long it takes to import CompStart.py, which is most of the time between starting the tool
+# and seeing the main menu
+#
+# Each run imports CompStart.py in a new Python process with -X importtime, so nothing is already loaded. The
+# slowest modules are listed, and the run fails with exit status 1 if the import takes longer than the budget,
+# or if any of the modules that are meant to load only when their feature is first used were imported.
+#
+# Usage (from the development folder):
+#   python -m benchmarks.bench_import
+#   python -m benchmarks.bench_import --budget 60 --runs 10
+
+import argparse, subprocess, sys
+
+import benchmarks.bench_common as bench_common
+
+bench_common.setup_environment()
+
+# The most milliseconds importing CompStart.py can take, using the best of the runs
+IMPORT_BUDGET_MS = 80.0
+
+# Modules that must not be imported until their feature is first used
+LAZY_MODULES = [
+    "jsonschema",
+    "tkinter",
+    "subprocess",
+    "concurrent.futures",
+    "hashlib",
+    "tempfile",
+    "shutil",
+    "random",
+    "csv",
+]
+
+# The code run in each new Python process, which prints the lazy modules that were imported anyway
+IMPORT_CHECK = (
+    "import sys, CompStart; "
+    f"print(','.join(name for name in {LAZY_MODULES!r} if name in sys.modules))"
+)
+
+
+def run_import():
+    """Import CompStart.py in a new Python process and get the -X importtime results
+
+    Returns:
+        dict: The total microseconds for each top-level import, by module name
+
+        list: Every (module name, self microseconds, total microseconds) reported
+
+        list: The lazy modules that were imported anyway
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", IMPORT_CHECK],
+        cwd=bench_common.DEVELOPMENT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    top_imports = {}
+    all_imports = []
+
+    # Each line looks like "import time:   self |   cumulative | <indent>module name"
+    for import_line in completed.stderr.splitlines():
+        if not import_line.startswith("import time:") or "self [us]" in import_line:
+            continue
+
+        self_time, total_time, module_name = import_line[len("import time:") :].split("|")
+        all_imports.append((module_name.strip(), int(self_time), int(total_time)))
+
+        if not module_name[1:].startswith(" "):
+            top_imports[module_name.strip()] = int(total_time)
+
+    lazy_imported = [name for name in completed.stdout.strip().split(",") if name]
+
+    return (top_imports, all_imports, lazy_imported)
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Import-time budget for CompStart.py")
+    arg_parser.add_argument("--budget", type=float, default=IMPORT_BUDGET_MS, help="the budget in milliseconds")
+    arg_parser.add_argument("--runs", type=int, default=5, help="how many new Python processes to time")
+    args = arg_parser.parse_args()
+
+    best_time = float("inf")
+    best_imports = []
+    lazy_imported = []
+
+    for run in range(args.runs):
+        top_imports, all_imports, lazy_imported = run_import()
+
+        if top_imports["CompStart"] < best_time:
+            best_time = top_imports["CompStart"]
+            best_imports = all_imports
+
+    print(f"Importing CompStart.py took {best_time / 1000:.1f} ms at best over {args.runs} runs (budget {args.budget:.1f} ms)")
+
+    print("\nSlowest modules by self time:")
+    for module_name, self_time, total_time in sorted(best_imports, key=lambda module: module[1], reverse=True)[:10]:
+        print(f"  {module_name:<40} {self_time / 1000:8.2f} ms self {total_time / 1000:8.2f} ms total")
+
+    failures = []
+    if best_time / 1000 > args.budget:
+        failures.append(f"The import took longer than the budget of {args.budget:.1f} ms")
+    if lazy_imported:
+        failures.append("These modules were imported before they were needed: " + ", ".join(lazy_imported))
+
+    for failure in failures:
+        print(f"\nFAILED: {failure}")
+
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,116 @@
+# Benchmark for the search index in cs_index, which times building it, searching it in each of the match types
+# and keeping it up to date as startup items are added, replaced and deleted
+#
+# Every search is also checked against going through all the startup items, so a wrong result fails the run
+# with exit status 1.
+#
+# Usage (from the development folder): python -m benchmarks.bench_index
+
+import sys, time
+
+import benchmarks.bench_common as bench_common
+
+bench_common.setup_environment()
+
+import dependencies.cs_document as deps_document
+import dependencies.cs_enum as deps_enum
+import dependencies.cs_index as deps_index
+
+ENUM_SMV = deps_enum.SearchMatchVals
+
+# The searches to time, as (search text, match type), which include ones that match a single startup item
+# and ones that match a large share of them
+SEARCHES = [
+    ("Program 77777", ENUM_SMV.EXACT.value),
+    ("https://example.com/99999/0", ENUM_SMV.EXACT.value),
+    ("Program 7777", ENUM_SMV.PREFIX.value),
+    ("c:\\program files\\program123", ENUM_SMV.PREFIX.value),
+    ("item number 4242", ENUM_SMV.CONTAINS.value),
+    ("program55555.exe", ENUM_SMV.CONTAINS.value),
+    ("chrome", ENUM_SMV.CONTAINS.value),
+    ("99", ENUM_SMV.CONTAINS.value),
+]
+
+
+def brute_search(items_list: list, search_text: str, match_type: str):
+    """Find the matching startup items by going through all of them, kept here to check the index against"""
+    search_text = search_text.casefold()
+    matched_numbers = []
+
+    for item_index, startup_item in enumerate(items_list):
+        for item_value in deps_index.get_item_values(startup_item):
+            if (
+                (match_type == ENUM_SMV.EXACT.value and item_value == search_text)
+                or (match_type == ENUM_SMV.PREFIX.value and item_value.startswith(search_text))
+                or (match_type == ENUM_SMV.CONTAINS.value and search_text in item_value)
+            ):
+                matched_numbers.append(item_index + 1)
+                break
+
+    return matched_numbers
+
+
+if __name__ == "__main__":
+    total_items = 100000
+    failures = []
+
+    json_data = bench_common.make_startup_data(total_items)
+    json_document = deps_document.StartupDocument.from_json(json_data)
+
+    start_time = time.perf_counter()
+    startup_index = deps_index.get_startup_index(json_document)
+    print(f"Building the index over {total_items} startup items took {time.perf_counter() - start_time:.2f} s")
+
+    start_time = time.perf_counter()
+    startup_index.trigram_builder()
+    print(f"Breaking up the values for the first CONTAINS search took {time.perf_counter() - start_time:.2f} s")
+
+    def check_searches(items_list: list):
+        """Time every search, and check each one against going through all the startup items"""
+        print(f"\n{'Search':<36} {'Match':<9} {'Found':>7} {'Time (ms)':>10} {'First 20 (ms)':>14}")
+
+        for search_text, match_type in SEARCHES:
+            search_time = bench_common.time_call(startup_index.search, search_text, match_type, repeat=5)
+            first_time = bench_common.time_call(startup_index.search, search_text, match_type, 20, repeat=5)
+            found_numbers = startup_index.search(search_text, match_type)
+
+            print(
+                f"{search_text:<36} {match_type:<9} {len(found_numbers):>7}"
+                f" {search_time * 1000:10.3f} {first_time * 1000:14.3f}"
+            )
+
+            if not found_numbers == brute_search(items_list, search_text, match_type):
+                failures.append(f"The {match_type} search for {search_text!r} didn't match going through all the startup items")
+
+    check_searches(json_data["Items"])
+
+    # Keep the index up to date through a few edits, and time each kind of update
+    new_item = bench_common.make_startup_item(total_items + 1)
+    changed_item = bench_common.make_startup_item(50000)
+    changed_item["Name"] = "Changed name"
+
+    update_times = {}
+    for item_type, update_func, item_number in [
+        ("A", lambda: json_document.add_item(new_item), 0),
+        ("R", lambda: json_document.replace_item(50000, changed_item), 50000),
+        ("D", lambda: json_document.delete_item(10), 10),
+    ]:
+        new_json_document = update_func()
+
+        start_time = time.perf_counter()
+        deps_index.index_updater(json_document, new_json_document, item_type, item_number)
+        update_times[item_type] = time.perf_counter() - start_time
+
+        json_document = new_json_document
+
+    print("\nUpdating the index: " + ", ".join(f"{item_type} {update_time * 1000:.3f} ms" for item_type, update_time in update_times.items()))
+
+    if deps_index.get_startup_index(json_document) is not startup_index:
+        failures.append("The index was built again instead of being updated")
+
+    check_searches(json_document.to_json()["Items"])
+
+    for failure in failures:
+        print(f"\nFAILED: {failure}")
+
+    sys.exit(1 if failures else 0)
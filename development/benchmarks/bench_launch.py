@@ -0,0 +1,134 @@
+# Benchmark for the launch engine in cs_launch measuring the time until all startup items are started for
+# different numbers of workers. The startup items run a stub executable that exits straight away, so this runs
+# on Linux or macOS without any of the real programs installed.
+#
+# Before the benchmark, a few startup items running /bin/sh are launched for real to check the launch results and
+# the order from the After key. The script exits with status 1 if any of those checks fail.
+#
+# Usage (from the development folder): python -m benchmarks.bench_launch
+
+import os, stat, sys, tempfile, time
+
+import benchmarks.bench_common as bench_common
+
+bench_common.setup_environment()
+
+import dependencies.cs_launch as deps_launch
+
+
+def make_stub_executable(folder_path: str):
+    """Create a stub executable that exits straight away and return its full path"""
+    stub_file = os.path.join(folder_path, "stub_program")
+
+    with open(stub_file, "w") as file:
+        file.write("#!/bin/sh\nexit 0\n")
+
+    os.chmod(stub_file, os.stat(stub_file).st_mode | stat.S_IXUSR)
+
+    return stub_file
+
+
+def make_stub_data(stub_file: str, total_items: int):
+    """Create startup data where every startup item runs the stub executable"""
+    json_data = bench_common.make_startup_data(total_items)
+
+    for startup_item in json_data["Items"]:
+        startup_item["FilePath"] = stub_file
+
+    return json_data
+
+
+def launch_checker():
+    """Launch startup items that run /bin/sh for real and return a list of any problems with the launch results"""
+    failures = []
+    item_names = ["First", "Second", "Third", "Alone"]
+    json_data = bench_common.make_startup_data(len(item_names))
+
+    # Second waits on First and Third on Second, while Alone can start at any time
+    for startup_item, item_name in zip(json_data["Items"], item_names):
+        startup_item["Name"] = item_name
+        startup_item["FilePath"] = "/bin/sh"
+        startup_item["Browser"] = False
+        startup_item["ArgumentList"] = ["-c", "sleep 0.1"]
+        startup_item["ArgumentCount"] = 2
+
+    json_data["Items"][1]["After"] = ["First"]
+    json_data["Items"][2]["After"] = ["Second"]
+
+    launch_success, return_message, launch_results = deps_launch.launch_startup_items(json_data, 4)
+
+    if not launch_success:
+        failures.append(f"Launch failed: {return_message}")
+
+    if not [launch_result["Name"] for launch_result in launch_results] == item_names:
+        failures.append("Launch results aren't in the order of the startup items")
+
+    launch_results = {launch_result["Name"]: launch_result for launch_result in launch_results}
+
+    for item_name, launch_result in launch_results.items():
+        if not launch_result["Started"]:
+            failures.append(f"{item_name} wasn't started: {launch_result['Error']}")
+        elif launch_result["ProcessId"] <= 0:
+            failures.append(f"{item_name} was started without a process ID")
+        elif launch_result["SpawnEnd"] is None or launch_result["SpawnEnd"] < launch_result["SpawnStart"]:
+            failures.append(f"{item_name} doesn't have a SpawnEnd after its SpawnStart")
+
+    if not len({launch_result["ProcessId"] for launch_result in launch_results.values()}) == len(item_names):
+        failures.append("Two startup items have the same process ID")
+
+    # A startup item must only start once everything in its After key has been started
+    for item_name, after_name in [("Second", "First"), ("Third", "Second")]:
+        spawn_start = launch_results[item_name]["SpawnStart"]
+        after_end = launch_results[after_name]["SpawnEnd"]
+
+        if spawn_start is None or after_end is None or spawn_start < after_end:
+            failures.append(f"{item_name} started before {after_name} was started")
+
+    # Give the shells time to exit before the benchmark
+    time.sleep(0.2)
+
+    return failures
+
+
+if __name__ == "__main__":
+    failures = launch_checker()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        stub_file = make_stub_executable(temp_dir)
+
+        # Starting a program on Linux mostly uses the CPU, so more workers than CPUs won't help much there
+        print(f"CPUs: {os.cpu_count()}\n")
+
+        print(
+            f"{'Items':>6} {'Workers':>8} {'All started (ms)':>17}"
+            f" {'Mean spawn (ms)':>16} {'Max spawn (ms)':>15}"
+        )
+
+        for total_items in [16, 64, 256]:
+            json_data = make_stub_data(stub_file, total_items)
+
+            for max_workers in [1, 2, 4, 8, 16]:
+                launch_start = time.perf_counter()
+                launch_success, return_message, launch_results = deps_launch.launch_startup_items(
+                    json_data, max_workers
+                )
+                launch_time = time.perf_counter() - launch_start
+
+                if not launch_success:
+                    print(return_message)
+
+                spawn_latencies = [launch_result["SpawnLatency"] for launch_result in launch_results]
+
+                print(
+                    f"{total_items:>6} {max_workers:>8} {launch_time * 1000:17.1f}"
+                    f" {sum(spawn_latencies) / total_items * 1000:16.2f}"
+                    f" {max(spawn_latencies) * 1000:15.2f}"
+                )
+
+                # Give the stub programs time to exit before the next run
+                time.sleep(0.2)
+
+    for failure in failures:
+        print(failure)
+
+    sys.exit(1 if failures else 0)
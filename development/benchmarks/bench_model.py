@@ -0,0 +1,76 @@
+# Benchmark comparing startup items held as dictionaries against the slotted StartupItem record type, both
+# for the memory each startup item takes up and for the cost of reading its properties
+#
+# Usage (from the development folder): python -m benchmarks.bench_model
+
+import timeit, tracemalloc
+
+import benchmarks.bench_common as bench_common
+
+bench_common.setup_environment()
+
+import dependencies.cs_enum as deps_enum
+import dependencies.cs_model as deps_model
+import dependencies.cs_document as deps_document
+
+ENUM_JSK = deps_enum.JsonSchemaKeys
+
+
+def measure_memory(build_function, json_data: dict):
+    """Measure the memory still allocated by the result of build_function, in bytes"""
+    tracemalloc.start()
+    startup_items = build_function(json_data)
+    used_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # Keep the startup items alive until the memory has been measured
+    del startup_items
+
+    return used_memory
+
+
+def build_dicts(json_data: dict):
+    """Build the startup items as dictionaries with their own ArgumentList, the same way json.loads does"""
+    return [
+        deps_document.copy_startup_item(startup_item)
+        for startup_item in json_data[ENUM_JSK.ITEMS.value]
+    ]
+
+
+def build_models(json_data: dict):
+    """Build the startup items as StartupItem objects"""
+    return deps_model.StartupData.from_json(json_data).items
+
+
+if __name__ == "__main__":
+    print(f"{'Items':>8} {'Dict (B/item)':>14} {'StartupItem (B/item)':>21}")
+
+    for total_items in [1000, 10000, 100000]:
+        # Strings are shared between both forms, so they are left out of the measurement by making them first
+        json_data = bench_common.make_startup_data(total_items)
+
+        dict_memory = measure_memory(build_dicts, json_data)
+        model_memory = measure_memory(build_models, json_data)
+
+        print(
+            f"{total_items:>8} {dict_memory / total_items:14.1f} {model_memory / total_items:21.1f}"
+        )
+
+    # Reading the Name and FilePath of a startup item in each of the ways the code can do it
+    startup_item = bench_common.make_startup_item(1)
+    model_item = deps_model.StartupItem.from_json(startup_item)
+    access_number = 1000000
+    access_tests = [
+        ("Dict with JsonSchemaKeys", "startup_item[ENUM_JSK.NAME.value], startup_item[ENUM_JSK.FILEPATH.value]"),
+        ("Dict with string keys", 'startup_item["Name"], startup_item["FilePath"]'),
+        ("StartupItem attributes", "model_item.name, model_item.file_path"),
+    ]
+
+    print(f"\n{'Access':>24} {'ns/access':>10}")
+
+    for access_name, access_code in access_tests:
+        access_time = min(
+            timeit.repeat(access_code, number=access_number, repeat=5, globals=globals())
+        )
+
+        print(f"{access_name:>24} {access_time / access_number / 2 * 1e9:10.1f}")
@@ -0,0 +1,80 @@
+# Benchmark for preflight_checker in the module cs_preflight, which checks the FilePath of every startup item
+#
+# A temporary folder tree is filled with program files, and the synthetic startup items point at them, with some
+# pointing at files that were never made. The check is timed cold, with PREFLIGHT_CACHE empty, and warm, with
+# PREFLIGHT_CACHE filled in by the cold run, for a single worker and for several.
+#
+# Usage (from the development folder):
+#   python -m benchmarks.bench_preflight
+
+import os, shutil, sys, tempfile, time
+
+import benchmarks.bench_common as bench_common
+
+bench_common.setup_environment()
+
+import dependencies.cs_preflight as deps_preflight
+
+# The number of startup items, the number of folders their programs are spread over, and how many startup items
+# point at a program that doesn't exist
+PREFLIGHT_ITEMS = 5000
+PREFLIGHT_FOLDERS = 250
+MISSING_EVERY = 100
+
+# The numbers of workers to time
+WORKER_COUNTS = [1, 16]
+
+
+def make_program_tree(tree_dir: str):
+    """Make the program files and return startup items pointing at them"""
+    startup_items = []
+
+    for item_number in range(1, PREFLIGHT_ITEMS + 1):
+        folder_path = os.path.join(tree_dir, f"folder{item_number % PREFLIGHT_FOLDERS}")
+        file_path = os.path.join(folder_path, f"program{item_number}.exe")
+
+        if not item_number % MISSING_EVERY == 0:
+            os.makedirs(folder_path, exist_ok=True)
+            with open(file_path, "w") as program_file:
+                program_file.write("")
+            os.chmod(file_path, 0o755)
+
+        startup_item = bench_common.make_startup_item(item_number)
+        startup_item["FilePath"] = file_path
+        startup_items.append(startup_item)
+
+    return startup_items
+
+
+if __name__ == "__main__":
+    tree_dir = tempfile.mkdtemp(prefix="cs_bench_preflight_")
+
+    try:
+        startup_items = make_program_tree(tree_dir)
+        expected_problems = PREFLIGHT_ITEMS // MISSING_EVERY
+        check_failed = False
+
+        print(f"{PREFLIGHT_ITEMS} startup items in {PREFLIGHT_FOLDERS} folders, {expected_problems} missing\n")
+        print(f"{'Workers':>7} {'Cold (ms)':>10} {'Warm (ms)':>10}")
+
+        for max_workers in WORKER_COUNTS:
+            run_times = []
+            deps_preflight.PREFLIGHT_CACHE.clear()
+
+            for run_name in ["cold", "warm"]:
+                start_time = time.perf_counter()
+                preflight_success, return_message, preflight_results = deps_preflight.preflight_checker(
+                    startup_items, max_workers
+                )
+                run_times.append((time.perf_counter() - start_time) * 1000)
+
+                if not len(preflight_results) == expected_problems:
+                    print(f"Expected {expected_problems} problems on the {run_name} run, got {len(preflight_results)}")
+                    check_failed = True
+
+            print(f"{max_workers:>7} {run_times[0]:>10.1f} {run_times[1]:>10.1f}")
+    finally:
+        shutil.rmtree(tree_dir, ignore_errors=True)
+
+    if check_failed:
+        sys.exit(1)
@@ -0,0 +1,191 @@
+# Benchmark suite for the JSON data layer, which times the main functions that read, write, validate, edit and
+# display startup data against synthetic startup files of different sizes
+#
+# The results are saved as a JSON file so runs can be compared. If a baseline results file exists, every
+# timing is checked against it and any that got slower by more than the threshold is flagged as a regression,
+# in which case the script exits with status 1.
+#
+# Usage (from the development folder):
+#   python -m benchmarks.bench_suite                     run every size and compare against the baseline
+#   python -m benchmarks.bench_suite --sizes 10 1000     only run some of the sizes
+#   python -m benchmarks.bench_suite --save-baseline     also store this run as the new baseline
+
+import argparse, json, os, platform, shutil, sys, tempfile, time
+
+import benchmarks.bench_common as bench_common
+
+bench_common.setup_environment()
+
+import dependencies.cs_cache as deps_cache
+import dependencies.cs_data_generate as deps_data_gen
+import dependencies.cs_dedup as deps_dedup
+import dependencies.cs_enum as deps_enum
+import dependencies.cs_helper as deps_helper
+import dependencies.cs_jsonfn as deps_json
+import dependencies.cs_pretty as deps_pretty
+import dependencies.cs_stream as deps_stream
+
+ENUM_ITV = deps_enum.ItemTypeVals
+
+# The sizes of the synthetic startup files, in startup items
+SUITE_SIZES = [10, 1000, 10000, 100000]
+
+# The folder the results files are saved in, and the results file every run is compared against
+RESULTS_DIR = os.path.join(bench_common.DEVELOPMENT_DIR, "benchmarks", "results")
+BASELINE_FILE = os.path.join(RESULTS_DIR, "baseline.json")
+
+# A timing is only flagged as a regression if it got slower by more than this share of the baseline, and by
+# more than this many seconds, so that timings of a few microseconds don't get flagged for normal noise
+REGRESSION_THRESHOLD = 0.25
+REGRESSION_FLOOR = 0.001
+
+
+def get_repeat(total_items: int):
+    """Get how many times to time each function, which goes down as the startup files get bigger"""
+    return max(1, min(5, 100000 // max(total_items, 1)))
+
+
+def run_size(total_items: int, json_path: list, json_filename: str):
+    """Time every function in the suite against a synthetic startup file with total_items startup items"""
+    json_file = deps_helper.parse_full_path(json_path, json_filename)
+    json_data = bench_common.make_startup_data(total_items)
+    repeat = get_repeat(total_items)
+    size_results = {}
+
+    new_item = bench_common.make_startup_item(total_items + 1)
+    changed_item = bench_common.make_startup_item((total_items + 1) // 2)
+    changed_item["Name"] = "Changed"
+    deleted_item = bench_common.make_startup_item(total_items)
+
+    def page_read(start_index: int):
+        """Read in one page of startup items straight from the startup file, the way the startup viewer does"""
+        file_reader = deps_stream.StartupFileReader(json_file)
+        file_reader.open()
+        try:
+            return file_reader.read_items(start_index, 10)
+        finally:
+            file_reader.close()
+
+    def stream_read(max_items: int):
+        """Read in startup items one at a time with json_stream_reader, stopping after max_items of them"""
+        stream_items = deps_json.json_stream_reader(json_path, json_filename)[2]
+        try:
+            for item_index, startup_item in zip(range(max_items), stream_items):
+                pass
+        finally:
+            stream_items.close()
+
+    def cold_call(func, *args):
+        """Call func with the document cache cleared first, so the startup file is read from disk"""
+        deps_cache.cache_invalidate(json_file)
+        return func(*args)
+
+    deps_json.json_writer(json_file, 0, json_data)
+
+    suite = [
+        ("json_reader (cold)", cold_call, deps_json.json_reader, json_path, json_filename),
+        ("json_reader (cached)", deps_json.json_reader, json_path, json_filename),
+        ("json_stream_reader (first item)", cold_call, stream_read, 1),
+        ("json_stream_reader (all items)", cold_call, stream_read, total_items),
+        ("json_writer", deps_json.json_writer, json_file, 0, json_data),
+        ("json_data_validator", deps_helper.json_data_validator, json_data),
+        ("generate_user_edited_data (A)", deps_data_gen.generate_user_edited_data, new_item, ENUM_ITV.ADD.value, json_data),
+        ("generate_user_edited_data (D)", deps_data_gen.generate_user_edited_data, deleted_item, ENUM_ITV.DELETE.value, json_data),
+        ("generate_user_edited_data (R)", deps_data_gen.generate_user_edited_data, changed_item, ENUM_ITV.REPLACE.value, json_data),
+        ("generate_user_edited_data (F)", deps_data_gen.generate_user_edited_data, json_data, ENUM_ITV.FULL.value),
+        ("prettify_json", deps_pretty.prettify_json, json_data),
+        ("find_duplicates", deps_dedup.find_duplicates, json_data["Items"]),
+        ("StartupFileReader (first page)", page_read, 0),
+        ("StartupFileReader (last page)", page_read, max(total_items - 10, 0)),
+        ("get_count_total_items (cold)", cold_call, deps_helper.get_count_total_items),
+        ("get_count_total_items (cached)", deps_helper.get_count_total_items),
+    ]
+
+    for bench_name, func, *args in suite:
+        size_results[bench_name] = bench_common.time_call(func, *args, repeat=repeat)
+
+    return size_results
+
+
+def compare_results(suite_results: dict, baseline_results: dict):
+    """Get every timing that got slower than the baseline by more than the threshold"""
+    regressions = []
+
+    for size_key, size_results in suite_results.items():
+        for bench_name, bench_time in size_results.items():
+            baseline_time = baseline_results.get(size_key, {}).get(bench_name)
+
+            if (
+                baseline_time is not None
+                and bench_time > baseline_time * (1 + REGRESSION_THRESHOLD)
+                and bench_time - baseline_time > REGRESSION_FLOOR
+            ):
+                regressions.append((size_key, bench_name, baseline_time, bench_time))
+
+    return regressions
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Benchmark suite for the JSON data layer")
+    arg_parser.add_argument("--sizes", type=int, nargs="+", default=SUITE_SIZES, help="the sizes of the synthetic startup files")
+    arg_parser.add_argument("--output", default="", help="the results file to save, which defaults to a new file in the results folder")
+    arg_parser.add_argument("--baseline", default=BASELINE_FILE, help="the baseline results file to compare against")
+    arg_parser.add_argument("--save-baseline", action="store_true", help="also save the results as the new baseline")
+    args = arg_parser.parse_args()
+
+    suite_results = {}
+
+    # Work in a temporary copy of the config folder, so the real startup file is never touched
+    with tempfile.TemporaryDirectory() as temp_dir:
+        shutil.copytree(os.path.join(bench_common.DEVELOPMENT_DIR, "config", "schema"), os.path.join(temp_dir, "config", "schema"))
+        os.chdir(temp_dir)
+
+        json_path = deps_helper.get_prod_path()
+        json_filename = deps_helper.get_startup_filename(default_json=False)
+
+        for total_items in args.sizes:
+            suite_results[str(total_items)] = run_size(total_items, json_path, json_filename)
+
+            print(f"\n{total_items} startup items")
+            for bench_name, bench_time in suite_results[str(total_items)].items():
+                print(f"  {bench_name:<34} {bench_time * 1000:12.3f} ms")
+
+        os.chdir(bench_common.DEVELOPMENT_DIR)
+
+    results_data = {
+        "CreatedAt": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "Python": platform.python_version(),
+        "Platform": platform.platform(),
+        "Results": suite_results,
+    }
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    results_file = args.output or os.path.join(RESULTS_DIR, time.strftime("bench_suite_%Y%m%d_%H%M%S.json"))
+
+    with open(results_file, "w") as file:
+        json.dump(results_data, file, indent=4)
+    print(f"\nSaved the results to {results_file}")
+
+    # Flag regressions against the baseline, if there is one
+    regressions = []
+    if os.path.isfile(args.baseline):
+        with open(args.baseline, "r") as file:
+            baseline_data = json.load(file)
+
+        regressions = compare_results(suite_results, baseline_data["Results"])
+
+        print(f"Compared against the baseline from {baseline_data['CreatedAt']}: {len(regressions)} regression(s)")
+        for size_key, bench_name, baseline_time, bench_time in regressions:
+            print(
+                f"  REGRESSION {size_key:>6} items {bench_name:<34}"
+                f" {baseline_time * 1000:10.3f} ms -> {bench_time * 1000:10.3f} ms"
+                f" ({bench_time / baseline_time:.2f}x)"
+            )
+    else:
+        print("There is no baseline to compare against. Run with --save-baseline to store one.")
+
+    if args.save_baseline:
+        shutil.copyfile(results_file, args.baseline)
+        print(f"Saved the results as the new baseline in {args.baseline}")
+
+    sys.exit(1 if regressions else 0)
@@ -0,0 +1,40 @@
+# Benchmark for json_data_validator comparing the per-call cost of validating against a schema that is
+# re-read and re-compiled on every call with the compiled validator kept in the validator registry
+#
+# Usage (from the development folder): python -m benchmarks.bench_validator
+
+import jsonschema
+
+import benchmarks.bench_common as bench_common
+
+bench_common.setup_environment()
+
+import dependencies.cs_helper as deps_helper
+import dependencies.cs_jsonfn as deps_json
+
+
+def uncached_validator(json_data: dict, single_item: bool = False):
+    """The previous implementation of json_data_validator, kept here to compare against"""
+    schema_file = "startup_item.schema.json" if single_item else "startup_data.schema.json"
+    schema_path = deps_helper.get_prod_path()
+    schema_path.extend(["schema"])
+
+    json_schema = deps_json.json_reader(schema_path, schema_file, True)[2]
+    jsonschema.validate(json_data, json_schema)
+
+
+if __name__ == "__main__":
+    print(f"{'Items':>8} {'Before (ms)':>12} {'After (ms)':>12} {'Speedup':>8}")
+
+    # Single startup item, which is what every add and edit validates
+    startup_item = bench_common.make_startup_item(1)
+    before = bench_common.time_call(uncached_validator, startup_item, True, repeat=50)
+    after = bench_common.time_call(deps_helper.json_data_validator, startup_item, True, repeat=50)
+    print(f"{'item':>8} {before * 1000:12.3f} {after * 1000:12.3f} {before / after:7.1f}x")
+
+    # Full startup data of different sizes, which is what every read validates
+    for total_items in [1, 10, 100, 1000]:
+        json_data = bench_common.make_startup_data(total_items)
+        before = bench_common.time_call(uncached_validator, json_data, repeat=10)
+        after = bench_common.time_call(deps_helper.json_data_validator, json_data, repeat=10)
+        print(f"{total_items:>8} {before * 1000:12.3f} {after * 1000:12.3f} {before / after:7.1f}x")
@@ -0,0 +1,112 @@
+# Benchmark for json_writer comparing the change detection done before every save: re-reading and parsing
+# the existing file versus comparing the digest of the content last read in or written
+#
+# It also checks that saving startup data that hasn't changed leaves the file alone, including a file that was
+# formatted by hand, both right after reading it in and with the document cache cleared.
+#
+# Usage (from the development folder): python -m benchmarks.bench_writer
+
+import json, os, sys, tempfile
+
+import benchmarks.bench_common as bench_common
+
+bench_common.setup_environment()
+
+import dependencies.cs_jsonfn as deps_json
+import dependencies.cs_cache as deps_cache
+
+
+def reread_has_changes(json_file: str, json_data: dict):
+    """The previous change detection of json_writer, kept here to compare against"""
+    with open(json_file, "r") as file:
+        existing_data = json.load(file)
+
+    return not json_data == existing_data
+
+
+def reread_save(json_file: str, json_data: dict):
+    """The previous json_writer save with file_state 2, kept here to compare against"""
+    if reread_has_changes(json_file, json_data):
+        with open(json_file, "w") as file:
+            json.dump(json_data, file)
+
+
+def alternating_save(save_function, json_file: str, json_data_list: list):
+    """Save each of the startup data in json_data_list in turn so that every save has changes to write"""
+    for json_data in json_data_list:
+        save_function(json_file, json_data)
+
+
+def unchanged_save_checker(temp_dir: str):
+    """Check that saving unchanged startup data doesn't rewrite an indented startup file and return any failures"""
+    failures = []
+    json_file = os.path.join(temp_dir, "indented_data.json")
+    json_data = bench_common.make_startup_data(100)
+
+    for clear_cache in [False, True]:
+        with open(json_file, "w") as file:
+            json.dump(json_data, file, indent=4)
+
+        # Give the file an old modification time so a rewrite can't land on the same one
+        os.utime(json_file, ns=(1_000_000_000, 1_000_000_000))
+        deps_cache.DOCUMENT_CACHE.clear()
+
+        # json_reader takes the path relative to the current working directory
+        read_success, return_message, read_data = deps_json.json_reader(
+            [os.path.relpath(temp_dir)], os.path.basename(json_file)
+        )
+
+        if clear_cache:
+            deps_cache.DOCUMENT_CACHE.clear()
+
+        deps_json.json_writer(json_file, 2, read_data)
+
+        if not os.stat(json_file).st_mtime_ns == 1_000_000_000:
+            failures.append(f"Unchanged save rewrote the file ({'cache cleared' if clear_cache else 'cached digest'})")
+
+    return failures
+
+
+if __name__ == "__main__":
+    print(
+        f"{'Items':>8} {'No-op re-read (ms)':>19} {'No-op digest (ms)':>18}"
+        f" {'Save re-read (ms)':>18} {'Save digest (ms)':>17}"
+    )
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        failures = unchanged_save_checker(temp_dir)
+        json_file = os.path.join(temp_dir, "startup_data.json")
+
+        for total_items in [1000, 10000, 100000]:
+            json_data = bench_common.make_startup_data(total_items)
+            changed_data = bench_common.make_startup_data(total_items)
+            changed_data["Items"][0]["Name"] = "Changed"
+
+            # Write the file through json_writer so its digest is known
+            deps_json.json_writer(json_file, 0, json_data)
+
+            # Saving data that hasn't changed, which only has to detect that there are no changes
+            no_op_before = bench_common.time_call(reread_save, json_file, json_data, repeat=5)
+            no_op_after = bench_common.time_call(deps_json.json_writer, json_file, 2, json_data, repeat=5)
+
+            # Saving data that has changed, with each call making two saves
+            save_before = bench_common.time_call(
+                alternating_save, reread_save, json_file, [changed_data, json_data], repeat=3
+            )
+            save_after = bench_common.time_call(
+                alternating_save,
+                lambda file, data: deps_json.json_writer(file, 2, data),
+                json_file,
+                [changed_data, json_data],
+                repeat=3,
+            )
+
+            print(
+                f"{total_items:>8} {no_op_before * 1000:19.2f} {no_op_after * 1000:18.2f}"
+                f" {save_before * 500:18.2f} {save_after * 500:17.2f}"
+            )
+
+    for failure in failures:
+        print(failure)
+
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,208 @@
+# Dependency to store the helper functions that write files to disk atomically and flush them to disk
+
+import os, stat, time, atexit
+
+import dependencies.cs_enum as deps_enum
+import dependencies.cs_helper as deps_helper
+
+ENUM_WDV = deps_enum.WriteDurabilityVals
+
+# Writes waiting for a group commit, which is a dictionary with the following keys:
+# Files: a set of the full paths of the files written since the last group commit
+# Since: the time, from time.monotonic, of the first write since the last group commit
+# Timer: the threading.Timer that does the group commit once the group commit window has passed, or None if no writes are waiting
+# Lock: the threading.Lock that keeps the timer and the main thread from changing the other keys at the same time, or None until the first write
+GROUP_COMMIT = {"Files": set(), "Since": 0.0, "Timer": None, "Lock": None}
+
+
+def get_new_file_mode():
+    """Helper function to get the permissions a new file gets when it is created with the function open
+
+    The permissions are 0o666 with the bits in the umask of the process removed. The umask can only be read by setting it, so it is set right back to what it was.
+
+    Returns:
+        int: The permissions for a new file
+    """
+    file_umask = os.umask(0)
+    os.umask(file_umask)
+
+    return 0o666 & ~file_umask
+
+
+def atomic_writer(json_file: str, json_text: str, durability: str, encoding: str = None):
+    """Function to write text to a file in the way specified by the durability level
+
+    For every durability level except DIRECT, the text is written to a temporary file in the same folder first, which is then renamed to the file name. Renaming a file within a folder replaces the old file in one step, so the file is never left half-written even if the program crashes part way through. See the Enum class WriteDurabilityVals for what each durability level does.
+
+    Any exception raised while writing is passed on to the calling function, which is expected to handle it.
+
+    Args:
+        json_file (str): The full absolute path of the file including filename and extension
+
+        json_text (str): The text to write to the file
+
+        durability (str): One of the values of the Enum class WriteDurabilityVals
+
+        encoding (str, optional): The encoding to write the text in. Defaults to None, in which case the default encoding of the system is used.
+    """
+    atomic_stream_writer(json_file, (json_text,), durability, encoding)
+
+
+def atomic_stream_writer(json_file: str, text_chunks, durability: str, encoding: str = None):
+    """Function to write text to a file piece by piece in the way specified by the durability level
+
+    This works the same way as the function atomic_writer, except that the text is passed in as any number of pieces, which are written one at a time. This means text that is too big to hold in memory all at once can be written from a generator.
+
+    Any exception raised while writing, including one raised by the generator, is passed on to the calling function, which is expected to handle it. Unless the durability level is DIRECT, the file is left as it was in that case.
+
+    Args:
+        json_file (str): The full absolute path of the file including filename and extension
+
+        text_chunks: An iterable, such as a list or generator, of the strings to write to the file in order
+
+        durability (str): One of the values of the Enum class WriteDurabilityVals
+
+        encoding (str, optional): The encoding to write the text in. Defaults to None, in which case the default encoding of the system is used.
+    """
+    if durability == ENUM_WDV.DIRECT.value:
+        with open(json_file, "w", encoding=encoding) as file:
+            file.writelines(text_chunks)
+    else:
+        # tempfile also loads shutil and random, so it's only imported the first time a file is written
+        import tempfile
+
+        folder_path, file_name = os.path.split(json_file)
+
+        # Create the temporary file in the same folder so the rename never has to copy it
+        temp_handle, temp_file = tempfile.mkstemp(
+            prefix="." + file_name + ".", suffix=".tmp", dir=folder_path
+        )
+
+        try:
+            with os.fdopen(temp_handle, "w", encoding=encoding) as file:
+                file.writelines(text_chunks)
+                file.flush()
+
+                if durability == ENUM_WDV.DURABLE.value:
+                    os.fsync(file.fileno())
+
+            # Keep the permissions of the file being replaced, since mkstemp creates the temporary file so only the owner can read it
+            if os.path.isfile(json_file):
+                os.chmod(temp_file, stat.S_IMODE(os.stat(json_file).st_mode))
+            else:
+                os.chmod(temp_file, get_new_file_mode())
+
+            os.replace(temp_file, json_file)
+        except BaseException:
+            # Clean up the temporary file before passing on the exception
+            if os.path.isfile(temp_file):
+                os.remove(temp_file)
+            raise
+
+        if durability == ENUM_WDV.DURABLE.value:
+            folder_syncer(folder_path)
+        elif durability == ENUM_WDV.GROUP.value:
+            group_commit_adder(json_file)
+
+
+def append_syncer(file, durability: str):
+    """Helper function to flush text just appended to an open file in the way specified by the durability level
+
+    Appending to a file can't be done atomically, so this only decides when the appended text is flushed to disk.
+
+    Args:
+        file (io.TextIOWrapper): The file the text was appended to, which must still be open
+
+        durability (str): One of the values of the Enum class WriteDurabilityVals
+    """
+    file.flush()
+
+    if durability == ENUM_WDV.DURABLE.value:
+        os.fsync(file.fileno())
+    elif durability == ENUM_WDV.GROUP.value:
+        group_commit_adder(file.name)
+
+
+def folder_syncer(folder_path: str):
+    """Helper function to flush a folder to disk so that a file renamed within it survives a crash or power loss
+
+    Windows doesn't allow a folder to be opened this way and doesn't need it, so nothing is done on Windows.
+
+    Args:
+        folder_path (str): The full absolute path of the folder
+    """
+    if not os.name == "nt":
+        folder_handle = os.open(folder_path, os.O_RDONLY)
+        try:
+            os.fsync(folder_handle)
+        finally:
+            os.close(folder_handle)
+
+
+def group_commit_adder(json_file: str):
+    """Helper function to add a written file to the next group commit
+
+    The first write waiting for a group commit starts a timer that does the group commit once the group commit window has passed, even if nothing else is written. If a later write comes in after the group commit window has already passed, the group commit is done right away instead. The timer runs in a daemon thread so it never keeps the program from exiting, which is fine since the group commit is also done when the program exits.
+
+    Args:
+        json_file (str): The full absolute path of the file that was written
+    """
+    # threading is only needed once a write is waiting for a group commit
+    import threading
+
+    if GROUP_COMMIT["Lock"] is None:
+        GROUP_COMMIT["Lock"] = threading.Lock()
+
+    commit_window = deps_helper.get_group_commit_window()
+
+    with GROUP_COMMIT["Lock"]:
+        if len(GROUP_COMMIT["Files"]) == 0:
+            GROUP_COMMIT["Since"] = time.monotonic()
+            GROUP_COMMIT["Timer"] = threading.Timer(commit_window, group_committer)
+            GROUP_COMMIT["Timer"].daemon = True
+            GROUP_COMMIT["Timer"].start()
+
+        GROUP_COMMIT["Files"].add(json_file)
+
+        commit_now = time.monotonic() - GROUP_COMMIT["Since"] >= commit_window
+
+    if commit_now:
+        group_committer()
+
+
+def group_committer():
+    """Function to flush all the files waiting for a group commit, and the folders they are in, to disk
+
+    This is run by the timer started in the function group_commit_adder, and is registered to run when the program exits, so no write is left waiting.
+    """
+    # Nothing has been written yet if there's no lock
+    if GROUP_COMMIT["Lock"] is not None:
+        with GROUP_COMMIT["Lock"]:
+            group_flusher()
+
+
+def group_flusher():
+    """Helper function to flush all the files waiting for a group commit to disk, which must only be called while holding the lock of the group commit"""
+    folder_paths = set()
+
+    # A group commit done by a later write makes the timer unnecessary
+    if GROUP_COMMIT["Timer"] is not None:
+        GROUP_COMMIT["Timer"].cancel()
+        GROUP_COMMIT["Timer"] = None
+
+    for json_file in GROUP_COMMIT["Files"]:
+        try:
+            with open(json_file, "rb+") as file:
+                os.fsync(file.fileno())
+            folder_paths.add(os.path.dirname(json_file))
+        except FileNotFoundError:
+            # The file was deleted after it was written, such as a journal that has been folded
+            pass
+
+    for folder_path in folder_paths:
+        folder_syncer(folder_path)
+
+    GROUP_COMMIT["Files"].clear()
+
+
+atexit.register(group_committer)
@@ -0,0 +1,406 @@
+# Dependency to store the helper functions that apply a whole file of startup item changes at once without any menus, so scripts can change the startup data without going through the interactive tool
+
+import copy, json, os
+
+import dependencies.cs_helper as deps_helper
+import dependencies.cs_jsonfn as deps_json
+import dependencies.cs_pretty as deps_pretty
+import dependencies.cs_enum as deps_enum
+import dependencies.cs_schedule as deps_schedule
+
+ENUM_JSK = deps_enum.JsonSchemaKeys
+ENUM_BAV = deps_enum.BatchActionVals
+
+# An operations file is a JSON array of operations, which are JSON objects with the following keys:
+# Action: one of the values of the Enum class BatchActionVals
+# ItemNumber: for delete, replace and set, the ItemNumber of the startup item to change, as it was before any of the operations were applied
+# Name: for delete, replace and set, the Name of the startup item to change instead of the ItemNumber, which has to match exactly one startup item at that point
+# Item: for add and replace, the new startup item, where the ItemNumber can be left out since it's worked out from the position of the startup item
+# Key: for set, the key of the startup item to change, which is one of BATCH_SET_KEYS
+# Value: for set, the new value of the key, or null to remove the Priority, After or SeparateLaunch key
+#
+# For example:
+# [
+#     {"Action": "add", "Item": {"Name": "Notepad", "FilePath": "notepad", "Description": "", "Browser": false, "ArgumentCount": 0, "ArgumentList": []}},
+#     {"Action": "delete", "ItemNumber": 3},
+#     {"Action": "set", "Name": "Google", "Key": "ArgumentList", "Value": ["--new-window", "https://www.google.com/"]}
+# ]
+
+# The keys of a startup item that can be changed with the set action. ItemNumber and ArgumentCount can't be set since they're worked out from the position of the startup item and its ArgumentList.
+BATCH_SET_KEYS = [
+    ENUM_JSK.NAME.value,
+    ENUM_JSK.FILEPATH.value,
+    ENUM_JSK.DESCRIPTION.value,
+    ENUM_JSK.BROWSER.value,
+    ENUM_JSK.ARGUMENTLIST.value,
+    ENUM_JSK.PRIORITY.value,
+    ENUM_JSK.AFTER.value,
+    ENUM_JSK.SEPARATELAUNCH.value,
+]
+
+
+def operations_reader(operations_file: str):
+    """Function to read in the operations from an operations file
+
+    Args:
+        operations_file (str): The full path of the operations file including filename and extension
+
+    Returns:
+        bool: True if the operations were read in, False if not
+
+        string: An error message to display if the operations couldn't be read in, or blank otherwise
+
+        list: The operations, or an empty list if they couldn't be read in
+    """
+    # Initialize function variables
+    read_success = False
+    return_message = ""
+    operations = []
+
+    try:
+        with open(operations_file, "r") as file:
+            operations = json.load(file)
+
+        if not isinstance(operations, list) or not all(isinstance(operation, dict) for operation in operations):
+            operations = []
+            return_message = "The operations file has to contain a JSON array of operation objects"
+        else:
+            read_success = True
+    except Exception as error:
+        return_message = (
+            "Unable to read the operations file" + deps_pretty.prettify_io_error(error)
+        )
+
+    return (read_success, return_message, operations)
+
+
+class BatchItems:
+    """Class to hold the startup items while the operations are applied
+
+    Deleted startup items are only marked as deleted, so every startup item keeps its position until all the operations have been applied. This is what lets an ItemNumber in an operation always refer to the startup data as it was before the batch, and makes each operation take the same time no matter how many startup items there are. The positions of the startup items with each Name are also kept up to date, so finding a startup item by its Name doesn't have to look through all of them.
+
+    Attributes:
+        items_list (list): The startup items in order, with None in place of each deleted startup item
+
+        orig_total (int): The number of startup items before any of the operations were applied
+
+        name_positions (dict): The positions in items_list of the startup items with each Name
+    """
+
+    __slots__ = ("items_list", "orig_total", "name_positions")
+
+    def __init__(self, items_list: list):
+        self.items_list = list(items_list)
+        self.orig_total = len(items_list)
+        self.name_positions = {}
+
+        for item_position, startup_item in enumerate(self.items_list):
+            self.name_positions.setdefault(startup_item[ENUM_JSK.NAME.value], []).append(item_position)
+
+    def find_position(self, operation: dict):
+        """Function to find the startup item an operation applies to
+
+        Args:
+            operation (dict): The operation, which has either an ItemNumber or a Name key
+
+        Returns:
+            int: The position of the startup item in items_list, or -1 if it couldn't be found
+
+            string: An error message if the startup item couldn't be found, or blank otherwise
+        """
+        item_position = -1
+        return_message = ""
+
+        if ENUM_JSK.ITEMNUMBER.value in operation:
+            item_number = operation[ENUM_JSK.ITEMNUMBER.value]
+
+            if not isinstance(item_number, int) or not 1 <= item_number <= self.orig_total:
+                return_message = f"There is no startup item with ItemNumber {item_number!r}"
+            elif self.items_list[item_number - 1] is None:
+                return_message = f"The startup item with ItemNumber {item_number} was already deleted"
+            else:
+                item_position = item_number - 1
+        elif ENUM_JSK.NAME.value in operation:
+            item_name = operation[ENUM_JSK.NAME.value]
+            name_matches = self.name_positions.get(item_name, []) if isinstance(item_name, str) else []
+
+            if len(name_matches) == 0:
+                return_message = f"There is no startup item with Name {item_name!r}"
+            elif len(name_matches) > 1:
+                return_message = f"There is more than one startup item with Name {item_name!r}, so use its ItemNumber instead"
+            else:
+                item_position = name_matches[0]
+        else:
+            return_message = "The operation needs an ItemNumber or a Name to find the startup item"
+
+        return (item_position, return_message)
+
+    def put_item(self, item_position: int, startup_item):
+        """Function to put a startup item at a position, replacing or deleting what was there
+
+        Args:
+            item_position (int): The position in items_list, which is the length of items_list to add the startup item to the end
+
+            startup_item (dict): The startup item, or None to delete the startup item at the position
+        """
+        if item_position == len(self.items_list):
+            self.items_list.append(None)
+
+        old_item = self.items_list[item_position]
+        if old_item is not None:
+            self.name_positions[old_item[ENUM_JSK.NAME.value]].remove(item_position)
+
+        self.items_list[item_position] = startup_item
+        if startup_item is not None:
+            self.name_positions.setdefault(startup_item[ENUM_JSK.NAME.value], []).append(item_position)
+
+    def get_items(self):
+        """Function to get the startup items once all the operations have been applied
+
+        Returns:
+            list: The startup items that weren't deleted, with their ItemNumber set from their new position
+        """
+        items_list = [startup_item for startup_item in self.items_list if startup_item is not None]
+
+        # Startup items that moved are copied before their ItemNumber is changed, since they're still part of the original startup data
+        for item_index, startup_item in enumerate(items_list):
+            if not startup_item[ENUM_JSK.ITEMNUMBER.value] == item_index + 1:
+                items_list[item_index] = dict(startup_item)
+                items_list[item_index][ENUM_JSK.ITEMNUMBER.value] = item_index + 1
+
+        return items_list
+
+
+def batch_item_validator(startup_item: dict):
+    """Helper function to check a startup item from an operation against startup_item.schema.json
+
+    Args:
+        startup_item (dict): The startup item, which is changed directly to give it a placeholder ItemNumber if it doesn't have one
+
+    Returns:
+        bool: True if the startup item is valid, False if not
+    """
+    # The ItemNumber is set once all the operations have been applied, so any number will do for now
+    startup_item.setdefault(ENUM_JSK.ITEMNUMBER.value, 1)
+
+    return deps_helper.json_data_validator(startup_item, True)
+
+
+def batch_operation_applier(batch_items: BatchItems, operation: dict):
+    """Function to apply a single operation to the startup items
+
+    Args:
+        batch_items (BatchItems): The startup items, which are changed directly
+
+        operation (dict): The operation. See the comment at the top of this module for the keys.
+
+    Returns:
+        bool: True if the operation was applied, False if not
+
+        string: An error message if the operation couldn't be applied, or blank otherwise
+    """
+    # Initialize function variables
+    apply_success = False
+    return_message = ""
+    item_position = -1
+    item_action = operation.get("Action")
+
+    # Every action except add needs to find the startup item to change first
+    if item_action in [ENUM_BAV.DELETE.value, ENUM_BAV.REPLACE.value, ENUM_BAV.SET.value]:
+        item_position, return_message = batch_items.find_position(operation)
+        if item_position < 0:
+            item_action = None
+
+    match item_action:
+        case ENUM_BAV.ADD.value | ENUM_BAV.REPLACE.value:
+            if not isinstance(operation.get("Item"), dict):
+                return_message = "The operation needs an Item with the new startup item"
+            else:
+                startup_item = copy.deepcopy(operation["Item"])
+
+                if not batch_item_validator(startup_item):
+                    return_message = "The Item is not a valid startup item"
+                else:
+                    if item_action == ENUM_BAV.ADD.value:
+                        item_position = len(batch_items.items_list)
+
+                    batch_items.put_item(item_position, startup_item)
+                    apply_success = True
+        case ENUM_BAV.DELETE.value:
+            batch_items.put_item(item_position, None)
+            apply_success = True
+        case ENUM_BAV.SET.value:
+            item_key = operation.get("Key")
+            startup_item = copy.deepcopy(batch_items.items_list[item_position])
+
+            if item_key not in BATCH_SET_KEYS:
+                return_message = f"The Key has to be one of: {', '.join(BATCH_SET_KEYS)}"
+            elif "Value" not in operation:
+                return_message = "The operation needs a Value to set the Key to"
+            else:
+                if operation["Value"] is None and item_key in [
+                    ENUM_JSK.PRIORITY.value,
+                    ENUM_JSK.AFTER.value,
+                    ENUM_JSK.SEPARATELAUNCH.value,
+                ]:
+                    startup_item.pop(item_key, None)
+                else:
+                    startup_item[item_key] = copy.deepcopy(operation["Value"])
+
+                # The ArgumentCount always has to match the ArgumentList
+                if item_key == ENUM_JSK.ARGUMENTLIST.value and isinstance(operation["Value"], list):
+                    startup_item[ENUM_JSK.ARGUMENTCOUNT.value] = len(operation["Value"])
+
+                if not batch_item_validator(startup_item):
+                    return_message = f"{operation['Value']!r} is not a valid value for {item_key}"
+                else:
+                    batch_items.put_item(item_position, startup_item)
+                    apply_success = True
+        case None:
+            pass
+        case _:
+            return_message = f"The Action has to be one of: {', '.join(action.value for action in ENUM_BAV)}"
+
+    return (apply_success, return_message)
+
+
+def batch_applier(json_data: dict, operations: list):
+    """Function to apply all the operations to the startup data in one pass
+
+    The startup data read in has already been validated, and each startup item an operation adds or changes is checked against startup_item.schema.json as it's applied. Since every ItemNumber and the TotalItems are then set from the final positions of the startup items, the result is valid without having to check the full startup data against the schema again. Only the After keys have to be checked for loops, since an operation can change any startup item.
+
+    Either all of the operations are applied or none of them are.
+
+    Args:
+        json_data (dict): The full startup data, which isn't changed
+
+        operations (list): The operations to apply in order
+
+    Returns:
+        bool: True if all of the operations were applied, False if not
+
+        string: An error message saying which operation couldn't be applied, or a message with how many were applied
+
+        dict: The new startup data, or an empty dictionary if the operations couldn't be applied
+    """
+    # Initialize function variables
+    apply_success = True
+    return_message = ""
+    new_json_data = {}
+    batch_items = BatchItems(json_data[ENUM_JSK.ITEMS.value])
+
+    for operation_index, operation in enumerate(operations, start=1):
+        apply_success, return_message = batch_operation_applier(batch_items, operation)
+
+        if not apply_success:
+            return_message = f"Operation {operation_index} ({operation.get('Action')!r}) could not be applied: {return_message}"
+            break
+
+    if apply_success:
+        items_list = batch_items.get_items()
+
+        # Any other keys of the startup data, such as the LaunchPolicy, are kept
+        new_json_data = dict(json_data)
+        new_json_data[ENUM_JSK.TOTALITEMS.value] = len(items_list)
+        new_json_data[ENUM_JSK.ITEMS.value] = items_list
+
+        apply_success, return_message = deps_schedule.launch_cycle_validator(items_list)
+
+        if apply_success:
+            return_message = f"Applied {len(operations)} operation(s)"
+        else:
+            new_json_data = {}
+
+    return (apply_success, return_message, new_json_data)
+
+
+def batch_runner(json_path: list, json_filename: str, operations_file: str):
+    """Function to apply all the operations in an operations file to the startup file
+
+    The startup file is read in once, all the operations are applied, and the new startup data is written once with the function json_writer in the module cs_jsonfn. If any operation can't be applied, the startup file isn't changed at all.
+
+    Args:
+        json_path (list): A list containing the relative or absolute path to the JSON file with each list item representing one subfolder from Current Working Directory (CWD)
+
+        json_filename (str): The filename of the JSON file
+
+        operations_file (str): The full path of the operations file including filename and extension
+
+    Returns:
+        bool: True if all the operations were applied and saved, False if not
+
+        string: An error message to display if something went wrong, or a message with what was done
+    """
+    status_state, status_message, operations = operations_reader(operations_file)
+
+    if status_state:
+        status_state, status_message, json_data = deps_json.json_reader(json_path, json_filename)
+
+    if status_state:
+        status_state, status_message, new_json_data = batch_applier(json_data, operations)
+
+    if status_state:
+        if new_json_data == json_data:
+            status_message += ", which made no changes to the startup data"
+        else:
+            apply_message = status_message
+            status_state, status_message = deps_json.json_writer(
+                deps_helper.parse_full_path(json_path, json_filename), 2, new_json_data
+            )
+
+            if status_state:
+                status_message = (
+                    f"{apply_message} and saved {new_json_data[ENUM_JSK.TOTALITEMS.value]} startup items"
+                )
+
+    if not status_state:
+        deps_pretty.prettify_custom_error(status_message, "batch_runner")
+
+    return (status_state, status_message)
+
+
+def batch_cli(cli_args: list, start_cwd: str, json_path: list, json_filename: str):
+    """Function to handle the command-line arguments that CompStart.py was started with
+
+    Usage: CompStart.py --batch OPERATIONS_FILE
+
+    Args:
+        cli_args (list): The command-line arguments, not including the name of the script
+
+        start_cwd (str): The current working directory when CompStart.py was started, which relative paths given on the command line start from
+
+        json_path (list): A list containing the relative or absolute path to the JSON file with each list item representing one subfolder from Current Working Directory (CWD)
+
+        json_filename (str): The filename of the JSON file
+
+    Returns:
+        int: The exit status for the tool, which is 0 if everything worked, 1 if not, or 2 if the arguments weren't valid
+    """
+    # argparse is only needed when the tool is started with arguments, so it's imported here
+    import argparse
+
+    arg_parser = argparse.ArgumentParser(
+        prog="CompStart.py",
+        description="Apply a file of startup item changes to the startup file without any menus",
+    )
+    arg_parser.add_argument(
+        "--batch",
+        metavar="OPERATIONS_FILE",
+        required=True,
+        help="a JSON file with an array of add, delete, replace and set operations to apply",
+    )
+
+    try:
+        args = arg_parser.parse_args(cli_args)
+    except SystemExit as error:
+        return error.code
+
+    status_state, status_message = batch_runner(
+        json_path, json_filename, os.path.join(start_cwd, args.batch)
+    )
+
+    # Any error was already printed out by the function batch_runner
+    if status_state:
+        print(status_message)
+
+    return 0 if status_state else 1
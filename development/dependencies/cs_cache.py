@@ -0,0 +1,292 @@
+# Dependency to store the in-process document cache that is shared by the functions reading and saving startup data
+
+import json, os
+
+import dependencies.cs_journal as deps_journal
+import dependencies.cs_document as deps_document
+
+# Cache of startup data documents with the normalized full path to the JSON file as the key and a dictionary as the value. The dictionary has the following keys:
+# Stamp: the tuple from get_file_stamp of the file, and any journal file, when the data was cached
+# Data: the startup data read in from, or written to, the file, which has already been validated
+# Document: the same startup data as a StartupDocument, which is created from Data, or Data from it, when first needed
+# Digest: the digest, from get_data_digest, of the startup data last read in from, or written to, the file, with any journal replayed over it
+# Dirty: whether the startup data has been edited in memory without being saved to the file yet
+DOCUMENT_CACHE = {}
+
+
+def get_cache_key(json_file: str):
+    """Helper function to normalize the full path of a JSON file for use as a key in the document cache
+
+    Args:
+        json_file (str): The full absolute path of the JSON file including filename and extension
+
+    Returns:
+        str: The normalized full path of the JSON file
+    """
+    return os.path.normcase(os.path.abspath(json_file))
+
+
+def get_file_stamp(json_file: str):
+    """Helper function to get the values used to tell if a JSON file has changed on disk
+
+    The journal file of a startup file is part of its content in journaled storage mode, so the modification time and size of the journal file are added on if there is one.
+
+    Args:
+        json_file (str): The full absolute path of the JSON file including filename and extension
+
+    Returns:
+        tuple: The (modification time, size, inode) of the file, or the (modification time, size, inode, journal modification time, journal size) if the file has a journal file. None if the file can't be found.
+    """
+    try:
+        file_stats = os.stat(json_file)
+        file_stamp = (file_stats.st_mtime_ns, file_stats.st_size, file_stats.st_ino)
+    except OSError:
+        file_stamp = None
+
+    if file_stamp is not None:
+        try:
+            journal_stats = os.stat(deps_journal.get_journal_file(json_file))
+            file_stamp += (journal_stats.st_mtime_ns, journal_stats.st_size)
+        except OSError:
+            pass
+
+    return file_stamp
+
+
+def get_data_digest(json_data: dict):
+    """Helper function to get the digest of JSON data
+
+    The JSON data is serialized in one fixed way, with its keys sorted and no spaces, before it's hashed. This means the digest only depends on the data itself and not on how the file it was read in from was formatted, so the digest of startup data read in from a file that was formatted by hand can be compared directly against the digest of the startup data about to be written to it.
+
+    Args:
+        json_data (dict): The JSON data to get the digest of
+
+    Returns:
+        str: The SHA-256 digest of the serialized JSON data as a hexadecimal string
+    """
+    return get_text_digest(json.dumps(json_data, sort_keys=True, separators=(",", ":")))
+
+
+def get_text_digest(json_text: str):
+    """Helper function to get the digest of text, such as the content of a file
+
+    Args:
+        json_text (str): The text to get the digest of
+
+    Returns:
+        str: The SHA-256 digest of the text as a hexadecimal string
+    """
+    # hashlib loads the OpenSSL library, so it's only imported the first time a digest is needed
+    import hashlib
+
+    return hashlib.sha256(json_text.encode("utf-8")).hexdigest()
+
+
+def digest_lookup(json_file: str):
+    """Helper function to get the digest of the startup data last read in from, or written to, a JSON file
+
+    The digest is only returned if the file hasn't changed on disk since then.
+
+    Args:
+        json_file (str): The full absolute path of the JSON file including filename and extension
+
+    Returns:
+        str: The digest of the file content, or a blank string if it isn't known
+    """
+    # Initialize function variables
+    data_digest = ""
+
+    cache_entry = DOCUMENT_CACHE.get(get_cache_key(json_file))
+
+    if cache_entry is not None and "Digest" in cache_entry:
+        file_stamp = get_file_stamp(json_file)
+
+        if file_stamp is not None and file_stamp == cache_entry["Stamp"]:
+            data_digest = cache_entry["Digest"]
+        else:
+            cache_invalidate(json_file)
+
+    return data_digest
+
+
+def digest_store(json_file: str, data_digest: str):
+    """Helper function to store the digest of the startup data just written to a JSON file
+
+    Args:
+        json_file (str): The full absolute path of the JSON file including filename and extension
+
+        data_digest (str): The digest of the startup data written, as returned by get_data_digest
+    """
+    file_stamp = get_file_stamp(json_file)
+
+    if file_stamp is not None:
+        cache_entry = DOCUMENT_CACHE.setdefault(get_cache_key(json_file), {"Dirty": False})
+
+        # Any cached data is from before the write
+        if not cache_entry.get("Stamp") == file_stamp:
+            cache_entry.pop("Data", None)
+            cache_entry.pop("Document", None)
+
+        cache_entry["Stamp"] = file_stamp
+        cache_entry["Digest"] = data_digest
+
+
+def cache_lookup(json_file: str):
+    """Helper function to get the cached startup data for a JSON file
+
+    The cached startup data is only returned if the file hasn't changed on disk since it was cached. Note that the data returned is the cached dictionary itself and not a copy of it, so the calling function must not modify it.
+
+    Args:
+        json_file (str): The full absolute path of the JSON file including filename and extension
+
+    Returns:
+        bool: True if there is cached startup data for the file, False if not
+
+        dict: The cached startup data if there is any or an empty dictionary if not
+    """
+    # Initialize function variables
+    cache_hit = False
+    json_data = {}
+
+    cache_entry = get_valid_entry(json_file)
+
+    if cache_entry is not None:
+        cache_hit = True
+
+        if "Data" not in cache_entry:
+            cache_entry["Data"] = cache_entry["Document"].to_json()
+
+        json_data = cache_entry["Data"]
+
+    return (cache_hit, json_data)
+
+
+def document_lookup(json_file: str):
+    """Helper function to get the cached startup data for a JSON file as a StartupDocument
+
+    This works the same as the function cache_lookup, except that a StartupDocument is returned. Since a StartupDocument can't be modified, the calling function can use it freely.
+
+    Args:
+        json_file (str): The full absolute path of the JSON file including filename and extension
+
+    Returns:
+        bool: True if there is cached startup data for the file, False if not
+
+        StartupDocument: The cached startup data if there is any or None if not
+    """
+    # Initialize function variables
+    cache_hit = False
+    json_document = None
+
+    cache_entry = get_valid_entry(json_file)
+
+    if cache_entry is not None:
+        cache_hit = True
+
+        if "Document" not in cache_entry:
+            cache_entry["Document"] = deps_document.StartupDocument.from_json(cache_entry["Data"])
+
+        json_document = cache_entry["Document"]
+
+    return (cache_hit, json_document)
+
+
+def get_valid_entry(json_file: str):
+    """Helper function to get the document cache entry for a JSON file if it has startup data that is still current
+
+    Args:
+        json_file (str): The full absolute path of the JSON file including filename and extension
+
+    Returns:
+        dict: The cache entry, or None if there is no cached startup data or the file has changed on disk since it was cached
+    """
+    valid_entry = None
+
+    cache_entry = DOCUMENT_CACHE.get(get_cache_key(json_file))
+
+    if cache_entry is not None and ("Data" in cache_entry or "Document" in cache_entry):
+        file_stamp = get_file_stamp(json_file)
+
+        if file_stamp is not None and file_stamp == cache_entry["Stamp"]:
+            valid_entry = cache_entry
+        else:
+            # The file has changed on disk since it was cached, so the cached data is outdated
+            cache_invalidate(json_file)
+
+    return valid_entry
+
+
+def cache_store(json_file: str, json_data, data_digest: str = ""):
+    """Helper function to store validated startup data in the cache for a JSON file
+
+    This function should be called right after the startup data has been read in from, or written to, the file. The data is stored as it is, so the calling function must not modify it afterwards.
+
+    Args:
+        json_file (str): The full absolute path of the JSON file including filename and extension
+
+        json_data (dict): The startup data, which must already be validated. This can also be a StartupDocument.
+
+        data_digest (str, optional): The digest of the startup data, as returned by get_data_digest. Defaults to "", in which case the digest stored when the file was last written is kept.
+    """
+    file_stamp = get_file_stamp(json_file)
+
+    if file_stamp is not None:
+        cache_entry = DOCUMENT_CACHE.setdefault(get_cache_key(json_file), {"Dirty": False})
+
+        if data_digest:
+            cache_entry["Digest"] = data_digest
+        elif not cache_entry.get("Stamp") == file_stamp:
+            # Any stored digest is from before the file last changed
+            cache_entry.pop("Digest", None)
+
+        cache_entry["Stamp"] = file_stamp
+        cache_entry.pop("Data", None)
+        cache_entry.pop("Document", None)
+
+        if isinstance(json_data, deps_document.StartupDocument):
+            cache_entry["Document"] = json_data
+        else:
+            cache_entry["Data"] = json_data
+
+
+def cache_invalidate(json_file: str):
+    """Helper function to remove the cached startup data and digest for a JSON file
+
+    The dirty state of the file is kept, since the edits made in memory still haven't been saved.
+
+    Args:
+        json_file (str): The full absolute path of the JSON file including filename and extension
+    """
+    cache_entry = DOCUMENT_CACHE.get(get_cache_key(json_file))
+
+    if cache_entry is not None:
+        cache_entry.pop("Stamp", None)
+        cache_entry.pop("Data", None)
+        cache_entry.pop("Document", None)
+        cache_entry.pop("Digest", None)
+
+
+def set_dirty(json_file: str, is_dirty: bool):
+    """Helper function to track whether the startup data for a JSON file has been edited without being saved
+
+    Args:
+        json_file (str): The full absolute path of the JSON file including filename and extension
+
+        is_dirty (bool): True if there are unsaved edits, False once they have been saved or discarded
+    """
+    cache_entry = DOCUMENT_CACHE.setdefault(get_cache_key(json_file), {"Dirty": False})
+    cache_entry["Dirty"] = is_dirty
+
+
+def is_dirty(json_file: str):
+    """Helper function to check whether the startup data for a JSON file has unsaved edits
+
+    Args:
+        json_file (str): The full absolute path of the JSON file including filename and extension
+
+    Returns:
+        bool: True if there are unsaved edits, False otherwise
+    """
+    cache_entry = DOCUMENT_CACHE.get(get_cache_key(json_file), {})
+
+    return cache_entry.get("Dirty", False)
@@ -1,7 +1,6 @@
 # Dependency to store the helper functions that display a menu and require the user to make a choice
 
 import sys
-from tkinter import filedialog as file_chooser
 
 
 def user_menu_chooser(menu_choices: list, allow_quit: bool = True, include_save: bool = False):
@@ -109,6 +108,9 @@ def existing_file_chooser(item_name: str):
     Returns:
         str: The full path of the file that was selected
     """
+    # tkinter takes a while to load, so it's only imported the first time a file dialog box is needed
+    from tkinter import filedialog as file_chooser
+
     # Using tkinter's askopenfilename function to get the file and path using a standard file dialog
     # window
     file_name = file_chooser.askopenfilename(
@@ -0,0 +1,276 @@
+# Dependency to store the helper functions that combine startup items launching the same program into a single launch, so a program that can open many things at once is only started once
+
+import ntpath, re
+from dataclasses import dataclass
+
+import dependencies.cs_enum as deps_enum
+import dependencies.cs_dedup as deps_dedup
+import dependencies.cs_schedule as deps_schedule
+
+ENUM_JSK = deps_enum.JsonSchemaKeys
+
+# An argument that starts with a URL scheme, such as https://, or with www. is a website to open
+URL_ARGUMENT = re.compile(r"^(?:[a-z][a-z0-9+.-]*://|www\.)", re.IGNORECASE)
+
+# An argument that doesn't start with - or / is a file to open, since those start the options of most Windows programs
+FILE_ARGUMENT = re.compile(r"^[^-/]")
+
+# The longest command line Windows can start a program with, in characters, which is also well within the limits of other systems
+MAX_COMMAND_LINE = 32767
+
+
+@dataclass(slots=True, frozen=True)
+class CoalescePolicy:
+    """Class for how the startup items launching one program can be combined into a single launch
+
+    Each argument of a startup item is either a target, which is something for the program to open, or an option. Startup items can only be combined if they have the same options, and the combined launch has those options followed by the targets of all the startup items.
+
+    Attributes:
+        name (str): The name of the policy, which is shown in the launch plan
+
+        target_argument (re.Pattern): The pattern that matches the start of every argument that is a target
+
+        max_targets (int): The most targets in one combined launch. Startup items that would go over are combined into another launch instead.
+    """
+
+    name: str
+    target_argument: re.Pattern
+    max_targets: int
+
+
+# The policy for browser startup items, which is used for any startup item with Browser set to true whatever program it launches
+BROWSER_POLICY = CoalescePolicy("browser tabs", URL_ARGUMENT, 100)
+
+# The policy for each program that can open more than one file in one launch, by the name of its program file in lower case
+# A program is only safe to add here if every one of its arguments that doesn't look like an option is a file to open, since anything else would be treated as a target
+COALESCE_POLICIES = {
+    "code.exe": CoalescePolicy("Visual Studio Code files", FILE_ARGUMENT, 50),
+    "notepad++.exe": CoalescePolicy("Notepad++ files", FILE_ARGUMENT, 50),
+    "sublime_text.exe": CoalescePolicy("Sublime Text files", FILE_ARGUMENT, 50),
+    "winword.exe": CoalescePolicy("Word documents", FILE_ARGUMENT, 20),
+    "excel.exe": CoalescePolicy("Excel workbooks", FILE_ARGUMENT, 20),
+}
+
+
+def get_coalesce_policy(startup_item: dict, path_cache: dict = None):
+    """Helper function to get the policy for combining a startup item with other startup items
+
+    A startup item with SeparateLaunch set to true is always launched on its own. A startup item with an After key is too, since launching it along with another startup item could start it before the startup items it waits for.
+
+    Args:
+        startup_item (dict): The startup item
+
+        path_cache (dict, optional): The normalized FilePath of each FilePath already seen, the same as for the function get_duplicate_key in the module cs_dedup. Defaults to None.
+
+    Returns:
+        CoalescePolicy: BROWSER_POLICY for a browser startup item, the policy in COALESCE_POLICIES for the program it launches, or None if it can't be combined with other startup items
+    """
+    coalesce_policy = None
+
+    if not startup_item.get(ENUM_JSK.SEPARATELAUNCH.value, False) and not startup_item.get(ENUM_JSK.AFTER.value):
+        if startup_item[ENUM_JSK.BROWSER.value]:
+            coalesce_policy = BROWSER_POLICY
+        else:
+            file_path = deps_dedup.get_duplicate_key(startup_item, path_cache)[0]
+            coalesce_policy = COALESCE_POLICIES.get(ntpath.basename(file_path))
+
+    return coalesce_policy
+
+
+def get_coalesce_key(startup_item: dict, coalesce_policy: CoalescePolicy, path_cache: dict = None):
+    """Helper function to get what decides if two startup items can be combined into one launch
+
+    Args:
+        startup_item (dict): The startup item
+
+        coalesce_policy (CoalescePolicy): The policy for the startup item, as returned by get_coalesce_policy
+
+        path_cache (dict, optional): The normalized FilePath of each FilePath already seen, the same as for the function get_duplicate_key in the module cs_dedup. Defaults to None.
+
+    Returns:
+        tuple: The name of the policy, the normalized FilePath and a tuple of the arguments that are options, in order
+    """
+    file_path, item_args = deps_dedup.get_duplicate_key(startup_item, path_cache)
+
+    return (
+        coalesce_policy.name,
+        file_path,
+        tuple(item_arg for item_arg in item_args if not coalesce_policy.target_argument.match(item_arg)),
+    )
+
+
+def get_coalesce_targets(startup_item: dict, coalesce_policy: CoalescePolicy, path_cache: dict = None):
+    """Helper function to get the arguments of a startup item that are targets
+
+    The arguments are normalized the same way as for the function get_duplicate_key in the module cs_dedup, so targets are compared and added to a combined launch in the same form they're compared in everywhere else.
+
+    Args:
+        startup_item (dict): The startup item
+
+        coalesce_policy (CoalescePolicy): The policy for the startup item, as returned by get_coalesce_policy
+
+        path_cache (dict, optional): The normalized FilePath of each FilePath already seen, the same as for the function get_duplicate_key in the module cs_dedup. Defaults to None.
+
+    Returns:
+        list: The targets that aren't blank with any spaces around them removed, in order
+    """
+    return [
+        item_arg
+        for item_arg in deps_dedup.get_duplicate_key(startup_item, path_cache)[1]
+        if coalesce_policy.target_argument.match(item_arg)
+    ]
+
+
+def coalesce_items(items_list: list):
+    """Function to combine startup items that launch the same program into as few launches as their policies allow
+
+    The startup items are gone through in launch order, as returned by the function get_launch_order in the module cs_schedule. The first startup item with each key from get_coalesce_key leads a launch. If anything is combined into it, it keeps all of its own arguments in the form returned by the function get_duplicate_key in the module cs_dedup, so no target is in the combined launch twice, even if the lead startup item has it twice or once with spaces around it, and the targets of the startup items after it with the same key are added after them in order, skipping any target already in the launch. A startup item is only combined into a launch if it adds at least one target to it, since otherwise combining it would drop a launch the user set up, such as a second browser window. A startup item with no targets, such as a browser opening a blank window, is always launched on its own for the same reason. Startup items that launch exactly the same thing are reported by the module cs_dedup instead. Once adding the targets of a startup item would go over the max_targets of the policy or make the command line longer than MAX_COMMAND_LINE, that startup item leads a new launch instead. The lead startup item also gets the highest Priority of its launch, so the launch isn't started any later than the first of them would have been.
+
+    The other startup items are left out of the startup items returned. Any startup item with one of them in its After key waits for the startup items leading their launches as well.
+
+    Args:
+        items_list (list): The startup items, which aren't changed
+
+    Returns:
+        list: The startup items to launch, which is items_list itself if nothing was combined. Lead startup items are copies.
+
+        dict: The ItemNumbers of the startup items launched along with each lead startup item, by the ItemNumber of the lead startup item. Only lead startup items that had others combined into them are included.
+
+        dict: The name of the policy each lead startup item in the dictionary above was combined with, by the ItemNumber of the lead startup item
+    """
+    # subprocess is slow to import and is only needed once the startup items are launched or their launch plan is written
+    import subprocess
+
+    # Initialize function variables
+    merged_items = items_list
+    merged_numbers = {}
+    merged_policies = {}
+    lead_indexes = {}
+    member_indexes = {}
+    lead_args = {}
+    lead_targets = {}
+    lead_lengths = {}
+    path_cache = {}
+
+    # Find the lead startup item of each launch and the startup items combined into it
+    for item_index in deps_schedule.get_launch_order(items_list):
+        startup_item = items_list[item_index]
+        coalesce_policy = get_coalesce_policy(startup_item, path_cache)
+
+        if coalesce_policy is None:
+            continue
+
+        coalesce_key = get_coalesce_key(startup_item, coalesce_policy, path_cache)
+        item_targets = get_coalesce_targets(startup_item, coalesce_policy, path_cache)
+        lead_index = lead_indexes.get(coalesce_key)
+        new_targets = []
+
+        # A startup item with nothing to open is launched on its own
+        if len(item_targets) == 0:
+            continue
+
+        if lead_index is not None:
+            for item_target in item_targets:
+                if item_target not in lead_targets[lead_index] and item_target not in new_targets:
+                    new_targets.append(item_target)
+
+            # A startup item that adds nothing to the launch is launched on its own
+            if len(new_targets) == 0:
+                continue
+
+            # Each target adds itself and a space to the command line
+            new_length = lead_lengths[lead_index] + sum(
+                len(subprocess.list2cmdline([item_target])) + 1 for item_target in new_targets
+            )
+
+            if (
+                len(lead_targets[lead_index]) + len(new_targets) > coalesce_policy.max_targets
+                or new_length > MAX_COMMAND_LINE
+            ):
+                lead_index = None
+
+        if lead_index is None:
+            # The startup item leads a new launch, with all of its arguments normalized the same way as its targets
+            lead_indexes[coalesce_key] = item_index
+            member_indexes[item_index] = []
+            lead_args[item_index] = []
+            for item_arg in deps_dedup.get_duplicate_key(startup_item, path_cache)[1]:
+                if item_arg not in lead_args[item_index] or not coalesce_policy.target_argument.match(item_arg):
+                    lead_args[item_index].append(item_arg)
+            lead_targets[item_index] = set(item_targets)
+            lead_lengths[item_index] = len(
+                subprocess.list2cmdline([startup_item[ENUM_JSK.FILEPATH.value]] + lead_args[item_index])
+            )
+            merged_policies[startup_item[ENUM_JSK.ITEMNUMBER.value]] = coalesce_policy.name
+        else:
+            member_indexes[lead_index].append((item_index, new_targets))
+            lead_targets[lead_index].update(new_targets)
+            lead_lengths[lead_index] = new_length
+
+    member_indexes = {lead_index: item_targets for lead_index, item_targets in member_indexes.items() if item_targets}
+
+    if len(member_indexes) > 0:
+        merged_items = []
+        merged_away = set()
+        lead_names = {}
+
+        for lead_index, item_targets in member_indexes.items():
+            lead_name = items_list[lead_index][ENUM_JSK.NAME.value]
+            merged_numbers[items_list[lead_index][ENUM_JSK.ITEMNUMBER.value]] = [
+                items_list[item_index][ENUM_JSK.ITEMNUMBER.value] for item_index, new_targets in item_targets
+            ]
+
+            for item_index, new_targets in item_targets:
+                merged_away.add(item_index)
+                lead_names.setdefault(items_list[item_index][ENUM_JSK.NAME.value], []).append(lead_name)
+
+        for item_index, startup_item in enumerate(items_list):
+            if item_index in merged_away:
+                continue
+
+            if item_index in member_indexes:
+                startup_item = dict(startup_item)
+                item_args = lead_args[item_index]
+                item_priority = startup_item.get(ENUM_JSK.PRIORITY.value, 0)
+
+                for member_index, new_targets in member_indexes[item_index]:
+                    item_args.extend(new_targets)
+                    item_priority = max(item_priority, items_list[member_index].get(ENUM_JSK.PRIORITY.value, 0))
+
+                startup_item[ENUM_JSK.ARGUMENTLIST.value] = item_args
+                startup_item[ENUM_JSK.ARGUMENTCOUNT.value] = len(item_args)
+
+                if not item_priority == startup_item.get(ENUM_JSK.PRIORITY.value, 0):
+                    startup_item[ENUM_JSK.PRIORITY.value] = item_priority
+            elif startup_item.get(ENUM_JSK.AFTER.value):
+                # Waiting for a startup item that was combined into another launch means waiting for that launch
+                after_names = list(startup_item[ENUM_JSK.AFTER.value])
+
+                for after_name in startup_item[ENUM_JSK.AFTER.value]:
+                    for lead_name in lead_names.get(after_name, []):
+                        if lead_name not in after_names and not lead_name == startup_item[ENUM_JSK.NAME.value]:
+                            after_names.append(lead_name)
+
+                if len(after_names) > len(startup_item[ENUM_JSK.AFTER.value]):
+                    startup_item = dict(startup_item)
+                    startup_item[ENUM_JSK.AFTER.value] = after_names
+
+            merged_items.append(startup_item)
+
+    merged_policies = {
+        item_number: policy_name for item_number, policy_name in merged_policies.items() if item_number in merged_numbers
+    }
+
+    return (merged_items, merged_numbers, merged_policies)
+
+
+def get_saved_launches(merged_numbers: dict):
+    """Helper function to get how many program starts combining startup items saved
+
+    Args:
+        merged_numbers (dict): The ItemNumbers of the startup items launched along with each lead startup item, as returned by the function coalesce_items
+
+    Returns:
+        int: The number of startup items that no longer need a program start of their own
+    """
+    return sum(len(item_numbers) for item_numbers in merged_numbers.values())
@@ -1,17 +1,61 @@
 # Dependency to store the helper functions that are used to generate JSON data
 
-import copy, os.path
+import copy, json, os.path
 
 import dependencies.cs_enum as deps_enum
 import dependencies.cs_helper as deps_helper
 import dependencies.cs_pretty as deps_pretty
 import dependencies.cs_jsonfn as deps_json
-import CompStart as app_cs
+import dependencies.cs_document as deps_document
+import dependencies.cs_model as deps_model
+import dependencies.cs_schedule as deps_schedule
+import dependencies.cs_cache as deps_cache
+import dependencies.cs_atomic as deps_atomic
+import dependencies.cs_journal as deps_journal
+import dependencies.cs_plan as deps_plan
 
 ENUM_JSK = deps_enum.JsonSchemaKeys
 ENUM_JSS = deps_enum.JsonSchemaStructure
 ENUM_ITV = deps_enum.ItemTypeVals
 
+# The programs that synthetic startup items are made from, which is a list of tuples with the following values:
+# the Name, the FilePath, the Description, and the arguments a startup item for the program can have, where {n} is replaced with a number
+SYNTHETIC_PROGRAMS = [
+    ("Outlook", "C:\\Program Files\\Microsoft Office\\root\\Office16\\OUTLOOK.EXE", "Email and calendar", ["/recycle"]),
+    ("Word", "C:\\Program Files\\Microsoft Office\\root\\Office16\\WINWORD.EXE", "Word processor", ["C:\\Users\\Public\\Documents\\Report {n}.docx"]),
+    ("Excel", "C:\\Program Files\\Microsoft Office\\root\\Office16\\EXCEL.EXE", "Spreadsheets", ["C:\\Users\\Public\\Documents\\Budget {n}.xlsx"]),
+    ("Teams", "C:\\Program Files\\WindowsApps\\MSTeams\\ms-teams.exe", "Chat and meetings", []),
+    ("Slack", "C:\\Program Files\\Slack\\slack.exe", "Team chat", ["--startup"]),
+    ("Spotify", "C:\\Program Files\\Spotify\\Spotify.exe", "Music player", ["--minimized"]),
+    ("Visual Studio Code", "C:\\Program Files\\Microsoft VS Code\\Code.exe", "Code editor", ["--new-window", "C:\\Projects\\project-{n}"]),
+    ("Terminal", "wt", "Command line", ["-d", "C:\\Projects\\project-{n}"]),
+    ("Notepad", "notepad", "A text editor", ["C:\\Users\\Public\\Documents\\notes-{n}.txt"]),
+    ("Calculator", "calc", "A simple calculator", []),
+    ("File Explorer", "explorer", "Browse files", ["C:\\Users\\Public\\Documents\\Folder {n}"]),
+    ("OneNote", "C:\\Program Files\\Microsoft Office\\root\\Office16\\ONENOTE.EXE", "Notebooks", []),
+]
+
+# The browsers that synthetic browser items are made from, which is a list of tuples with the following values:
+# the Name, the FilePath, and the arguments passed before the web sites
+SYNTHETIC_BROWSERS = [
+    ("Chrome", "C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe", ["--profile-directory=Default", "--new-window"]),
+    ("Edge", "C:\\Program Files (x86)\\Microsoft\\Edge\\Application\\msedge.exe", ["--new-window"]),
+    ("Firefox", "C:\\Program Files\\Mozilla Firefox\\firefox.exe", ["-new-window"]),
+]
+
+# The web sites opened by synthetic browser items, where {n} is replaced with a number
+SYNTHETIC_SITES = [
+    "https://mail.example.com/",
+    "https://calendar.example.com/",
+    "https://news.example.com/section/{n}",
+    "https://docs.example.com/document/{n}",
+    "https://tickets.example.com/board/{n}",
+    "https://wiki.example.com/page/{n}",
+]
+
+# The weights used to pick how many web sites a synthetic browser item opens, starting from 1
+SYNTHETIC_TAB_WEIGHTS = [30, 25, 15, 10, 7, 5, 3, 2, 2, 1]
+
 
 def generate_new_json_data(is_default: bool = False):
     """Helper function to create new startup JSON data
@@ -96,6 +140,153 @@ def generate_blank_startup_data():
     return json_data
 
 
+def generate_synthetic_items(total_items: int, seed: int = 0):
+    """Helper function to make synthetic startup items one at a time
+
+    The startup items are made to look like real startup data, so the amount of work done with them is close to what real users would see:
+
+    - about 3 in 10 startup items are browser items, which open between 1 and 10 web sites, with 1 or 2 being the most common
+    - about 6 in 10 of the other startup items have no arguments, and the rest have one or two arguments such as a file to open
+    - startup items for the same program get a number added to their Name, so every Name is different
+    - about 1 in 10 startup items has a Priority, and about 1 in 20 has an After key naming one of the startup items just before it
+
+    Since an After key only ever names an earlier startup item, the After keys never depend on each other in a loop. The same seed always gives the same startup items.
+
+    Args:
+        total_items (int): The number of startup items to make
+
+        seed (int, optional): The seed for the random numbers. Defaults to 0.
+
+    Yields:
+        dict: The next startup item, which is valid against startup_item.schema.json
+    """
+    # random is only needed to make synthetic startup data
+    import random
+
+    # Initialize function variables
+    random_numbers = random.Random(seed)
+    name_counts = {}
+    recent_names = []
+
+    for item_number in range(1, total_items + 1):
+        is_browser = random_numbers.random() < 0.3
+
+        if is_browser:
+            item_name, file_path, argument_list = random_numbers.choice(SYNTHETIC_BROWSERS)
+            item_description = "Web sites for " + item_name
+            argument_list = list(argument_list)
+
+            tab_count = random_numbers.choices(
+                range(1, len(SYNTHETIC_TAB_WEIGHTS) + 1), SYNTHETIC_TAB_WEIGHTS
+            )[0]
+            for tab_number in range(tab_count):
+                argument_list.append(
+                    random_numbers.choice(SYNTHETIC_SITES).replace("{n}", str(random_numbers.randint(1, 9999)))
+                )
+        else:
+            item_name, file_path, item_description, argument_templates = random_numbers.choice(SYNTHETIC_PROGRAMS)
+            argument_list = []
+
+            if argument_templates and random_numbers.random() >= 0.6:
+                file_number = str(random_numbers.randint(1, 9999))
+                argument_list = [argument.replace("{n}", file_number) for argument in argument_templates]
+
+        # Number the Name if there's already a startup item for the same program
+        name_counts[item_name] = name_counts.get(item_name, 0) + 1
+        if name_counts[item_name] > 1:
+            item_name += " " + str(name_counts[item_name])
+
+        startup_item = {
+            ENUM_JSK.ITEMNUMBER.value: item_number,
+            ENUM_JSK.NAME.value: item_name,
+            ENUM_JSK.FILEPATH.value: file_path,
+            ENUM_JSK.DESCRIPTION.value: item_description,
+            ENUM_JSK.BROWSER.value: is_browser,
+            ENUM_JSK.ARGUMENTCOUNT.value: len(argument_list),
+            ENUM_JSK.ARGUMENTLIST.value: argument_list,
+        }
+
+        if random_numbers.random() < 0.1:
+            startup_item[ENUM_JSK.PRIORITY.value] = random_numbers.choice([-10, -1, 1, 5, 10])
+
+        if recent_names and random_numbers.random() < 0.05:
+            startup_item[ENUM_JSK.AFTER.value] = [random_numbers.choice(recent_names)]
+
+        # Only the last few Names are kept, so memory use doesn't grow with the number of startup items
+        recent_names.append(item_name)
+        if len(recent_names) > 16:
+            recent_names.pop(0)
+
+        yield startup_item
+
+
+def generate_synthetic_startup_text(total_items: int, seed: int = 0):
+    """Helper function to make synthetic startup data as JSON text, one piece at a time
+
+    The text is exactly what the function json.dumps would give for the full startup data, so a file written from it looks the same as one written by the function json_writer in the module cs_jsonfn.
+
+    Args:
+        total_items (int): The number of startup items to make
+
+        seed (int, optional): The seed for the random numbers. Defaults to 0.
+
+    Yields:
+        str: The next piece of the JSON text
+    """
+    yield "{" + json.dumps(ENUM_JSK.TOTALITEMS.value) + ": " + str(total_items) + ", "
+    yield json.dumps(ENUM_JSK.ITEMS.value) + ": ["
+
+    for startup_item in generate_synthetic_items(total_items, seed):
+        if startup_item[ENUM_JSK.ITEMNUMBER.value] > 1:
+            yield ", "
+        yield json.dumps(startup_item)
+
+    yield "]}"
+
+
+def generate_synthetic_startup_file(json_file: str, total_items: int, seed: int = 0):
+    """Function to write a startup file with synthetic startup data, which can be used to test CompStart with a lot of startup items
+
+    The startup items are written to the file as they are made, so only one startup item is in memory at a time no matter how many there are. The file is written with the function atomic_stream_writer in the module cs_atomic, using the durability level set by the variable write_durability in CompStart.py, and any journal and launch plan for the file are removed since they would no longer apply. No new launch plan is written, since that would need all the startup items in memory at once, so CompStart.ps1 falls back to reading in the startup file until it is next saved from CompStart.py. See the function generate_synthetic_items for what the startup items look like.
+
+    Args:
+        json_file (str): The full absolute path of the startup file including filename and extension
+
+        total_items (int): The number of startup items to write
+
+        seed (int, optional): The seed for the random numbers. The same seed always gives the same file. Defaults to 0.
+
+    Returns:
+        bool: True if the startup file was written successfully, False if not
+
+        string: An error message to display if the startup file couldn't be written, or a message that it was written successfully
+    """
+    # Initialize function variables
+    write_success = False
+    return_message = ""
+
+    # Whatever happens, the cached startup data for the file will be outdated
+    deps_cache.cache_invalidate(json_file)
+
+    try:
+        deps_atomic.atomic_stream_writer(
+            json_file,
+            generate_synthetic_startup_text(total_items, seed),
+            deps_helper.get_write_durability(),
+        )
+
+        write_success = True
+        return_message = f"Wrote {total_items} synthetic startup items to {json_file}"
+
+        deps_journal.journal_remover(json_file)
+        deps_plan.plan_remover(json_file)
+    except Exception as error:
+        return_message = deps_pretty.prettify_io_error(error, "w")
+        deps_pretty.prettify_custom_error(return_message, "generate_synthetic_startup_file")
+
+    return (write_success, return_message)
+
+
 def generate_user_edited_data(modified_json_data: dict, item_type: str, orig_json_data: dict = {}):
     """Helper function to create JSON data from edited startup data
 
@@ -117,10 +308,10 @@ def generate_user_edited_data(modified_json_data: dict, item_type: str, orig_jso
 
         In the case of R, since modified_json_data will be a valid startup item, the property ItemNumber will determine which startup item is to be updated.
 
-        orig_json_data (dict): Optional. A dictionary containing the original JSON data to be replaced or updated. If nothing is passed in, then it's blank by default.
+        orig_json_data (dict): Optional. A dictionary containing the original JSON data to be replaced or updated. If nothing is passed in, then it's blank by default. This can also be a StartupDocument from the module cs_document, in which case the original startup data isn't validated again or copied. Instead, a new StartupDocument that shares all the unchanged startup items with the original one is returned. See the class StartupDocument for more information.
 
     Returns:
-        dict: A dictionary with the updated JSON data
+        dict: A dictionary with the updated JSON data, or a StartupDocument if orig_json_data is a StartupDocument. If the data couldn't be updated, an empty dictionary is returned either way.
     """
     # Create empty JSON object / Python dictionary
     new_json_data = ENUM_JSS.OBJECT.value.copy()
@@ -134,11 +325,36 @@ def generate_user_edited_data(modified_json_data: dict, item_type: str, orig_jso
         )
     else:
         # Item_type is a valid value, so continue
+        # A StartupItem, StartupData or StartupDocument passed in as the modified data is turned back into a dictionary, as is a StartupData passed in as the original data
+        modified_json_data = deps_model.model_to_json(modified_json_data)
+        if isinstance(orig_json_data, deps_model.StartupData):
+            orig_json_data = orig_json_data.to_json()
+
+        is_document = isinstance(orig_json_data, deps_document.StartupDocument)
         scenario_number = data_validation_scenario(modified_json_data, item_type, orig_json_data)
 
         # Check the status of the data validation
         # If the validation failed, then a blank Python dictionary is returned, so no need to code that in
         match scenario_number:
+            case 1 if is_document:
+                # Same as case 1 below, but the StartupDocument numbers the new startup item itself
+                new_json_data = orig_json_data.add_item(modified_json_data)
+            case 2 | 3 if is_document:
+                # Same as cases 2 and 3 below, but the StartupDocument takes care of updating the ItemNumber of the startup items after a deleted one
+                change_item_number = modified_json_data[ENUM_JSK.ITEMNUMBER.value]
+
+                if change_item_number in range(1, orig_json_data.total_items() + 1):
+                    if scenario_number == 2:
+                        new_json_data = orig_json_data.delete_item(change_item_number)
+                    else:
+                        new_json_data = orig_json_data.replace_item(
+                            change_item_number, modified_json_data
+                        )
+                else:
+                    deps_pretty.prettify_custom_error(
+                        "Cannot update the JSON data! The startup item number passed in is invalid!",
+                        "generate_user_edited_data",
+                    )
             case 1:
                 # Data validation passed and modified JSON data passed in is a single startup item that has to be added to the end. Return the original JSON data but updated with the new startup item added to the end.
                 current_total_items = orig_json_data[ENUM_JSK.TOTALITEMS.value]
@@ -159,6 +375,11 @@ def generate_user_edited_data(modified_json_data: dict, item_type: str, orig_jso
 
                 new_json_data[ENUM_JSK.TOTALITEMS.value] = new_total_items
                 new_json_data[ENUM_JSK.ITEMS.value] = new_items_list
+
+                # Keep any other keys of the original JSON data, such as LaunchPolicy
+                for data_key, data_value in orig_json_data.items():
+                    if data_key not in new_json_data:
+                        new_json_data[data_key] = copy.deepcopy(data_value)
             case 2:
                 # Data validation passed and modified JSON data passed in is a single startup item that needs to be deleted from the startup data. Remove the item and update the TotalItems property of the startup data as well as the ItemNumber for all startup items that originally came after the deleted startup item. Return the original JSON data but with the changes.
 
@@ -215,10 +436,166 @@ def generate_user_edited_data(modified_json_data: dict, item_type: str, orig_jso
                 # Data validation passed and modified JSON data passed in is full JSON data. Return the modified_json_data variable.
                 new_json_data = copy.deepcopy(modified_json_data)
 
+        # An added or replaced startup item with an After key can close a loop of startup items waiting for each other. Any new loop has to go through that startup item, so the check is skipped for startup items without one.
+        if (
+            scenario_number in (1, 3)
+            and modified_json_data.get(ENUM_JSK.AFTER.value)
+            and (is_document or len(new_json_data) > 0)
+        ):
+            if is_document:
+                new_items_list = list(new_json_data.iter_items())
+            else:
+                new_items_list = new_json_data[ENUM_JSK.ITEMS.value]
+
+            valid_order, err_msg = deps_schedule.launch_cycle_validator(new_items_list)
+
+            if not valid_order:
+                deps_pretty.prettify_custom_error(err_msg, "generate_user_edited_data")
+                new_json_data = ENUM_JSS.OBJECT.value.copy()
+
     return new_json_data
 
 
-def data_validation_scenario(modified_json_data: dict, item_type: str, orig_json_data: dict):
+def generate_user_batch_edited_data(edit_list: list, orig_json_data: dict):
+    """Helper function to create JSON data from a list of startup item edits made all at once
+
+    This works like calling the function generate_user_edited_data once for each edit, except that every edit is checked before any of them are made, and the new startup data is put together in one pass. Calling generate_user_edited_data for each edit copies all of the startup data every time and, for a delete, changes the ItemNumber of every startup item after it, so k edits to n startup items take O(n·k) time. Here they take O(n + k), or O(k log n) when orig_json_data is a StartupDocument.
+
+    Every ItemNumber in the edits refers to the startup data as it was before any of the edits, so deleting ItemNumber 2 doesn't change which startup item ItemNumber 5 refers to. Startup items are added to the end in the order of the edits, and the ItemNumber of every startup item is only set once at the end. Each startup item can only be deleted or replaced by one edit.
+
+    Either all of the edits are made or none of them are.
+
+    Args:
+        edit_list (list): The edits to make in order, where each edit is a tuple of a single startup item and an item_type of A, D or R, the same as the first two arguments of the function generate_user_edited_data
+
+        orig_json_data (dict): Required. A dictionary containing the original JSON data to edit. This can also be a StartupData or a StartupDocument, in which case a new StartupDocument that shares all the unchanged startup items with the original one is returned.
+
+    Returns:
+        dict: A dictionary with the updated JSON data, or a StartupDocument if orig_json_data is a StartupDocument. If any of the edits couldn't be made, an empty dictionary is returned either way.
+    """
+    # Initialize function variables
+    new_json_data = ENUM_JSS.OBJECT.value.copy()
+    edits_valid = True
+    orig_checked = False
+    delete_numbers = set()
+    replace_items = {}
+    add_items = []
+
+    if isinstance(orig_json_data, deps_model.StartupData):
+        orig_json_data = orig_json_data.to_json()
+
+    is_document = isinstance(orig_json_data, deps_document.StartupDocument)
+
+    # Check every edit before making any of them, with the original data only validated along with the first one
+    for modified_json_data, item_type in edit_list:
+        modified_json_data = deps_model.model_to_json(modified_json_data)
+
+        if not deps_helper.check_item_type(item_type) or item_type == ENUM_ITV.FULL.value:
+            deps_pretty.prettify_custom_error(
+                f"The item_type {item_type!r} can't be used for a batch of edits!",
+                "generate_user_batch_edited_data",
+            )
+            edits_valid = False
+            break
+
+        scenario_number = data_validation_scenario(
+            modified_json_data, item_type, orig_json_data, orig_checked
+        )
+        orig_checked = True
+
+        if scenario_number == 0:
+            edits_valid = False
+            break
+
+        if scenario_number == 1:
+            add_items.append(modified_json_data)
+            continue
+
+        # Deletes and replaces have to refer to a different startup item that exists
+        change_item_number = modified_json_data[ENUM_JSK.ITEMNUMBER.value]
+        total_items = (
+            orig_json_data.total_items() if is_document else orig_json_data[ENUM_JSK.TOTALITEMS.value]
+        )
+
+        if change_item_number not in range(1, total_items + 1):
+            err_msg = "Cannot update the JSON data! The startup item number passed in is invalid!"
+        elif change_item_number in delete_numbers or change_item_number in replace_items:
+            err_msg = f"Cannot update the JSON data! Startup item {change_item_number} is changed by more than one edit!"
+        else:
+            err_msg = ""
+
+        if err_msg:
+            deps_pretty.prettify_custom_error(err_msg, "generate_user_batch_edited_data")
+            edits_valid = False
+            break
+
+        if scenario_number == 2:
+            delete_numbers.add(change_item_number)
+        else:
+            replace_items[change_item_number] = modified_json_data
+
+    # With no edits at all, the original data still has to be checked
+    if edits_valid and not orig_checked and not is_document:
+        edits_valid = deps_helper.json_data_validator(orig_json_data)
+
+    if edits_valid and is_document:
+        # Replace first and then delete from the end, so the ItemNumbers of the startup items still to be changed stay the same
+        new_json_data = orig_json_data
+
+        for change_item_number, modified_json_data in replace_items.items():
+            new_json_data = new_json_data.replace_item(change_item_number, modified_json_data)
+
+        for change_item_number in sorted(delete_numbers, reverse=True):
+            new_json_data = new_json_data.delete_item(change_item_number)
+
+        for modified_json_data in add_items:
+            new_json_data = new_json_data.add_item(modified_json_data)
+    elif edits_valid:
+        # Put the new Items array together in one pass, copying each startup item and giving it its final ItemNumber
+        new_items_list = []
+
+        for item_number, startup_item in enumerate(orig_json_data[ENUM_JSK.ITEMS.value], start=1):
+            if item_number not in delete_numbers:
+                startup_item = replace_items.get(item_number, startup_item)
+                new_items_list.append(
+                    deps_document.copy_startup_item(startup_item, len(new_items_list) + 1)
+                )
+
+        for modified_json_data in add_items:
+            new_items_list.append(
+                deps_document.copy_startup_item(modified_json_data, len(new_items_list) + 1)
+            )
+
+        new_json_data[ENUM_JSK.TOTALITEMS.value] = len(new_items_list)
+        new_json_data[ENUM_JSK.ITEMS.value] = new_items_list
+
+        # Keep any other keys of the original JSON data, such as LaunchPolicy
+        for data_key, data_value in orig_json_data.items():
+            if data_key not in new_json_data:
+                new_json_data[data_key] = copy.deepcopy(data_value)
+
+    # As with a single edit, only added or replaced startup items with an After key can close a loop
+    if edits_valid and any(
+        modified_json_data.get(ENUM_JSK.AFTER.value)
+        for modified_json_data in add_items + list(replace_items.values())
+    ):
+        if is_document:
+            new_items_list = list(new_json_data.iter_items())
+        else:
+            new_items_list = new_json_data[ENUM_JSK.ITEMS.value]
+
+        valid_order, err_msg = deps_schedule.launch_cycle_validator(new_items_list)
+
+        if not valid_order:
+            deps_pretty.prettify_custom_error(err_msg, "generate_user_batch_edited_data")
+            new_json_data = ENUM_JSS.OBJECT.value.copy()
+
+    return new_json_data
+
+
+def data_validation_scenario(
+    modified_json_data: dict, item_type: str, orig_json_data: dict, orig_checked: bool = False
+):
     """Helper function for the function generate_user_edited_data to handle the data validation and determining which scenario is applicable based on the following possible valid scenarios:
 
     1) Need to add a single startup item
@@ -255,7 +632,9 @@ def data_validation_scenario(modified_json_data: dict, item_type: str, orig_json
 
         orig_json_data (dict): Required. A dictionary containing the original JSON data to be
         replaced or updated. If there is no original JSON data to work with, depending on the
-        scenario, then this parameter will be blank.
+        scenario, then this parameter will be blank. If it's a StartupDocument, it's considered valid without validating it again, since a StartupDocument is only ever created from validated startup data and only changed with validated startup items.
+
+        orig_checked (bool): Optional. True if orig_json_data was already validated by the calling function, so it doesn't have to be validated again. This is used by the function generate_user_batch_edited_data, which checks every edit against the same original data. Defaults to False.
 
     Returns:
         int: A scenario number based on the following legend:
@@ -273,16 +652,19 @@ def data_validation_scenario(modified_json_data: dict, item_type: str, orig_json
     # Orig-Valid: if orig_json_data exists, is the data valid
     # Mod-Single: if modified_json_data contains a single startup item or full startup data
     # Mod-Valid: if modified_json_data is valid
+    is_document = isinstance(orig_json_data, deps_document.StartupDocument)
     data_validation = {
         "Item-Type": item_type,
-        "Orig-Exists": True if len(orig_json_data) > 0 else False,
+        "Orig-Exists": True if is_document or len(orig_json_data) > 0 else False,
         "Orig-Valid": False,
         "Mod-Single": False,
         "Mod-Valid": False,
     }
 
     # If the orig_json_data dictionary isn't blank, check that it contains properly formed data
-    if data_validation["Orig-Exists"]:
+    if is_document or (orig_checked and data_validation["Orig-Exists"]):
+        data_validation["Orig-Valid"] = True
+    elif data_validation["Orig-Exists"]:
         data_validation["Orig-Valid"] = deps_helper.json_data_validator(orig_json_data)
 
     # Check if modified_json_data contains properly formed data
@@ -0,0 +1,170 @@
+# Dependency to store the helper functions that find startup items launching the same program more than once, which costs a whole extra process start each time
+
+import ntpath
+
+import dependencies.cs_enum as deps_enum
+import dependencies.cs_model as deps_model
+import dependencies.cs_pretty as deps_pretty
+
+ENUM_JSK = deps_enum.JsonSchemaKeys
+
+
+def normalize_file_path(file_path: str):
+    """Helper function to get a FilePath in the form used to compare it with other FilePaths
+
+    The startup items are launched on Windows, so two FilePaths are the same program if they only differ in upper and lower case letters, forward or back slashes, quotes around the path, or parts like "." and ".." that Windows removes anyway.
+
+    Args:
+        file_path (str): The FilePath of a startup item
+
+    Returns:
+        str: The normalized FilePath
+    """
+    file_path = file_path.strip().strip('"')
+
+    if file_path:
+        file_path = ntpath.normpath(file_path)
+
+    return file_path.casefold()
+
+
+def get_duplicate_key(startup_item: dict, path_cache: dict = None):
+    """Helper function to get what decides if two startup items launch exactly the same thing
+
+    Args:
+        startup_item (dict): The startup item. This can also be a StartupItem.
+
+        path_cache (dict, optional): The normalized FilePath of each FilePath already seen, which is filled in as new FilePaths are seen. Many startup items launch the same program, so this saves normalizing the same FilePath over and over. Defaults to None, in which case the FilePath is always normalized.
+
+    Returns:
+        tuple: The normalized FilePath, followed by a tuple of the arguments that aren't blank with any spaces around them removed, in order
+    """
+    startup_item = deps_model.model_to_json(startup_item)
+
+    item_args = tuple(
+        item_arg.strip() for item_arg in startup_item[ENUM_JSK.ARGUMENTLIST.value] if item_arg.strip()
+    )
+
+    file_path = startup_item[ENUM_JSK.FILEPATH.value]
+
+    if path_cache is None:
+        file_path = normalize_file_path(file_path)
+    elif file_path in path_cache:
+        file_path = path_cache[file_path]
+    else:
+        path_cache[file_path] = normalize_file_path(file_path)
+        file_path = path_cache[file_path]
+
+    return (file_path, item_args)
+
+
+def find_duplicates(startup_items):
+    """Function to find the startup items that launch the same program as another startup item
+
+    Exact duplicates have the same FilePath and arguments, as returned by get_duplicate_key, as well as the same Name, Priority, After and SeparateLaunch, so they're found by hashing all of that for each startup item in one pass. The Name has to match because the After array of other startup items refers to startup items by their Name, and the rest because they decide when and how the program is launched, so deleting an exact duplicate never loses any of that. Only the Description doesn't matter.
+
+    Overlapping startup items have the same FilePath, and all of their arguments are also arguments of another startup item. This includes startup items that launch exactly the same thing as another one but are scheduled differently, since deleting either of them would change the launch order, such as a browser opened with one website when another startup item already opens that browser with the same website and a few more. Only the first startup item of each group of exact duplicates is checked. For each FilePath, every argument has the set of startup items that have it, so the startup items with all the arguments of a startup item are found by intersecting those sets instead of comparing every pair of startup items.
+
+    Args:
+        startup_items (iterable): The startup items, such as the Items array of the startup data or the iter_items generator of a StartupDocument
+
+    Returns:
+        list: The groups of exact duplicates, each a list of ItemNumbers in order, in the order of their first startup item
+
+        list: The overlapping startup items, each a tuple of the ItemNumber of the startup item and the ItemNumber of the first startup item it overlaps with, in order
+    """
+    # Initialize function variables
+    duplicate_groups = []
+    overlap_pairs = []
+    key_numbers = {}
+    path_keys = {}
+    path_cache = {}
+
+    # Group the startup items by their key and scheduling, which keeps the keys in the order they were first found
+    for startup_item in startup_items:
+        startup_item = deps_model.model_to_json(startup_item)
+        duplicate_key = get_duplicate_key(startup_item, path_cache) + (
+            startup_item[ENUM_JSK.NAME.value],
+            startup_item.get(ENUM_JSK.PRIORITY.value, 0),
+            tuple(startup_item.get(ENUM_JSK.AFTER.value, [])),
+            startup_item.get(ENUM_JSK.SEPARATELAUNCH.value, False),
+        )
+
+        key_numbers.setdefault(duplicate_key, []).append(startup_item[ENUM_JSK.ITEMNUMBER.value])
+
+    for duplicate_key, item_numbers in key_numbers.items():
+        if len(item_numbers) > 1:
+            duplicate_groups.append(item_numbers)
+
+        path_keys.setdefault(duplicate_key[0], []).append(duplicate_key)
+
+    # Only a FilePath with more than one key can have overlapping startup items
+    for duplicate_keys in path_keys.values():
+        if len(duplicate_keys) < 2:
+            continue
+
+        key_args = [set(duplicate_key[1]) for duplicate_key in duplicate_keys]
+        first_numbers = [key_numbers[duplicate_key][0] for duplicate_key in duplicate_keys]
+        arg_indexes = {}
+
+        for key_index, item_args in enumerate(key_args):
+            for item_arg in item_args:
+                arg_indexes.setdefault(item_arg, set()).add(key_index)
+
+        for key_index, item_args in enumerate(key_args):
+            if len(item_args) == 0:
+                # Launching the program without any arguments overlaps with every other startup item launching it
+                candidate_indexes = range(len(duplicate_keys))
+            else:
+                # Start from the argument the fewest startup items have, so the fewest sets are checked
+                arg_sets = sorted((arg_indexes[item_arg] for item_arg in item_args), key=len)
+                candidate_indexes = arg_sets[0].intersection(*arg_sets[1:])
+
+            # Startup items with the same arguments in a different order overlap with each other, so only the later one is counted
+            overlap_numbers = [
+                first_numbers[candidate_index]
+                for candidate_index in candidate_indexes
+                if not candidate_index == key_index
+                and (
+                    len(key_args[candidate_index]) > len(item_args)
+                    or first_numbers[candidate_index] < first_numbers[key_index]
+                )
+            ]
+
+            if len(overlap_numbers) > 0:
+                overlap_pairs.append((first_numbers[key_index], min(overlap_numbers)))
+
+    overlap_pairs.sort()
+
+    return (duplicate_groups, overlap_pairs)
+
+
+def duplicate_checker(startup_items):
+    """Function to check the startup items for duplicates and put together a report of any that were found
+
+    Args:
+        startup_items (iterable): The startup items, the same as for the function find_duplicates
+
+    Returns:
+        bool: True if there are any exact duplicates or overlapping startup items, False otherwise
+
+        str: The report from the function prettify_duplicate_report in the module cs_pretty, or a message that there are no duplicates
+
+        list: The groups of exact duplicates, as returned by the function find_duplicates
+    """
+    # The Names are only needed for the report
+    startup_items = [deps_model.model_to_json(startup_item) for startup_item in startup_items]
+    item_names = {
+        startup_item[ENUM_JSK.ITEMNUMBER.value]: startup_item[ENUM_JSK.NAME.value] for startup_item in startup_items
+    }
+
+    duplicate_groups, overlap_pairs = find_duplicates(startup_items)
+
+    has_duplicates = len(duplicate_groups) > 0 or len(overlap_pairs) > 0
+
+    if has_duplicates:
+        return_message = deps_pretty.prettify_duplicate_report(duplicate_groups, overlap_pairs, item_names)
+    else:
+        return_message = "No duplicate startup items were found"
+
+    return (has_duplicates, return_message, duplicate_groups)
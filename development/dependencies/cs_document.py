@@ -0,0 +1,381 @@
+# Dependency to store the persistent startup document, which is an immutable version of the full startup data where editing a single startup item doesn't copy the rest
+
+import dependencies.cs_enum as deps_enum
+
+ENUM_JSK = deps_enum.JsonSchemaKeys
+
+
+class DocumentNode:
+    """Class for one node of the tree that holds the startup items of a StartupDocument
+
+    The startup items are kept in a treap, which is a binary tree where each node also has a priority. The startup items are in order when the tree is read from left to right, and every node has a higher priority than the nodes below it. Since the priorities are random, the tree stays balanced, so any startup item can be reached in O(log n) steps.
+
+    Nodes are never changed once they are created. Changing a startup item creates new nodes for the path from the top of the tree down to that startup item, while every other node is shared with the original tree.
+
+    Attributes:
+        item (dict): The startup item, which must never be modified
+
+        left (DocumentNode): The subtree with the startup items that come before this one, or None
+
+        right (DocumentNode): The subtree with the startup items that come after this one, or None
+
+        size (int): The number of startup items in the subtree starting at this node
+
+        priority (float): The priority of this node
+    """
+
+    __slots__ = ("item", "left", "right", "size", "priority")
+
+    def __init__(self, item: dict, left, right, priority: float):
+        self.item = item
+        self.left = left
+        self.right = right
+        self.size = 1 + node_size(left) + node_size(right)
+        self.priority = priority
+
+
+def node_size(node: DocumentNode):
+    """Helper function to get the number of startup items in a subtree
+
+    Args:
+        node (DocumentNode): The top node of the subtree, or None for an empty subtree
+
+    Returns:
+        int: The number of startup items in the subtree
+    """
+    return node.size if node is not None else 0
+
+
+def node_builder(items_list: list, start: int, end: int, depth: int, max_depth: int, random_number):
+    """Helper function to build a balanced subtree from part of a list of startup items in O(n)
+
+    The priority of each node is random but always lower than the priorities of the level above it, so the result is a valid treap.
+
+    Args:
+        items_list (list): The startup items
+
+        start (int): The index of the first startup item in the subtree
+
+        end (int): The index after the last startup item in the subtree
+
+        depth (int): The level of the tree the subtree starts at, with the top being 0
+
+        max_depth (int): The deepest level the tree will have
+
+        random_number (function): The function that returns a random number from 0 up to but not including 1, such as random.random
+
+    Returns:
+        DocumentNode: The top node of the subtree, or None if it's empty
+    """
+    top_node = None
+
+    if start < end:
+        middle = (start + end) // 2
+        left = node_builder(items_list, start, middle, depth + 1, max_depth, random_number)
+        right = node_builder(items_list, middle + 1, end, depth + 1, max_depth, random_number)
+        priority = 1.0 - (depth + random_number()) / (max_depth + 1)
+        top_node = DocumentNode(items_list[middle], left, right, priority)
+
+    return top_node
+
+
+def node_splitter(node: DocumentNode, count: int):
+    """Helper function to split a subtree into the first 'count' startup items and the rest
+
+    Args:
+        node (DocumentNode): The top node of the subtree
+
+        count (int): How many startup items go into the first subtree
+
+    Returns:
+        tuple: The top nodes of the two new subtrees
+    """
+    if node is None:
+        return (None, None)
+
+    if node_size(node.left) >= count:
+        left, right = node_splitter(node.left, count)
+        return (left, DocumentNode(node.item, right, node.right, node.priority))
+
+    left, right = node_splitter(node.right, count - node_size(node.left) - 1)
+    return (DocumentNode(node.item, node.left, left, node.priority), right)
+
+
+def node_merger(left: DocumentNode, right: DocumentNode):
+    """Helper function to join two subtrees, with all the startup items of 'left' coming first
+
+    Args:
+        left (DocumentNode): The top node of the first subtree
+
+        right (DocumentNode): The top node of the second subtree
+
+    Returns:
+        DocumentNode: The top node of the joined subtree
+    """
+    if left is None:
+        return right
+    if right is None:
+        return left
+
+    if left.priority > right.priority:
+        return DocumentNode(left.item, left.left, node_merger(left.right, right), left.priority)
+
+    return DocumentNode(right.item, node_merger(left, right.left), right.right, right.priority)
+
+
+def node_replacer(node: DocumentNode, index: int, item: dict):
+    """Helper function to replace one startup item in a subtree, copying only the nodes on the path to it
+
+    Args:
+        node (DocumentNode): The top node of the subtree
+
+        index (int): The index of the startup item to replace within the subtree
+
+        item (dict): The new startup item
+
+    Returns:
+        DocumentNode: The top node of the new subtree
+    """
+    left_size = node_size(node.left)
+
+    if index < left_size:
+        return DocumentNode(
+            node.item, node_replacer(node.left, index, item), node.right, node.priority
+        )
+    if index > left_size:
+        return DocumentNode(
+            node.item, node.left, node_replacer(node.right, index - left_size - 1, item), node.priority
+        )
+
+    return DocumentNode(item, node.left, node.right, node.priority)
+
+
+def copy_startup_item(startup_item: dict, item_number: int = 0):
+    """Helper function to make a copy of a single startup item
+
+    Startup items only contain simple values apart from the ArgumentList and After arrays, so copying those lists as well gives a full copy without having to call the function deepcopy from the copy module.
+
+    Args:
+        startup_item (dict): The startup item to copy
+
+        item_number (int, optional): The ItemNumber to give the copy. Defaults to 0, which keeps the existing ItemNumber.
+
+    Returns:
+        dict: The copy of the startup item
+    """
+    new_item = dict(startup_item)
+
+    if ENUM_JSK.ARGUMENTLIST.value in new_item:
+        new_item[ENUM_JSK.ARGUMENTLIST.value] = list(new_item[ENUM_JSK.ARGUMENTLIST.value])
+
+    if ENUM_JSK.AFTER.value in new_item:
+        new_item[ENUM_JSK.AFTER.value] = list(new_item[ENUM_JSK.AFTER.value])
+
+    if item_number > 0:
+        new_item[ENUM_JSK.ITEMNUMBER.value] = item_number
+
+    return new_item
+
+
+def copy_startup_data(json_data: dict):
+    """Helper function to make a copy of the full startup data
+
+    Each startup item is copied with the function copy_startup_item. The only other key with a value that can be changed is the LaunchPolicy object, which only contains simple values, so a copy of that object is enough.
+
+    Args:
+        json_data (dict): The full startup data to copy
+
+    Returns:
+        dict: The copy of the startup data, which can be modified freely
+    """
+    new_json_data = {
+        key: dict(value) if isinstance(value, dict) else value for key, value in json_data.items()
+    }
+
+    if ENUM_JSK.ITEMS.value in new_json_data:
+        new_json_data[ENUM_JSK.ITEMS.value] = [
+            copy_startup_item(startup_item) for startup_item in json_data[ENUM_JSK.ITEMS.value]
+        ]
+
+    return new_json_data
+
+
+class StartupDocument:
+    """Class for a persistent, or immutable, version of the full startup data
+
+    A StartupDocument is never changed. Adding, deleting or replacing a startup item returns a new StartupDocument that shares everything but the changed path of the tree with the original one, so the change costs O(log n) time and memory instead of copying all the startup data. This means a StartupDocument can be passed around and kept, such as in the document cache, without ever having to be copied.
+
+    The ItemNumber of each startup item always comes from its position, so deleting a startup item doesn't have to update every startup item after it.
+
+    A StartupDocument must only be created from startup data that has already been validated, and startup items must be validated before they are added or replaced. The function generate_user_edited_data in the module cs_data_generate takes care of the latter.
+
+    Attributes:
+        root (DocumentNode): The top node of the tree of startup items, or None if there are none
+
+        other_data (dict): Any other keys of the startup data besides TotalItems and Items, which must never be modified
+    """
+
+    __slots__ = ("root", "other_data")
+
+    def __init__(self, root: DocumentNode = None, other_data: dict = {}):
+        self.root = root
+        self.other_data = other_data
+
+    @classmethod
+    def from_json(cls, json_data: dict):
+        """Function to create a StartupDocument from startup data in O(n)
+
+        Args:
+            json_data (dict): The full startup data, which must already be validated. It is copied, so it can still be modified afterwards.
+
+        Returns:
+            StartupDocument: The new StartupDocument
+        """
+        items_list = [
+            copy_startup_item(startup_item) for startup_item in json_data[ENUM_JSK.ITEMS.value]
+        ]
+        other_data = {
+            key: value
+            for key, value in json_data.items()
+            if key not in (ENUM_JSK.TOTALITEMS.value, ENUM_JSK.ITEMS.value)
+        }
+
+        # random is only needed once a StartupDocument is built
+        import random
+
+        root = node_builder(items_list, 0, len(items_list), 0, len(items_list).bit_length(), random.random)
+
+        return cls(root, other_data)
+
+    def to_json(self):
+        """Function to turn the StartupDocument back into startup data
+
+        Returns:
+            dict: A new dictionary with the full startup data, which can be modified freely
+        """
+        json_data = {
+            ENUM_JSK.TOTALITEMS.value: self.total_items(),
+            ENUM_JSK.ITEMS.value: list(self.iter_items()),
+        }
+        json_data.update(self.other_data)
+
+        return json_data
+
+    def total_items(self):
+        """Function to get the number of startup items
+
+        Returns:
+            int: The number of startup items
+        """
+        return node_size(self.root)
+
+    def get_item(self, item_number: int):
+        """Function to get a copy of a single startup item in O(log n)
+
+        Args:
+            item_number (int): The ItemNumber of the startup item
+
+        Returns:
+            dict: A copy of the startup item, which can be modified freely
+
+        Raises:
+            IndexError: If there is no startup item with that ItemNumber
+        """
+        if item_number not in range(1, self.total_items() + 1):
+            raise IndexError(f"There is no startup item {item_number}")
+
+        node = self.root
+        index = item_number - 1
+
+        while True:
+            left_size = node_size(node.left)
+
+            if index < left_size:
+                node = node.left
+            elif index > left_size:
+                index -= left_size + 1
+                node = node.right
+            else:
+                return copy_startup_item(node.item, item_number)
+
+    def iter_items(self):
+        """Function to go through copies of all the startup items in order
+
+        Yields:
+            dict: A copy of each startup item, which can be modified freely
+        """
+        node_stack = []
+        node = self.root
+        item_number = 0
+
+        while node_stack or node is not None:
+            if node is not None:
+                node_stack.append(node)
+                node = node.left
+            else:
+                node = node_stack.pop()
+                item_number += 1
+                yield copy_startup_item(node.item, item_number)
+                node = node.right
+
+    def add_item(self, startup_item: dict):
+        """Function to add a startup item to the end in O(log n)
+
+        Args:
+            startup_item (dict): The startup item, which must already be validated. It is copied, so it can still be modified afterwards.
+
+        Returns:
+            StartupDocument: A new StartupDocument with the startup item added
+        """
+        import random
+
+        new_node = DocumentNode(
+            copy_startup_item(startup_item, self.total_items() + 1), None, None, random.random()
+        )
+
+        return StartupDocument(node_merger(self.root, new_node), self.other_data)
+
+    def replace_item(self, item_number: int, startup_item: dict):
+        """Function to replace a startup item in O(log n)
+
+        Args:
+            item_number (int): The ItemNumber of the startup item to replace
+
+            startup_item (dict): The new startup item, which must already be validated. It is copied, so it can still be modified afterwards.
+
+        Returns:
+            StartupDocument: A new StartupDocument with the startup item replaced
+
+        Raises:
+            IndexError: If there is no startup item with that ItemNumber
+        """
+        if item_number not in range(1, self.total_items() + 1):
+            raise IndexError(f"There is no startup item {item_number}")
+
+        new_root = node_replacer(
+            self.root, item_number - 1, copy_startup_item(startup_item, item_number)
+        )
+
+        return StartupDocument(new_root, self.other_data)
+
+    def delete_item(self, item_number: int):
+        """Function to delete a startup item in O(log n)
+
+        Every startup item after the deleted one moves up one position, which also updates its ItemNumber.
+
+        Args:
+            item_number (int): The ItemNumber of the startup item to delete
+
+        Returns:
+            StartupDocument: A new StartupDocument without the startup item
+
+        Raises:
+            IndexError: If there is no startup item with that ItemNumber
+        """
+        if item_number not in range(1, self.total_items() + 1):
+            raise IndexError(f"There is no startup item {item_number}")
+
+        left, rest = node_splitter(self.root, item_number - 1)
+        deleted, right = node_splitter(rest, 1)
+
+        return StartupDocument(node_merger(left, right), self.other_data)
@@ -40,6 +40,10 @@ class JsonSchemaKeys(Enum):
     BROWSER = "Browser"
     ARGUMENTCOUNT = "ArgumentCount"
     ARGUMENTLIST = "ArgumentList"
+    PRIORITY = "Priority"
+    AFTER = "After"
+    SEPARATELAUNCH = "SeparateLaunch"
+    LAUNCHPOLICY = "LaunchPolicy"
 
 
 class ItemTypeVals(Enum):
@@ -63,3 +67,114 @@ class ItemTypeVals(Enum):
     DELETE = "D"
     REPLACE = "R"
     FULL = "F"
+
+
+class WriteDurabilityVals(Enum):
+    """Enum class for valid values for the write_durability variable
+
+    This class will be used to define valid values for the write_durability variable in CompStart.py. This variable tells the function atomic_writer in the module cs_atomic how much care to take when writing the startup file to disk, trading write latency against what survives a crash or power loss.
+
+    Args:
+        Enum: This class extends the Enum class from the enum module
+
+    Members:
+        The legally valid values for the write_durability variable:
+
+        DIRECT = overwrite the file in place, which is how the file was always written before; a crash can leave a truncated file
+        ATOMIC = write a temporary file and rename it into place, so the file is always either the old or the new version while the computer is running
+        DURABLE = like ATOMIC, but also flush the temporary file and the folder to disk before returning, so the new version survives a crash or power loss
+        GROUP = like ATOMIC, but the flushes to disk for all the writes made within the group commit window are done together once the window has passed
+    """
+
+    DIRECT = "direct"
+    ATOMIC = "atomic"
+    DURABLE = "durable"
+    GROUP = "group"
+
+
+class ReportFormatVals(Enum):
+    """Enum class for valid values for the export_format variable
+
+    This class will be used to define valid values for the export_format variable. This variable is a parameter used by the function report_exporter in the module cs_timing to decide what kind of file the slowest items report is saved as.
+
+    Args:
+        Enum: This class extends the Enum class from the enum module
+
+    Members:
+        The legally valid values for the export_format variable:
+
+        CSV = a comma-separated values file, which can be opened in a spreadsheet program
+        JSON = a JSON file with the same keys as the report rows
+    """
+
+    CSV = "csv"
+    JSON = "json"
+
+
+class BatchActionVals(Enum):
+    """Enum class for valid values for the Action key of a batch operation
+
+    This class will be used to define valid values for the Action key of each operation in an operations file. The operations file is read in by the function batch_runner in the module cs_batch, which applies all the operations to the startup data at once without any menus.
+
+    Args:
+        Enum: This class extends the Enum class from the enum module
+
+    Members:
+        The legally valid values for the Action key:
+
+        ADD = add a startup item to the end of the startup data
+        DELETE = delete a startup item
+        REPLACE = replace a startup item with a new one
+        SET = change a single key of a startup item
+    """
+
+    ADD = "add"
+    DELETE = "delete"
+    REPLACE = "replace"
+    SET = "set"
+
+
+class SearchMatchVals(Enum):
+    """Enum class for valid values for the match_type variable
+
+    This class will be used to define valid values for the match_type variable. This variable is a parameter used by the function search in the class StartupIndex from the module cs_index to decide how the text searched for has to match the Name, FilePath, Description or an argument of a startup item. Upper and lower case letters always match each other.
+
+    Args:
+        Enum: This class extends the Enum class from the enum module
+
+    Members:
+        The legally valid values for the match_type variable:
+
+        EXACT = the whole value is the text searched for
+        PREFIX = the value starts with the text searched for
+        CONTAINS = the text searched for is anywhere in the value
+    """
+
+    EXACT = "exact"
+    PREFIX = "prefix"
+    CONTAINS = "contains"
+
+
+class PreflightStatusVals(Enum):
+    """Enum class for valid values for the status of a checked FilePath
+
+    This class will be used to define valid values for the Status key of each preflight result. The preflight results are returned by the function preflight_checker in the module cs_preflight, which checks that the FilePath of every startup item can be launched before the next login finds out the hard way.
+
+    Args:
+        Enum: This class extends the Enum class from the enum module
+
+    Members:
+        The legally valid values for the Status key:
+
+        OK = the FilePath is a program that can be launched
+        MISSING = there is nothing at the FilePath
+        NOT_FILE = the FilePath is a folder instead of a file
+        NOT_EXECUTABLE = the FilePath is a file, but not one that can be run as a program
+        INACCESSIBLE = the FilePath or the folder it's in couldn't be checked, such as when permission is denied or a network drive isn't connected
+    """
+
+    OK = "ok"
+    MISSING = "missing"
+    NOT_FILE = "not a file"
+    NOT_EXECUTABLE = "not executable"
+    INACCESSIBLE = "inaccessible"
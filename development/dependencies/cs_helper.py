@@ -1,15 +1,21 @@
 # Dependency to store miscellaneous helper functions that don't fit anywhere else
 
-import os, jsonschema
+import os
 
 import dependencies.cs_pretty as deps_pretty
 import dependencies.cs_jsonfn as deps_json
 import dependencies.cs_enum as deps_enum
 import dependencies.cs_desc as deps_desc
-import CompStart as app_cs
+import dependencies.cs_model as deps_model
+import dependencies.cs_schedule as deps_schedule
 
+ENUM_JSK = deps_enum.JsonSchemaKeys
 ENUM_ITV = deps_enum.ItemTypeVals
 
+# Registry of compiled JSON schema validators with the full path to the schema file as the key and
+# a tuple of the (modification time, size) of the schema file and the compiled validator as the value
+VALIDATOR_REGISTRY = {}
+
 
 def set_start_dir(dir_name: str):
     """Small helper function to set the starting directory
@@ -81,6 +87,19 @@ def set_start_dir(dir_name: str):
     return ret_value
 
 
+def get_app_module():
+    """Small helper function to get the CompStart module, which holds the global variables for the tool
+
+    CompStart.py imports this module, so importing CompStart.py at the top of this module as well would mean each one has to wait on the other to load. Instead, it's only imported the first time one of the global variables is needed, by which point it has already been loaded.
+
+    Returns:
+        module: The comp_start module
+    """
+    import CompStart as app_cs
+
+    return app_cs
+
+
 def is_production():
     """Small helper function to return the variable is_prod.
 
@@ -89,7 +108,90 @@ def is_production():
     Returns:
         bool: The variable is_prod from the comp_start module. This variable will be False when in testing and True otherwise.
     """
-    return app_cs.is_prod
+    return get_app_module().is_prod
+
+
+def is_journal_mode():
+    """Small helper function to return the variable use_journal.
+
+    This is used by the functions that save startup data to decide whether single startup item changes should be appended to the journal instead of rewriting the whole startup file.
+
+    Returns:
+        bool: The variable use_journal from the comp_start module.
+    """
+    return get_app_module().use_journal
+
+
+def get_journal_threshold():
+    """Small helper function to return the variable journal_threshold.
+
+    Returns:
+        int: The variable journal_threshold from the comp_start module. This is the number of journal records that can build up before they are folded back into the startup file.
+    """
+    return get_app_module().journal_threshold
+
+
+def get_write_durability():
+    """Small helper function to return the variable write_durability.
+
+    Returns:
+        str: The variable write_durability from the comp_start module. This is one of the values of the Enum class WriteDurabilityVals and tells the function atomic_writer in the module cs_atomic how to write the startup file.
+    """
+    return get_app_module().write_durability
+
+
+def get_group_commit_window():
+    """Small helper function to return the variable group_commit_window.
+
+    Returns:
+        float: The variable group_commit_window from the comp_start module. This is the number of seconds that writes can wait to be flushed to disk together when the write durability is set to group.
+    """
+    return get_app_module().group_commit_window
+
+
+def get_launch_workers():
+    """Small helper function to return the variable launch_workers.
+
+    Returns:
+        int: The variable launch_workers from the comp_start module. This is the most startup items the function launch_startup_items in the module cs_launch starts at the same time.
+    """
+    return get_app_module().launch_workers
+
+
+def get_launch_ready_timeout():
+    """Small helper function to return the variable launch_ready_timeout.
+
+    Returns:
+        float: The variable launch_ready_timeout from the comp_start module. This is the most seconds the function launch_startup_item in the module cs_launch waits for a started program to be ready, or 0 to not wait.
+    """
+    return get_app_module().launch_ready_timeout
+
+
+def get_launch_history_runs():
+    """Small helper function to return the variable launch_history_runs.
+
+    Returns:
+        int: The variable launch_history_runs from the comp_start module. This is the number of launches kept in the launch history file by the module cs_timing.
+    """
+    return get_app_module().launch_history_runs
+
+
+def get_preflight_workers():
+    """Small helper function to return the variable preflight_workers.
+
+    Returns:
+        int: The variable preflight_workers from the comp_start module. This is the most folders the function preflight_checker in the module cs_preflight checks at the same time.
+    """
+    return get_app_module().preflight_workers
+
+
+def is_preflight_on_save():
+    """Small helper function to return the variable preflight_on_save.
+
+    Returns:
+        bool: The variable preflight_on_save from the comp_start module. This tells the function json_saver in the module cs_jsonfn whether to check every FilePath when the startup data is saved.
+    """
+    return get_app_module().preflight_on_save
 
 
 def program_info():
@@ -166,30 +268,43 @@ def check_overwrite(json_file: str):
 def json_data_validator(json_data: dict, single_item: bool = False):
     """Helper function to validate startup JSON data, including both full data and a single startup item, against the JSON Schema defined in startup_data.schema.json or startup_item.schema.json, depending on what needs to be validated.
 
+    The compiled validator for each schema is kept in the validator registry, so the schema file is only read in and compiled again when it has changed on disk. See the function get_schema_validator for more information.
+
+    Full startup data is also checked for startup items whose After keys depend on each other in a loop, which the JSON schema can't describe. See the function launch_cycle_validator in the module cs_schedule for more information.
+
     Args:
-        json_data (dict): The JSON data to validate
+        json_data (dict): The JSON data to validate. This can also be a StartupItem, StartupData or StartupDocument.
 
         single_item (bool): A boolean to specify whether to validate a single startup item or consider json_data to be the full startup data. Optional and is False by default.
 
     Returns:
         bool: True if the validation was successful, False otherwise
     """
-    valid_json = False
-    schema_file = (
-        "startup_item.schema.json" if single_item else "startup_data.schema.json"
-    )
-    schema_path = get_prod_path()
-    schema_path.extend(["schema"])
+    # jsonschema takes longer to load than the rest of the tool put together, so it's only imported the first time startup data is validated
+    import jsonschema
 
-    results = deps_json.json_reader(schema_path, schema_file, True)
-    read_status = results[0]
+    valid_json = False
+    json_data = deps_model.model_to_json(json_data)
 
-    if read_status:
-        json_schema = results[2]
+    schema_validator = get_schema_validator(single_item)
 
+    if schema_validator is not None:
         try:
-            jsonschema.validate(json_data, json_schema)
+            # Raise the most relevant error the same way jsonschema.validate does
+            validation_error = jsonschema.exceptions.best_match(
+                schema_validator.iter_errors(json_data)
+            )
+            if validation_error is not None:
+                raise validation_error
+
+            # Startup items that wait for each other in a loop could never be launched
             valid_json = True
+            if not single_item:
+                valid_json, err_msg = deps_schedule.launch_cycle_validator(
+                    json_data[ENUM_JSK.ITEMS.value]
+                )
+                if not valid_json:
+                    deps_pretty.prettify_custom_error(err_msg, "json_data_validator")
         except Exception as error:
             err_msg = deps_pretty.prettify_io_error(error)
             deps_pretty.prettify_custom_error(err_msg, "json_data_validator")
@@ -200,6 +315,127 @@ def json_data_validator(json_data: dict, single_item: bool = False):
     return valid_json
 
 
+def get_schema_validator(single_item: bool = False):
+    """Helper function to get the compiled validator for one of the JSON schema files
+
+    Building a validator means reading in the schema file, checking the schema itself and creating a validator class for it, which is much slower than the actual validation for most startup data. Each compiled validator is therefore stored in the VALIDATOR_REGISTRY dictionary, keyed by the full path to the schema file, together with the modification time and size of that file. The schema file is only read in and compiled again when either of those changes.
+
+    Args:
+        single_item (bool): A boolean to specify whether to return the validator for a single startup item or for the full startup data. Optional and is False by default.
+
+    Returns:
+        jsonschema.protocols.Validator: The compiled validator for the schema file, or None if the schema file couldn't be read in or compiled
+    """
+    import jsonschema
+
+    # Initialize function variables
+    schema_validator = None
+    schema_file = "startup_item.schema.json" if single_item else "startup_data.schema.json"
+    schema_path = get_prod_path()
+    schema_path.extend(["schema"])
+    full_schema_file = parse_full_path(schema_path, schema_file)
+
+    # Get the current modification time and size of the schema file
+    try:
+        file_stats = os.stat(full_schema_file)
+        schema_stamp = (file_stats.st_mtime_ns, file_stats.st_size)
+    except OSError:
+        schema_stamp = None
+
+    registry_entry = VALIDATOR_REGISTRY.get(full_schema_file)
+
+    if schema_stamp is not None and registry_entry is not None and registry_entry[0] == schema_stamp:
+        # The schema file hasn't changed so use the validator already compiled
+        schema_validator = registry_entry[1]
+    else:
+        # Remove any outdated validator before reading in the schema file again
+        VALIDATOR_REGISTRY.pop(full_schema_file, None)
+
+        results = deps_json.json_reader(schema_path, schema_file, True)
+        read_status = results[0]
+
+        if read_status:
+            json_schema = results[2]
+
+            try:
+                validator_class = jsonschema.validators.validator_for(json_schema)
+                validator_class.check_schema(json_schema)
+
+                # Swap in a uniqueItems check that doesn't compare every pair of startup items
+                validator_class = jsonschema.validators.extend(
+                    validator_class, {"uniqueItems": unique_items_checker}
+                )
+                schema_validator = validator_class(json_schema)
+
+                if schema_stamp is not None:
+                    VALIDATOR_REGISTRY[full_schema_file] = (schema_stamp, schema_validator)
+            except Exception as error:
+                err_msg = deps_pretty.prettify_io_error(error)
+                deps_pretty.prettify_custom_error(err_msg, "get_schema_validator")
+
+    return schema_validator
+
+
+def unique_items_checker(validator, unique_items: bool, instance, schema: dict):
+    """Helper function to check the JSON Schema keyword uniqueItems for the validators in the validator registry
+
+    The check that comes with jsonschema compares every pair of items in an array whose items can't be sorted, which is always the case for the Items array of the startup data. This check instead converts each item into a hashable value with the function make_hashable_json and finds any duplicate in a single pass.
+
+    Args:
+        validator (jsonschema.protocols.Validator): The validator the check is running for
+
+        unique_items (bool): The value of the uniqueItems keyword in the schema
+
+        instance: The JSON data the keyword applies to
+
+        schema (dict): The schema, or subschema, containing the keyword
+
+    Yields:
+        jsonschema.exceptions.ValidationError: An error if the array contains duplicate items
+    """
+    import jsonschema
+
+    if unique_items and validator.is_type(instance, "array"):
+        seen_items = set()
+
+        for item in instance:
+            hashable_item = make_hashable_json(item)
+
+            if hashable_item in seen_items:
+                yield jsonschema.exceptions.ValidationError(f"{instance!r} has non-unique elements")
+                break
+
+            seen_items.add(hashable_item)
+
+
+def make_hashable_json(json_value):
+    """Helper function to convert a JSON value into a hashable Python value
+
+    Two JSON values convert to equal Python values only when they are equal by JSON Schema rules. For example, 1 and 1.0 are equal but 1 and true are not.
+
+    Args:
+        json_value: Any JSON value, such as a startup item
+
+    Returns:
+        tuple: A hashable value representing json_value
+    """
+    if isinstance(json_value, dict):
+        hashable_value = (
+            "object",
+            frozenset((key, make_hashable_json(value)) for key, value in json_value.items()),
+        )
+    elif isinstance(json_value, list):
+        hashable_value = ("array", tuple(make_hashable_json(value) for value in json_value))
+    elif isinstance(json_value, bool):
+        hashable_value = ("boolean", json_value)
+    elif isinstance(json_value, (int, float)):
+        hashable_value = ("number", json_value)
+    else:
+        hashable_value = (type(json_value).__name__, json_value)
+
+    return hashable_value
+
+
 def get_prod_path():
     """Helper function to get a starting location based on the production environment.
 
@@ -256,15 +492,16 @@ def get_count_total_items():
     """
     # Initialize variables
     total_items = 0
-    startup_data = {}
 
-    # Grab the existing startup data
+    # Grab the existing startup data as a StartupDocument, which uses the document cache without copying anything
     file_path = get_prod_path()
     file_name = get_startup_filename(default_json=False)
-    return_data = deps_json.json_reader(file_path, file_name)
+    read_success, return_message, startup_document = deps_json.document_reader(
+        file_path, file_name
+    )
 
-    startup_data = return_data[2]
-    total_items = startup_data["TotalItems"]
+    if read_success:
+        total_items = startup_document.total_items()
 
     return total_items
 
@@ -0,0 +1,309 @@
+# Dependency to store the search index over the startup items, which finds startup items by their Name, FilePath, Description or arguments without going through all of them
+
+import bisect, heapq
+
+import dependencies.cs_enum as deps_enum
+import dependencies.cs_model as deps_model
+
+ENUM_JSK = deps_enum.JsonSchemaKeys
+ENUM_ITV = deps_enum.ItemTypeVals
+ENUM_SMV = deps_enum.SearchMatchVals
+
+# The search index of the last StartupDocument searched, so the index is only built once for each StartupDocument and can be kept up to date as the startup data is edited
+# Index: the StartupIndex, or None if nothing has been searched yet
+INDEX_CACHE = {"Index": None}
+
+# How many characters are in each piece of text the values are broken up into for CONTAINS searches
+TRIGRAM_LENGTH = 3
+
+
+def get_item_values(startup_item: dict):
+    """Helper function to get the values of a startup item that can be searched for
+
+    Args:
+        startup_item (dict): The startup item. This can also be a StartupItem.
+
+    Returns:
+        set: The Name, FilePath, Description and each argument of the startup item that isn't blank, in lower case
+    """
+    startup_item = deps_model.model_to_json(startup_item)
+
+    item_values = {
+        startup_item[ENUM_JSK.NAME.value],
+        startup_item[ENUM_JSK.FILEPATH.value],
+        startup_item[ENUM_JSK.DESCRIPTION.value],
+    }
+    item_values.update(startup_item[ENUM_JSK.ARGUMENTLIST.value])
+
+    return {item_value.casefold() for item_value in item_values if item_value}
+
+
+def get_trigrams(text: str):
+    """Helper function to break up text into every piece of TRIGRAM_LENGTH characters in it
+
+    Args:
+        text (str): The text
+
+    Returns:
+        set: The pieces of text, which is empty if the text is shorter than TRIGRAM_LENGTH
+    """
+    return {text[text_index : text_index + TRIGRAM_LENGTH] for text_index in range(len(text) - TRIGRAM_LENGTH + 1)}
+
+
+class StartupIndex:
+    """Class for the search index over the startup items of a StartupDocument
+
+    Many startup items share the same values, such as the FilePath of a browser, so the index is built over the distinct values instead of over each startup item. There are three ways into the distinct values, one for each match type of the Enum class SearchMatchVals:
+        EXACT: the dictionary value_keys has each distinct value as a key
+        PREFIX: the list sorted_values has the distinct values in order, so the ones starting with some text are next to each other
+        CONTAINS: the dictionary trigram_values has every piece of TRIGRAM_LENGTH characters in the distinct values, with the distinct values it's in. The distinct values with all the pieces of the text searched for are the only ones that can contain it. Breaking up every distinct value takes much longer than the rest of building the index, so it's only done the first time a CONTAINS search needs it.
+
+    Each startup item has a key that never changes, even when the startup items before it are deleted, so deleting a startup item only has to update the index for that startup item. The keys are given out in increasing order as startup items are added to the end, so the position of a key in the sorted list item_keys is the position of the startup item.
+
+    Attributes:
+        document (StartupDocument): The StartupDocument the index is up to date with
+
+        item_keys (list): The key of each startup item, in the order of the startup items
+
+        item_values (dict): The values of each startup item, as returned by get_item_values, by key
+
+        value_keys (dict): The keys of the startup items with each distinct value, by distinct value
+
+        sorted_values (list): The distinct values in order
+
+        trigram_values (dict): The distinct values with each piece of TRIGRAM_LENGTH characters in them, by piece, or None if no CONTAINS search has needed it yet
+
+        next_key (int): The key of the next startup item added
+    """
+
+    __slots__ = ("document", "item_keys", "item_values", "value_keys", "sorted_values", "trigram_values", "next_key")
+
+    def __init__(self, json_document):
+        self.document = json_document
+        self.item_keys = []
+        self.item_values = {}
+        self.value_keys = {}
+        self.sorted_values = []
+        self.trigram_values = None
+        self.next_key = 0
+
+        # Gather all the values first, so the distinct values only have to be sorted once
+        for startup_item in json_document.iter_items():
+            item_key = self.next_key
+            self.next_key += 1
+            self.item_keys.append(item_key)
+            self.item_values[item_key] = get_item_values(startup_item)
+
+            for item_value in self.item_values[item_key]:
+                self.value_keys.setdefault(item_value, set()).add(item_key)
+
+        self.sorted_values = sorted(self.value_keys)
+
+    def trigram_builder(self):
+        """Function to break up every distinct value into pieces of TRIGRAM_LENGTH characters for CONTAINS searches, if that hasn't been done yet"""
+        if self.trigram_values is None:
+            self.trigram_values = {}
+
+            for item_value in self.sorted_values:
+                for trigram in get_trigrams(item_value):
+                    self.trigram_values.setdefault(trigram, set()).add(item_value)
+
+    def value_adder(self, item_value: str, item_key: int):
+        """Function to add a value of a startup item to the index
+
+        Args:
+            item_value (str): The value, in lower case
+
+            item_key (int): The key of the startup item
+        """
+        if item_value not in self.value_keys:
+            self.value_keys[item_value] = set()
+            bisect.insort(self.sorted_values, item_value)
+
+            if self.trigram_values is not None:
+                for trigram in get_trigrams(item_value):
+                    self.trigram_values.setdefault(trigram, set()).add(item_value)
+
+        self.value_keys[item_value].add(item_key)
+
+    def value_remover(self, item_value: str, item_key: int):
+        """Function to remove a value of a startup item from the index
+
+        Args:
+            item_value (str): The value, in lower case
+
+            item_key (int): The key of the startup item
+        """
+        value_keys = self.value_keys[item_value]
+        value_keys.discard(item_key)
+
+        # A value that no startup item has anymore is taken out of the index completely
+        if len(value_keys) == 0:
+            del self.value_keys[item_value]
+            del self.sorted_values[bisect.bisect_left(self.sorted_values, item_value)]
+
+            if self.trigram_values is not None:
+                for trigram in get_trigrams(item_value):
+                    trigram_values = self.trigram_values[trigram]
+                    trigram_values.discard(item_value)
+
+                    if len(trigram_values) == 0:
+                        del self.trigram_values[trigram]
+
+    def add_item(self, startup_item: dict):
+        """Function to add a startup item that was added to the end of the startup data
+
+        Args:
+            startup_item (dict): The startup item. This can also be a StartupItem.
+        """
+        item_key = self.next_key
+        self.next_key += 1
+        self.item_keys.append(item_key)
+        self.item_values[item_key] = get_item_values(startup_item)
+
+        for item_value in self.item_values[item_key]:
+            self.value_adder(item_value, item_key)
+
+    def replace_item(self, item_number: int, startup_item: dict):
+        """Function to update the index for a startup item that was replaced
+
+        Args:
+            item_number (int): The ItemNumber of the startup item
+
+            startup_item (dict): The new startup item. This can also be a StartupItem.
+        """
+        item_key = self.item_keys[item_number - 1]
+        old_values = self.item_values[item_key]
+        new_values = get_item_values(startup_item)
+
+        # Only the values that changed have to be updated
+        for item_value in old_values - new_values:
+            self.value_remover(item_value, item_key)
+
+        for item_value in new_values - old_values:
+            self.value_adder(item_value, item_key)
+
+        self.item_values[item_key] = new_values
+
+    def delete_item(self, item_number: int):
+        """Function to take a startup item that was deleted out of the index
+
+        Args:
+            item_number (int): The ItemNumber the startup item had
+        """
+        item_key = self.item_keys.pop(item_number - 1)
+
+        for item_value in self.item_values.pop(item_key):
+            self.value_remover(item_value, item_key)
+
+    def search(self, search_text: str, match_type: str = ENUM_SMV.CONTAINS.value, max_results: int = 0):
+        """Function to find the startup items with a Name, FilePath, Description or argument that matches some text
+
+        Upper and lower case letters match each other. Text shorter than TRIGRAM_LENGTH can't be broken up into pieces, so a CONTAINS search for it checks every distinct value instead.
+
+        Args:
+            search_text (str): The text to search for
+
+            match_type (str, optional): One of the values of the Enum class SearchMatchVals. Defaults to CONTAINS.
+
+            max_results (int, optional): The most ItemNumbers to return, or 0 to return all of them. Defaults to 0.
+
+        Returns:
+            list: The ItemNumbers of the matching startup items, in order
+        """
+        # Initialize function variables
+        matched_values = []
+        search_text = search_text.casefold()
+
+        if search_text:
+            match match_type:
+                case ENUM_SMV.EXACT.value:
+                    if search_text in self.value_keys:
+                        matched_values.append(search_text)
+                case ENUM_SMV.PREFIX.value:
+                    value_index = bisect.bisect_left(self.sorted_values, search_text)
+
+                    while value_index < len(self.sorted_values) and self.sorted_values[value_index].startswith(search_text):
+                        matched_values.append(self.sorted_values[value_index])
+                        value_index += 1
+                case ENUM_SMV.CONTAINS.value:
+                    search_trigrams = get_trigrams(search_text)
+
+                    if len(search_trigrams) > 0:
+                        self.trigram_builder()
+
+                    if len(search_trigrams) == 0:
+                        candidate_values = self.sorted_values
+                    elif search_trigrams.issubset(self.trigram_values):
+                        # Start from the piece in the fewest distinct values, so the fewest values are checked
+                        trigram_sets = sorted(
+                            (self.trigram_values[trigram] for trigram in search_trigrams), key=len
+                        )
+                        candidate_values = trigram_sets[0].intersection(*trigram_sets[1:])
+                    else:
+                        candidate_values = []
+
+                    # Having all the pieces doesn't mean they're next to each other in the right order
+                    matched_values = [item_value for item_value in candidate_values if search_text in item_value]
+
+        # Get the startup items with any of the matching values
+        matched_keys = set()
+        for item_value in matched_values:
+            matched_keys.update(self.value_keys[item_value])
+
+        if max_results > 0:
+            matched_keys = heapq.nsmallest(max_results, matched_keys)
+        else:
+            matched_keys = sorted(matched_keys)
+
+        return [bisect.bisect_left(self.item_keys, item_key) + 1 for item_key in matched_keys]
+
+
+def get_startup_index(json_document):
+    """Helper function to get the search index for a StartupDocument, building it if it isn't already in the index cache
+
+    Args:
+        json_document (StartupDocument): The startup data
+
+    Returns:
+        StartupIndex: The search index, which is up to date with json_document
+    """
+    startup_index = INDEX_CACHE["Index"]
+
+    if startup_index is None or startup_index.document is not json_document:
+        startup_index = StartupIndex(json_document)
+        INDEX_CACHE["Index"] = startup_index
+
+    return startup_index
+
+
+def index_updater(old_document, new_document, item_type: str, item_number: int = 0):
+    """Helper function to keep the search index up to date when a startup item of a StartupDocument is added, replaced or deleted
+
+    The search index is only updated if it's up to date with the StartupDocument before the change. Otherwise nothing is done, and the search index is built for the new StartupDocument if it's ever searched.
+
+    Args:
+        old_document (StartupDocument): The startup data before the change
+
+        new_document (StartupDocument): The startup data after the change
+
+        item_type (str): One of the values ADD, DELETE or REPLACE of the Enum class ItemTypeVals. For ADD, every startup item in new_document after the last one in old_document is added. Any other value, such as FULL for changes to several startup items at once, drops the search index so it's built again the next time it's needed.
+
+        item_number (int, optional): The ItemNumber of the startup item that was deleted or replaced. Defaults to 0.
+    """
+    startup_index = INDEX_CACHE["Index"]
+
+    if startup_index is not None and startup_index.document is old_document:
+        match item_type:
+            case ENUM_ITV.ADD.value:
+                for added_number in range(old_document.total_items() + 1, new_document.total_items() + 1):
+                    startup_index.add_item(new_document.get_item(added_number))
+            case ENUM_ITV.DELETE.value:
+                startup_index.delete_item(item_number)
+            case ENUM_ITV.REPLACE.value:
+                startup_index.replace_item(item_number, new_document.get_item(item_number))
+            case _:
+                # The change isn't known, so the search index is built again the next time it's needed
+                INDEX_CACHE["Index"] = None
+
+        startup_index.document = new_document
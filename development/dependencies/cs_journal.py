@@ -0,0 +1,414 @@
+# Dependency to store the helper functions for the journaled storage mode, where single startup item changes are appended to a sidecar journal file instead of rewriting the whole startup file
+
+import json, os
+
+import dependencies.cs_helper as deps_helper
+import dependencies.cs_jsonfn as deps_json
+import dependencies.cs_pretty as deps_pretty
+import dependencies.cs_cache as deps_cache
+import dependencies.cs_enum as deps_enum
+import dependencies.cs_atomic as deps_atomic
+import dependencies.cs_plan as deps_plan
+
+ENUM_JSK = deps_enum.JsonSchemaKeys
+ENUM_ITV = deps_enum.ItemTypeVals
+
+# The extension added to the full path of the startup file to get the full path of its journal file
+JOURNAL_EXTENSION = ".journal"
+STALE_JOURNAL_EXTENSION = ".stale"
+
+
+def get_journal_file(json_file: str):
+    """Helper function to get the full path of the journal file for a startup file
+
+    Args:
+        json_file (str): The full absolute path of the startup file including filename and extension
+
+    Returns:
+        str: The full absolute path of the journal file
+    """
+    return json_file + JOURNAL_EXTENSION
+
+
+def journal_exists(json_file: str):
+    """Helper function to check if a startup file has a journal file
+
+    Args:
+        json_file (str): The full absolute path of the startup file including filename and extension
+
+    Returns:
+        bool: True if the journal file exists, False if not
+    """
+    return os.path.isfile(get_journal_file(json_file))
+
+
+def make_journal_record(item_type: str, item_number: int, startup_item: dict = {}):
+    """Helper function to create a journal record for a single startup item change
+
+    Each journal record is a JSON object written on its own line in the journal file. It has the following keys:
+
+    Type: the item_type of the change, which is one of the members of the Enum class ItemTypeVals except for F
+    ItemNumber: the position of the startup item in the Items array, starting from 1
+    Item: the full startup item for an add or replace, which is left out for a delete
+
+    Args:
+        item_type (str): Either A to add, D to delete or R to replace a startup item
+
+        item_number (int): The ItemNumber of the startup item being added, deleted or replaced
+
+        startup_item (dict, optional): The startup item being added or replaced. Defaults to {}.
+
+    Returns:
+        dict: The journal record
+    """
+    journal_record = {"Type": item_type, ENUM_JSK.ITEMNUMBER.value: item_number}
+
+    if not item_type == ENUM_ITV.DELETE.value:
+        journal_record["Item"] = startup_item
+
+    return journal_record
+
+
+def apply_journal_record(json_data: dict, journal_record: dict):
+    """Helper function to apply one journal record to startup data
+
+    The startup data passed in is updated directly, the same way as the function generate_user_edited_data in the module cs_data_generate would update a copy of it.
+
+    Args:
+        json_data (dict): The full startup data to apply the journal record to
+
+        journal_record (dict): The journal record, as created by make_journal_record
+
+    Returns:
+        bool: True if the journal record was applied, False if it doesn't fit the startup data
+    """
+    # Initialize function variables
+    record_applied = False
+    items_list = json_data[ENUM_JSK.ITEMS.value]
+    total_items = len(items_list)
+    item_type = journal_record.get("Type")
+    item_number = journal_record.get(ENUM_JSK.ITEMNUMBER.value)
+
+    match item_type:
+        case "A":
+            if item_number == total_items + 1:
+                items_list.append(journal_record["Item"])
+                record_applied = True
+        case "R":
+            if item_number in range(1, total_items + 1):
+                items_list[item_number - 1] = journal_record["Item"]
+                record_applied = True
+        case "D":
+            if item_number in range(1, total_items + 1):
+                items_list.pop(item_number - 1)
+
+                # Update the ItemNumber for all startup items that came after the deleted startup item
+                for item_count in range(item_number - 1, total_items - 1):
+                    items_list[item_count][ENUM_JSK.ITEMNUMBER.value] = item_count + 1
+
+                record_applied = True
+
+    json_data[ENUM_JSK.TOTALITEMS.value] = len(items_list)
+
+    return record_applied
+
+
+def journal_appender(json_file: str, journal_records: list):
+    """Function to append journal records to the journal file of a startup file
+
+    If the journal file doesn't exist yet, it's created with a header line that holds the digest of the startup data in the startup file, which is called the snapshot. A journal only applies to the snapshot it was started against. This way, if the startup file is changed in any other way, the journal is ignored rather than replayed on top of the wrong data.
+
+    Args:
+        json_file (str): The full absolute path of the startup file including filename and extension
+
+        journal_records (list): The journal records to append, as created by make_journal_record
+
+    Returns:
+        bool: True if the journal records were appended successfully, False if not
+
+        string: An error message to display if the journal records couldn't be appended or a message that they were appended successfully
+    """
+    # Initialize function variables
+    append_success = False
+    return_message = ""
+    journal_lines = []
+
+    journal_file = get_journal_file(json_file)
+
+    try:
+        if os.path.isfile(journal_file):
+            # Cut off any partially written last line so the new records start on a line of their own
+            with open(journal_file, "rb+") as file:
+                journal_content = file.read()
+                if journal_content and not journal_content.endswith(b"\n"):
+                    file.truncate(journal_content.rfind(b"\n") + 1)
+
+        # Start a new journal against the current snapshot, if needed
+        if not os.path.isfile(journal_file) or os.path.getsize(journal_file) == 0:
+            snapshot_digest = deps_cache.digest_lookup(json_file)
+            if snapshot_digest == "":
+                with open(json_file, "r") as file:
+                    snapshot_digest = deps_cache.get_data_digest(json.load(file))
+
+            journal_lines.append(json.dumps({"Snapshot": snapshot_digest}))
+
+        for journal_record in journal_records:
+            journal_lines.append(json.dumps(journal_record))
+
+        with open(journal_file, "a") as file:
+            file.write("\n".join(journal_lines) + "\n")
+            deps_atomic.append_syncer(file, deps_helper.get_write_durability())
+
+        append_success = True
+        return_message = "Startup data journal updated successfully!"
+    except Exception as error:
+        return_message = deps_pretty.prettify_io_error(error, "w")
+        deps_pretty.prettify_custom_error(return_message, "journal_appender")
+
+    return (append_success, return_message)
+
+
+def journal_replayer(json_file: str, json_data: dict, snapshot_digest: str):
+    """Function to replay the journal of a startup file over the startup data read in from that file
+
+    The journal records are applied in order. A partially written last line, such as one left behind by a crash, is skipped. If a record doesn't fit the startup data, the rest of the journal is ignored and an error is printed.
+
+    If the journal was started against a different snapshot, such as when the startup file was changed outside of CompStart.py, none of it can be applied. Instead of being ignored on every read from then on, it's renamed with the extension in STALE_JOURNAL_EXTENSION added, replacing any older stale journal, so the changes in it can still be recovered by hand. The launch plan is then written again, since it holds the digest of the journal file.
+
+    Args:
+        json_file (str): The full absolute path of the startup file including filename and extension
+
+        json_data (dict): The startup data read in from the startup file, which is updated directly
+
+        snapshot_digest (str): The digest of the startup data read in from the startup file, before the journal is replayed over it, as returned by get_data_digest in the module cs_cache
+
+    Returns:
+        int: The number of journal records that were applied
+    """
+    # Initialize function variables
+    records_applied = 0
+    error_message = ""
+
+    try:
+        with open(get_journal_file(json_file), "r") as file:
+            journal_lines = file.read().splitlines()
+    except Exception as error:
+        journal_lines = []
+        error_message = deps_pretty.prettify_io_error(error, "r")
+
+    for line_number, journal_line in enumerate(journal_lines):
+        try:
+            journal_record = json.loads(journal_line)
+        except ValueError:
+            # Only the last line can be partially written
+            if line_number < len(journal_lines) - 1:
+                error_message = f"Line {line_number + 1} of the journal is not valid JSON"
+            break
+
+        if line_number == 0:
+            if not journal_record.get("Snapshot") == snapshot_digest:
+                error_message = journal_archiver(json_file, json_data)
+                break
+        elif apply_journal_record(json_data, journal_record):
+            records_applied += 1
+        else:
+            error_message = f"Journal record {line_number} doesn't fit the startup data"
+            break
+
+    if error_message:
+        deps_pretty.prettify_custom_error(error_message, "journal_replayer")
+
+    return records_applied
+
+
+def journal_archiver(json_file: str, json_data: dict):
+    """Helper function to move a journal that no longer fits its startup file out of the way
+
+    Args:
+        json_file (str): The full absolute path of the startup file including filename and extension
+
+        json_data (dict): The startup data read in from the startup file, which is used to write the launch plan again
+
+    Returns:
+        string: An error message to display about the journal
+    """
+    journal_file = get_journal_file(json_file)
+    stale_file = journal_file + STALE_JOURNAL_EXTENSION
+
+    try:
+        os.replace(journal_file, stale_file)
+
+        error_message = f"The journal was started against a different version of the startup file, so it was ignored and moved to {stale_file}"
+
+        # The launch plan prints out its own errors
+        deps_plan.plan_writer(json_file, json_data)
+    except Exception as error:
+        error_message = (
+            "The journal was started against a different version of the startup file and was ignored, but it couldn't be moved out of the way\n"
+            + deps_pretty.prettify_io_error(error, "w")
+        )
+
+    return error_message
+
+
+def journal_remover(json_file: str):
+    """Helper function to delete the journal file of a startup file, if there is one
+
+    This is called every time the full startup data is written to the startup file, since the journal has then been folded into it.
+
+    Args:
+        json_file (str): The full absolute path of the startup file including filename and extension
+    """
+    try:
+        os.remove(get_journal_file(json_file))
+    except FileNotFoundError:
+        pass
+
+
+def get_journal_record_count(json_file: str):
+    """Helper function to get the number of records in the journal of a startup file
+
+    Args:
+        json_file (str): The full absolute path of the startup file including filename and extension
+
+    Returns:
+        int: The number of journal records, not counting the header line
+    """
+    record_count = 0
+
+    try:
+        with open(get_journal_file(json_file), "r") as file:
+            record_count = max(sum(1 for journal_line in file) - 1, 0)
+    except OSError:
+        pass
+
+    return record_count
+
+
+def journal_differ(orig_json_data: dict, new_json_data: dict):
+    """Helper function to work out the journal records that turn one version of the startup data into another
+
+    Only changes made up of replaced startup items, startup items added to the end, or a single deleted startup item can be expressed as journal records. Anything else, including changes to keys other than Items and more changes than the journal threshold, needs the full startup data to be written.
+
+    Args:
+        orig_json_data (dict): The startup data currently in the startup file and its journal
+
+        new_json_data (dict): The edited startup data
+
+    Returns:
+        list: The journal records, which is empty if there are no changes, or None if the changes can't be expressed as journal records
+    """
+    # Initialize function variables
+    journal_records = []
+    orig_items = orig_json_data.get(ENUM_JSK.ITEMS.value, [])
+    new_items = new_json_data.get(ENUM_JSK.ITEMS.value, [])
+    orig_total = len(orig_items)
+    new_total = len(new_items)
+
+    # Journal records only hold startup items, so a change to any other key, such as LaunchPolicy, needs the full startup data to be written
+    item_keys = (ENUM_JSK.TOTALITEMS.value, ENUM_JSK.ITEMS.value)
+    orig_other = {key: value for key, value in orig_json_data.items() if key not in item_keys}
+    new_other = {key: value for key, value in new_json_data.items() if key not in item_keys}
+
+    if not orig_other == new_other:
+        journal_records = None
+    elif new_total >= orig_total:
+        # Startup items were replaced or added to the end
+        for item_index in range(orig_total):
+            if not orig_items[item_index] == new_items[item_index]:
+                journal_records.append(
+                    make_journal_record(ENUM_ITV.REPLACE.value, item_index + 1, new_items[item_index])
+                )
+
+        for item_index in range(orig_total, new_total):
+            journal_records.append(
+                make_journal_record(ENUM_ITV.ADD.value, item_index + 1, new_items[item_index])
+            )
+    elif new_total == orig_total - 1:
+        # Find the first startup item that doesn't match, which has to be the deleted one
+        delete_index = 0
+        while delete_index < new_total and orig_items[delete_index] == new_items[delete_index]:
+            delete_index += 1
+
+        journal_records.append(make_journal_record(ENUM_ITV.DELETE.value, delete_index + 1))
+
+        # Every startup item after it must be the same apart from the updated ItemNumber
+        for item_index in range(delete_index, new_total):
+            orig_item = dict(orig_items[item_index + 1])
+            orig_item[ENUM_JSK.ITEMNUMBER.value] = item_index + 1
+
+            if not orig_item == new_items[item_index]:
+                journal_records = None
+                break
+    else:
+        journal_records = None
+
+    if journal_records is not None and len(journal_records) > deps_helper.get_journal_threshold():
+        journal_records = None
+
+    return journal_records
+
+
+def journal_saver(json_file: str, new_json_data: dict, journal_records: list):
+    """Function to save startup data changes to the journal, compacting the journal if it has grown past the threshold
+
+    Every function that saves changes to the journal does it through this function, so the launch plan that CompStart.ps1 uses is always written again to include them. Compacting the journal writes the startup file with the function json_writer, which already writes the launch plan.
+
+    Args:
+        json_file (str): The full absolute path of the startup file including filename and extension
+
+        new_json_data (dict): The full startup data after the changes, which is written to the startup file if the journal is compacted and to the launch plan. This can also be a StartupDocument.
+
+        journal_records (list): The journal records for the changes, as created by make_journal_record
+
+    Returns:
+        bool: True if the changes were saved successfully, False if not
+
+        string: An error message to display if the changes couldn't be saved or a message that they were saved successfully
+    """
+    save_success, return_message = journal_appender(json_file, journal_records)
+
+    if save_success and get_journal_record_count(json_file) >= deps_helper.get_journal_threshold():
+        save_success, return_message = journal_compactor(json_file, new_json_data)
+    elif save_success:
+        # The launch plan has to match the journal as well as the startup file, and prints out its own errors since the changes were still saved
+        deps_plan.plan_writer(json_file, new_json_data)
+
+    return (save_success, return_message)
+
+
+def journal_compactor(json_file: str, json_data: dict):
+    """Function to fold the journal back into the startup file
+
+    The full startup data is written to the startup file, which also deletes the journal file.
+
+    Args:
+        json_file (str): The full absolute path of the startup file including filename and extension
+
+        json_data (dict): The full startup data, which is the startup file content with the journal replayed over it
+
+    Returns:
+        bool: True if the startup data was written successfully, False if not
+
+        string: An error message to display if the startup data couldn't be written or a message that it was written successfully
+    """
+    return deps_json.json_writer(json_file, 2, json_data)
+
+
+def fold_journal(json_path: list, json_filename: str):
+    """Function to fold any journal left for the startup file back into it
+
+    This is called when the menu loop of CompStart.py ends in journaled storage mode, including when the user quits from any menu, since the PowerShell script that runs the startup items only reads the startup file and not its journal. If CompStart.py is killed before then, the journal is folded the next time this is called or the journal threshold is reached.
+
+    Args:
+        json_path (list): A list containing the relative or absolute path to the JSON file with each list item representing one subfolder from Current Working Directory (CWD)
+
+        json_filename (str): The filename of the JSON file
+    """
+    json_file = deps_helper.parse_full_path(json_path, json_filename)
+
+    if journal_exists(json_file):
+        read_success, return_message, json_data = deps_json.json_reader(json_path, json_filename)
+
+        if read_success:
+            journal_compactor(json_file, json_data)
@@ -1,6 +1,6 @@
 # Dependency to store the main JSON related functions used by CompStart
 
-import json, os, copy
+import json, os
 
 import dependencies.cs_helper as deps_helper
 import dependencies.cs_chooser as deps_chooser
@@ -9,6 +9,16 @@ import dependencies.cs_data_generate as deps_data_gen
 import dependencies.cs_startup_edit as deps_item_edit
 import dependencies.cs_startup_add as deps_item_add
 import dependencies.cs_enum as deps_enum
+import dependencies.cs_cache as deps_cache
+import dependencies.cs_journal as deps_journal
+import dependencies.cs_atomic as deps_atomic
+import dependencies.cs_document as deps_document
+import dependencies.cs_model as deps_model
+import dependencies.cs_stream as deps_stream
+import dependencies.cs_plan as deps_plan
+import dependencies.cs_index as deps_index
+import dependencies.cs_dedup as deps_dedup
+import dependencies.cs_preflight as deps_preflight
 
 ENUM_JSK = deps_enum.JsonSchemaKeys
 ENUM_ITV = deps_enum.ItemTypeVals
@@ -17,6 +27,8 @@ ENUM_ITV = deps_enum.ItemTypeVals
 def json_reader(json_path: list, json_filename: str, is_json_schema: bool = False):
     """Function to read in JSON data from a file
 
+    Startup data that was already read in and validated is handed back from the document cache. The calling function always gets its own copy, made with the function copy_startup_data in the module cs_document, so it can modify the startup data without changing what's cached. That copy is much quicker than a deepcopy, but still takes longer the more startup items there are, so functions that only need to read the startup data, or edit single startup items, should use the function document_reader instead, which doesn't copy anything.
+
     Args:
         json_path (list): A list containing the relative or absolute path to the JSON file with each list item representing one subfolder from Current Working Directory (CWD)
 
@@ -34,33 +46,36 @@ def json_reader(json_path: list, json_filename: str, is_json_schema: bool = Fals
 
     # Initialize function variables
     read_json_success = False
-    return_message = ""
     json_data = {}
-    required_ext = ".json"
-
-    # Grab the file extension
-    file_ext = os.path.splitext(json_filename)[1]
 
     # Validate if filename passed in is a JSON file
-    if not file_ext:
-        # The filename has no extension
-        return_message = "Argument 'json_filename' is not a valid file as it has no extension"
-    else:
-        # Check the extension is "json"
-        if not file_ext == required_ext:
-            return_message = (
-                "Invalid startup file name.\n"
-                f"Received extension of: {file_ext}\n"
-                f"Expected extension of: {required_ext}"
-            )
+    return_message = json_filename_checker(json_filename)
+
+    if not return_message:
+        # Get the full path to the file in string format
+        json_file = deps_helper.parse_full_path(json_path, json_filename)
+
+        # Check the document cache for startup data that was already read in and validated
+        cache_hit = False
+        if not is_json_schema:
+            cache_hit, cached_data = deps_cache.cache_lookup(json_file)
+
+        if cache_hit:
+            # Hand back a copy so the calling function can't modify the cached data
+            json_data = deps_document.copy_startup_data(cached_data)
+            read_json_success = True
+            return_message = "Startup data read in successfully"
         else:
-            # Get the full path to the file in string format
-            json_file = deps_helper.parse_full_path(json_path, json_filename)
-
             # Read in JSON data
             try:
-                with open(json_file, "r") as json_file:
-                    json_data = json.load(json_file)
+                with open(json_file, "r") as file:
+                    json_data = json.load(file)
+
+                # Replay any journal over the startup data read in from the file
+                if not is_json_schema and deps_journal.journal_exists(json_file):
+                    deps_journal.journal_replayer(
+                        json_file, json_data, deps_cache.get_data_digest(json_data)
+                    )
 
                 # Check to see if the JSON data file is blank
                 if len(json_data) == 0:
@@ -72,6 +87,14 @@ def json_reader(json_path: list, json_filename: str, is_json_schema: bool = Fals
                 else:
                     read_json_success = True
                     return_message = "Startup data read in successfully"
+
+                    # Cache the validated startup data for the next read, keeping a copy so the calling function can't modify the cached data
+                    if not is_json_schema:
+                        deps_cache.cache_store(
+                            json_file,
+                            deps_document.copy_startup_data(json_data),
+                            deps_cache.get_data_digest(json_data),
+                        )
             except Exception as error:
                 return_message = deps_pretty.prettify_io_error(error, "r")
 
@@ -82,6 +105,193 @@ def json_reader(json_path: list, json_filename: str, is_json_schema: bool = Fals
     return read_json_success, return_message, json_data
 
 
+def document_reader(json_path: list, json_filename: str):
+    """Function to read in startup data from a file as a StartupDocument
+
+    This works the same as the function json_reader, except that the startup data is returned as a StartupDocument from the module cs_document. A StartupDocument can't be modified, so the one kept in the document cache is handed back directly instead of a copy. Editing a single startup item then only creates a new StartupDocument that shares the rest of the startup data with the original one.
+
+    Args:
+        json_path (list): A list containing the relative or absolute path to the JSON file with each list item representing one subfolder from Current Working Directory (CWD)
+
+        json_filename (str): The filename of the JSON file
+
+    Returns:
+        bool: True if there is startup data to return, False if not
+
+        string: An error message to display if there's no startup data to return or a message that it was read in successfully
+
+        StartupDocument: The startup data if there is any to return or None if not
+    """
+    # Get the full path to the file in string format
+    json_file = deps_helper.parse_full_path(json_path, json_filename)
+
+    # Check the document cache first, which doesn't need any copying
+    read_json_success, json_document = deps_cache.document_lookup(json_file)
+
+    if read_json_success:
+        return_message = "Startup data read in successfully"
+    else:
+        read_json_success, return_message, json_data = json_reader(json_path, json_filename)
+
+        if read_json_success:
+            json_document = deps_document.StartupDocument.from_json(json_data)
+            deps_cache.cache_store(json_file, json_document)
+
+    return read_json_success, return_message, json_document
+
+
+def json_stream_reader(json_path: list, json_filename: str):
+    """Function to read in startup data from a file one startup item at a time
+
+    This works the same as the function json_reader, except that the startup items are handed back by a generator as they are read in from the file instead of all at once. Only the keys before the Items array are read in and validated right away. Each startup item is then validated against startup_item.schema.json as it is read in, so the first startup item is ready without waiting for the rest of the file, and only about one startup item is kept in memory at a time no matter how large the file is. See the class StartupFileReader in the module cs_stream for more information.
+
+    Checks that need all the startup items at once, such as for startup items whose After keys depend on each other in a loop, can't be done this way. Those are still done whenever the full startup data is read in or saved.
+
+    If the startup data is already in the document cache, the startup items are handed back from there instead. The whole file is also read in if it has a journal, since the startup items in the file don't have the journal records replayed over them.
+
+    Args:
+        json_path (list): A list containing the relative or absolute path to the JSON file with each list item representing one subfolder from Current Working Directory (CWD)
+
+        json_filename (str): The filename of the JSON file
+
+    Returns:
+        bool: True if the startup items can be read in, False if not
+
+        string: An error message to display if the startup items can't be read in or a message that the file was opened successfully
+
+        generator: The generator that yields each startup item as a dictionary, which raises a ValueError if a startup item isn't valid, or None if the startup items can't be read in
+    """
+    # Initialize function variables
+    read_json_success = False
+    item_stream = None
+
+    # Validate if filename passed in is a JSON file
+    return_message = json_filename_checker(json_filename)
+
+    if not return_message:
+        # Get the full path to the file in string format
+        json_file = deps_helper.parse_full_path(json_path, json_filename)
+
+        # Use the cached startup data if there is any
+        cache_hit, json_document = deps_cache.document_lookup(json_file)
+
+        if cache_hit:
+            read_json_success = True
+            return_message = "Startup data read in successfully"
+            item_stream = json_document.iter_items()
+        elif deps_journal.journal_exists(json_file):
+            # The journal has to be replayed over the whole startup data, so the file is read in as a StartupDocument, which prints any errors itself
+            read_json_success, return_message, json_document = document_reader(json_path, json_filename)
+
+            if read_json_success:
+                item_stream = json_document.iter_items()
+        else:
+            file_reader = deps_stream.StartupFileReader(json_file)
+
+            try:
+                file_reader.open()
+
+                # Check the keys before the Items array, filling in TotalItems in case it comes after the Items array
+                header_data = {ENUM_JSK.TOTALITEMS.value: 0}
+                header_data.update(file_reader.header_data)
+                header_data[ENUM_JSK.ITEMS.value] = []
+
+                if not deps_helper.json_data_validator(header_data):
+                    file_reader.close()
+                    return_message = "Validation failed while reading in JSON data"
+                else:
+                    read_json_success = True
+                    return_message = "Startup file opened successfully"
+                    item_stream = startup_item_streamer(file_reader)
+            except Exception as error:
+                return_message = deps_pretty.prettify_io_error(error, "r")
+
+            # If there were any errors or exceptions, print them out
+            if not read_json_success:
+                deps_pretty.prettify_custom_error(return_message, "json_stream_reader")
+    else:
+        deps_pretty.prettify_custom_error(return_message, "json_stream_reader")
+
+    return read_json_success, return_message, item_stream
+
+
+def startup_item_streamer(file_reader: deps_stream.StartupFileReader):
+    """Helper function to validate each startup item read in by a StartupFileReader before handing it back
+
+    The file is closed once the last startup item has been handed back, if a startup item isn't valid, or if the generator is closed before then.
+
+    Args:
+        file_reader (StartupFileReader): The StartupFileReader for the startup file, which must already be open
+
+    Yields:
+        dict: Each startup item
+
+    Raises:
+        ValueError: If a startup item isn't valid JSON or doesn't match startup_item.schema.json
+    """
+    schema_validator = deps_helper.get_schema_validator(True)
+
+    try:
+        for item_index, startup_item in file_reader.iter_items():
+            stream_item_validator(startup_item, item_index, schema_validator)
+            yield startup_item
+    except Exception as error:
+        deps_pretty.prettify_custom_error(deps_pretty.prettify_io_error(error, "r"), "startup_item_streamer")
+        raise
+    finally:
+        file_reader.close()
+
+
+def stream_item_validator(startup_item: dict, item_index: int, schema_validator=None):
+    """Helper function to validate a startup item read in from a startup file on its own
+
+    Getting the compiled validator from the function get_schema_validator in the helper module checks the schema file on disk each time, which would take longer than validating the startup item itself. Functions validating one startup item after another can therefore get the validator once and pass it in. The startup item is only validated again with the function json_data_validator, which prints out why, if it isn't valid.
+
+    Args:
+        startup_item (dict): The startup item
+
+        item_index (int): The index of the startup item in the Items array
+
+        schema_validator (jsonschema.protocols.Validator, optional): The compiled validator for startup_item.schema.json. Defaults to None, in which case the function json_data_validator is used.
+
+    Raises:
+        ValueError: If the startup item doesn't match startup_item.schema.json
+    """
+    if schema_validator is None or not schema_validator.is_valid(startup_item):
+        if not deps_helper.json_data_validator(startup_item, True):
+            raise ValueError(f"Validation failed while reading in startup item #{item_index + 1}")
+
+
+def json_filename_checker(json_filename: str):
+    """Helper function to check the filename passed in is a JSON file
+
+    Args:
+        json_filename (str): The filename of the JSON file
+
+    Returns:
+        str: An error message if the filename doesn't have the extension ".json" or blank otherwise
+    """
+    # Initialize function variables
+    return_message = ""
+    required_ext = ".json"
+
+    # Grab the file extension
+    file_ext = os.path.splitext(json_filename)[1]
+
+    if not file_ext:
+        # The filename has no extension
+        return_message = "Argument 'json_filename' is not a valid file as it has no extension"
+    elif not file_ext == required_ext:
+        # The extension isn't "json"
+        return_message = (
+            "Invalid startup file name.\n"
+            f"Received extension of: {file_ext}\n"
+            f"Expected extension of: {required_ext}"
+        )
+
+    return return_message
+
+
 def json_writer(json_file: str, file_state: int, json_data: dict):
     """Function to write the actual JSON data to file
 
@@ -92,6 +302,12 @@ def json_writer(json_file: str, file_state: int, json_data: dict):
         user is alright with overwriting existing file
     2 - The file exists but the JSON data needs to be updated; see note below
 
+    The file is written with the function atomic_writer from the module cs_atomic, using the durability level set by the variable write_durability in CompStart.py. By default, the file is written to a temporary file that is flushed to disk and then renamed into place, so a crash never leaves a truncated file behind.
+
+    After the file is written, the launch plan file that CompStart.ps1 uses to start the startup items without reading in the startup file is written next to it. See the module cs_plan for more information.
+
+    When 'file_state' is 2, the file is only written if 'json_data' is different from the startup data in the file. This is checked by comparing the digest of 'json_data' against the digest of the startup data last read in from, or written to, the file, which is kept in the document cache. Both digests come from the function get_data_digest in the module cs_cache, which doesn't depend on how the file is formatted, so a file that was formatted by hand is only rewritten if its startup data has changed. The file is only read in again if it has changed on disk since then.
+
     Note: Initially, the plan was to open the file in "append" mode when 'file_state' is 2, but this doesn't work. Due to how the 'json.dump' function writes JSON data, it's not possible to just append newer JSON data to an existing file. As a result, existing startup JSON data will
     need to be read in, any modifications made - such as adding new startup data or editing existing startup data, and then written back to the file by overwriting what exists. However, this function will not be responsible for modifying any JSON data. This function will assume that 'json_data'
     contains the correct startup JSON data and if a 'file_state' of 2 is passed in, this function will overwrite the existing file data.
@@ -101,7 +317,7 @@ def json_writer(json_file: str, file_state: int, json_data: dict):
 
         file_state (int): An indicator of how the file to be written should be handled. See extended summary above.
 
-        json_data (dict): The JSON data to write to file. See note above.
+        json_data (dict): The JSON data to write to file. See note above. This can also be a StartupData or StartupDocument.
 
     Returns:
         bool: True if the JSON data was written successfully, False if not
@@ -113,6 +329,11 @@ def json_writer(json_file: str, file_state: int, json_data: dict):
     write_json_success = False
     return_message = ""
     file_mode = ""
+    json_text = ""
+    new_digest = ""
+
+    # A StartupData or StartupDocument is turned into regular startup data before it's serialized
+    json_data = deps_model.model_to_json(json_data)
 
     # Check for valid file_state value
     match file_state:
@@ -127,15 +348,21 @@ def json_writer(json_file: str, file_state: int, json_data: dict):
             else:
                 return_message = "Skipped writing startup file"
         case 2:
-            # Check to see if the current JSON data in the file is different from json_data
-            try:
-                with open(json_file, "r") as file:
-                    existing_data = json.load(file)
-            except Exception as error:
-                existing_data = json_data
-                return_message = deps_pretty.prettify_io_error(error, "r")
-
-            if not json_data == existing_data:
+            # Check to see if the current JSON data in the file is different from json_data by comparing digests
+            new_digest = deps_cache.get_data_digest(json_data)
+            existing_digest = deps_cache.digest_lookup(json_file)
+
+            # Only read in the file if its content wasn't read in or written during this session
+            if existing_digest == "":
+                try:
+                    with open(json_file, "r") as file:
+                        existing_digest = deps_cache.get_data_digest(json.load(file))
+                except Exception as error:
+                    existing_digest = new_digest
+                    return_message = deps_pretty.prettify_io_error(error, "r")
+
+            # Any journal also has to be folded into the file, even if the file content stays the same
+            if not new_digest == existing_digest or deps_journal.journal_exists(json_file):
                 file_mode = "w"
             else:
                 return_message = (
@@ -147,13 +374,30 @@ def json_writer(json_file: str, file_state: int, json_data: dict):
 
     # Write to file if needed
     if not file_mode == "":
+        # Whatever happens, the cached startup data for the file will be outdated
+        deps_cache.cache_invalidate(json_file)
+
         try:
-            with open(json_file, file_mode) as file:
-                json.dump(json_data, file)
+            # Serialize the JSON data, and get its digest unless that was already done to check for changes
+            json_text = json.dumps(json_data)
+            if new_digest == "":
+                new_digest = deps_cache.get_data_digest(json_data)
+
+            deps_atomic.atomic_writer(json_file, json_text, deps_helper.get_write_durability())
 
             # Created file successfully
             write_json_success = True
             return_message = "Startup file written successfully!"
+
+            # The full startup data is now in the file, so any journal is no longer needed
+            deps_journal.journal_remover(json_file)
+
+            # Remember what was written so the next save can tell if there are any changes
+            deps_cache.digest_store(json_file, new_digest)
+
+            # Precompile the startup items for CompStart.ps1, which prints out its own errors since the startup file was still saved
+            # The launch plan holds the digest of the bytes of the file, which is the text just written since json.dumps only writes ASCII
+            deps_plan.plan_writer(json_file, json_data, deps_cache.get_text_digest(json_text))
         except Exception as error:
             return_message = deps_pretty.prettify_io_error(error, file_mode)
 
@@ -217,12 +461,16 @@ def json_creator(json_path: list, json_filename: str, default_mode: bool):
         # Check if the user was ok to overwrite any existing file and chose to add their own startup programs
         if write_json_success and not default_mode:
             # Call the function to handle adding the startup items
-            new_json_data = json_adder(json_data)
+            json_document = deps_document.StartupDocument.from_json(json_data)
+            new_json_document = json_adder(json_document)
 
             # Check if any startup items were actually added
-            if not new_json_data == json_data:
-                # Write the file to disk and get the return values
-                write_json_success, return_message = json_writer(json_file, file_state, json_data)
+            if new_json_document.total_items() > 0:
+                # Write the file to disk and get the return values. The file now exists, so it's updated rather than overwritten.
+                write_json_success, return_message = json_writer(json_file, 2, new_json_document)
+
+                if write_json_success:
+                    deps_cache.cache_store(json_file, new_json_document)
     else:
         # There's no data to use, so let the user know
         deps_pretty.prettify_custom_error(
@@ -236,7 +484,7 @@ def json_creator(json_path: list, json_filename: str, default_mode: bool):
 def json_editor(json_path: list, json_filename: str):
     """Function to allow the user to edit existing JSON data
 
-    This function will display the existing JSON data and then allow the user to edit or delete startup items
+    This function will display the existing JSON data and then allow the user to edit or delete startup items. A startup item to edit can also be found by searching for its name, program path, description or arguments, startup items that launch the same program more than once can be found and removed, and every program path can be checked to make sure it can still be launched.
 
     Args:
         json_path (list): A list containing the relative or absolute path to the JSON file with each list item representing one subfolder from Current Working Directory (CWD)
@@ -254,19 +502,21 @@ def json_editor(json_path: list, json_filename: str):
     status_state = True
     status_message = ""
 
-    # Read in existing JSON file and store the return results of the json_read function
-    status_state, status_message, json_data = json_reader(json_path, json_filename)
+    # Get the full path to the file in string format, which is used to track any unsaved edits
+    data_file = deps_helper.parse_full_path(json_path, json_filename)
+
+    # Read in existing JSON file as a StartupDocument, so edits don't need to copy the whole startup data
+    status_state, status_message, json_document = document_reader(json_path, json_filename)
 
     # If the data was read in successfully, continue
     if status_state:
         # Let user know the data was read in successfully
         print(f"\n{status_message}")
 
-        # Check to make sure there really are startup items in case TotalItems is wrong
-        if len(json_data[ENUM_JSK.ITEMS.value]) > 0:
+        # Check to make sure there really are startup items
+        if json_document.total_items() > 0:
             # Initialize the loop variables
             total_items = 0
-            items = []
             new_menu = True
             quit_loop = False
 
@@ -280,8 +530,7 @@ def json_editor(json_path: list, json_filename: str):
                     new_menu = False
 
                     # Get the total items
-                    total_items = json_data[ENUM_JSK.TOTALITEMS.value]
-                    items = json_data[ENUM_JSK.ITEMS.value]
+                    total_items = json_document.total_items()
 
                     # Print out the total number of items
                     print(f"\nNumber of startup items: {total_items}")
@@ -294,6 +543,9 @@ def json_editor(json_path: list, json_filename: str):
 
                     menu_choices.extend(
                         [
+                            "Search for a startup item to edit",
+                            "Find duplicate startup items",
+                            "Check that every program can be launched",
                             "Add new startup items",
                             "Delete an existing startup item",
                             "Save the full startup data to disk",
@@ -302,23 +554,55 @@ def json_editor(json_path: list, json_filename: str):
                     )
 
                     # Store the values necessary to determine each choice the user could make
-                    menu_add = total_items + 1
-                    menu_delete = total_items + 2
-                    menu_save = total_items + 3
-                    menu_quit = total_items + 4
+                    menu_search = total_items + 1
+                    menu_dedup = total_items + 2
+                    menu_preflight = total_items + 3
+                    menu_add = total_items + 4
+                    menu_delete = total_items + 5
+                    menu_save = total_items + 6
+                    menu_quit = total_items + 7
 
                 # Ask the user what they want to do
                 user_choice = deps_chooser.user_menu_chooser(
                     menu_choices=menu_choices, include_save=True
                 )
 
+                # Searching for a startup item ends with the user either choosing one to edit or going back to the menu
+                if user_choice == menu_search:
+                    user_choice = json_searcher(json_document)
+
                 if user_choice == menu_quit:
-                    # User chose to return to the main menu
-                    quit_loop = True
+                    # User chose to return to the main menu, so check for any unsaved edits first
+                    if deps_cache.is_dirty(data_file):
+                        user_input = input(
+                            "\nThere are unsaved changes to the startup data. Return to the main menu without saving them [Y/N]? "
+                        )
+                        if user_input.upper() == "Y":
+                            deps_cache.set_dirty(data_file, False)
+                            quit_loop = True
+                    else:
+                        quit_loop = True
+                elif user_choice == menu_dedup:
+                    # User chose to look for duplicate startup items, which can delete several startup items at once
+                    new_json_document = json_deduplicator(json_document)
+
+                    if new_json_document is not json_document:
+                        deps_index.index_updater(json_document, new_json_document, ENUM_ITV.FULL.value)
+                        json_document = new_json_document
+                        new_menu = True
+                        deps_cache.set_dirty(data_file, True)
+                elif user_choice == menu_preflight:
+                    # User chose to check the program paths, which doesn't change the startup data
+                    json_preflight(json_document)
                 elif user_choice == menu_add:
                     # User chose to add one or more new startup items
-                    json_data = json_adder(json_data)
+                    new_json_document = json_adder(json_document)
+                    deps_index.index_updater(json_document, new_json_document, ENUM_ITV.ADD.value)
+                    json_document = new_json_document
                     new_menu = True
+
+                    if not json_document.total_items() == total_items:
+                        deps_cache.set_dirty(data_file, True)
                 elif user_choice == menu_delete:
                     # First check to see if there are any items to delete
                     if total_items > 0:
@@ -345,8 +629,13 @@ def json_editor(json_path: list, json_filename: str):
                             # User chose a valid option, process accordingly
                             user_item_choice = int(user_input)
 
-                            json_data = json_pruner(json_data, user_item_choice)
+                            new_json_document = json_pruner(json_document, user_item_choice)
+                            deps_index.index_updater(
+                                json_document, new_json_document, ENUM_ITV.DELETE.value, user_item_choice
+                            )
+                            json_document = new_json_document
                             new_menu = True
+                            deps_cache.set_dirty(data_file, True)
                     else:
                         status_message = (
                             "There are no items to delete! Please add a new startup item first..."
@@ -355,12 +644,36 @@ def json_editor(json_path: list, json_filename: str):
                         quit_loop = True
                 elif user_choice == menu_save:
                     # User chose to save the current JSON data
-                    status_state, status_message = json_saver(json_data, json_path, json_filename)
+                    status_state, status_message = json_saver(
+                        json_document, json_path, json_filename
+                    )
                 elif user_choice > 0:
                     # User chose to edit a specific startup item
-                    items[user_choice - 1] = deps_item_edit.edit_startup_item(
-                        items[user_choice - 1], json_path, json_filename
+                    orig_item = json_document.get_item(user_choice)
+                    edited_item = deps_item_edit.edit_startup_item(
+                        orig_item, json_path, json_filename
                     )
+
+                    if not edited_item == orig_item:
+                        new_json_document = deps_data_gen.generate_user_edited_data(
+                            edited_item, ENUM_ITV.REPLACE.value, json_document
+                        )
+
+                        if isinstance(new_json_document, deps_document.StartupDocument):
+                            deps_index.index_updater(
+                                json_document, new_json_document, ENUM_ITV.REPLACE.value, user_choice
+                            )
+                            json_document = new_json_document
+
+                            # The startup item can already have been saved from its own menu, in which case the edit is only unsaved if it was changed again afterwards or there were other unsaved edits
+                            cache_hit, saved_document = deps_cache.document_lookup(data_file)
+
+                            if (
+                                deps_cache.is_dirty(data_file)
+                                or not cache_hit
+                                or not saved_document.get_item(user_choice) == edited_item
+                            ):
+                                deps_cache.set_dirty(data_file, True)
         else:
             status_message = "There are no startup items to edit!"
             status_state = False
@@ -373,13 +686,130 @@ def json_editor(json_path: list, json_filename: str):
     return status_state, status_message
 
 
+def json_searcher(json_document: deps_document.StartupDocument):
+    """Function to let the user search for a startup item to edit
+
+    The startup items are found with the search index from the module cs_index, which is built the first time the startup data is searched and then kept up to date as the startup data is edited.
+
+    Args:
+        json_document (StartupDocument): The startup data to search
+
+    Returns:
+        int: The ItemNumber of the startup item the user chose to edit, or 0 if they didn't choose one
+    """
+    # Initialize function variables
+    item_number = 0
+    max_results = 20
+
+    search_text = input(
+        "\nPlease enter the text to search for in the names, program paths, descriptions and arguments: "
+    ).strip()
+
+    # Get one more result than is shown to know if some were left out
+    search_results = deps_index.get_startup_index(json_document).search(
+        search_text, max_results=max_results + 1
+    )
+
+    if len(search_results) == 0:
+        print("\nNo startup items were found!")
+    else:
+        if len(search_results) > max_results:
+            search_results = search_results[:max_results]
+            print(f"\nMore than {max_results} startup items were found, so only the first {max_results} are shown:")
+        else:
+            print("\nThe following startup items were found:")
+
+        for result_number in search_results:
+            startup_item = json_document.get_item(result_number)
+            print(
+                f"[{result_number}] "
+                + startup_item[ENUM_JSK.NAME.value]
+                + " - "
+                + startup_item[ENUM_JSK.FILEPATH.value]
+            )
+
+        user_input = input("\nPlease enter the startup item number to edit, or press enter to go back: ")
+
+        if user_input.isnumeric() and int(user_input) in search_results:
+            item_number = int(user_input)
+        elif user_input:
+            print("\nThat choice is invalid!")
+
+    return item_number
+
+
+def json_deduplicator(json_document: deps_document.StartupDocument):
+    """Function to show the user any duplicate startup items and let them delete the exact duplicates
+
+    The duplicates are found with the function duplicate_checker in the module cs_dedup. Overlapping startup items are only shown, since which one to keep depends on what the user wants launched.
+
+    Args:
+        json_document (StartupDocument): The startup data to check
+
+    Returns:
+        StartupDocument: The updated startup data, or json_document itself if nothing was deleted
+    """
+    # Initialize function variables
+    updated_json_document = json_document
+
+    has_duplicates, duplicate_report, duplicate_groups = deps_dedup.duplicate_checker(json_document.iter_items())
+    if has_duplicates:
+        print(duplicate_report)
+    else:
+        print(f"\n{duplicate_report}")
+
+    if len(duplicate_groups) > 0:
+        user_input = input("\nDelete the exact duplicates, keeping the first startup item of each [Y/N]? ")
+
+        if user_input.upper() == "Y":
+            # Every ItemNumber refers to the startup data before any of the deletes, so they can all be made at once
+            edit_list = [
+                (json_document.get_item(item_number), ENUM_ITV.DELETE.value)
+                for item_numbers in duplicate_groups
+                for item_number in item_numbers[1:]
+            ]
+
+            new_json_document = deps_data_gen.generate_user_batch_edited_data(edit_list, json_document)
+
+            if isinstance(new_json_document, deps_document.StartupDocument):
+                updated_json_document = new_json_document
+                print(f"\n{len(edit_list)} duplicate startup item(s) were successfully deleted")
+
+    return updated_json_document
+
+
+def json_preflight(json_data: dict):
+    """Function to check that the program of every startup item can be launched and show the user any that can't
+
+    The program paths are checked with the function preflight_checker in the module cs_preflight.
+
+    Args:
+        json_data (dict): The full startup data to check. This can also be a StartupData or StartupDocument.
+
+    Returns:
+        bool: True if every startup item can be launched, False if not
+    """
+    json_data = deps_model.model_to_json(json_data)
+
+    preflight_success, preflight_message, preflight_results = deps_preflight.preflight_checker(
+        json_data[ENUM_JSK.ITEMS.value]
+    )
+
+    if not preflight_success:
+        print(deps_pretty.prettify_preflight_report(preflight_results))
+
+    print(f"\n{preflight_message}")
+
+    return preflight_success
+
+
 def json_saver(json_data: dict, json_path: list, json_filename: str):
     """Function to allow the user to save startup data
 
-    This function takes in startup data in the form of a JSON object / Python dictionary. After calling the generate_user_edited_data function to basically validate it, json_writer will be called to save the actual data.
+    This function takes in startup data in the form of a JSON object / Python dictionary or a StartupDocument. After calling the generate_user_edited_data function to basically validate it, the startup data is checked for duplicate startup items and, if the variable preflight_on_save in CompStart.py is set, for program paths that can't be launched. Either is reported but the startup data is still saved. Then json_writer will be called to save the actual data. In journaled storage mode, if the changes are only replaced startup items, startup items added to the end or a single deleted startup item, they are appended to the journal instead.
 
     Args:
-        json_data (dict): A dictionary containing the JSON startup data to save to disk.
+        json_data (dict): A dictionary or StartupDocument containing the JSON startup data to save to disk.
 
         json_path (list): A list containing the relative or absolute path to the JSON file with each list item representing one subfolder from Current Working Directory (CWD)
 
@@ -390,61 +820,95 @@ def json_saver(json_data: dict, json_path: list, json_filename: str):
 
         string: An error message to display if the JSON data couldn't be written to disk or a message that it was written successfully
     """
-    # Call the generate_user_edited_data function for scenario 4
-    new_json_data = deps_data_gen.generate_user_edited_data(
-        copy.deepcopy(json_data), ENUM_ITV.FULL.value
-    )
+    # Call the generate_user_edited_data function for scenario 4, which already returns a copy
+    new_json_data = deps_data_gen.generate_user_edited_data(json_data, ENUM_ITV.FULL.value)
 
     # Grab the full file path and name
     data_file = deps_helper.parse_full_path(json_path, json_filename)
 
+    # Duplicate startup items don't stop the startup data from being saved, but the user should know about them
+    if len(new_json_data) > 0:
+        has_duplicates, duplicate_report, duplicate_groups = deps_dedup.duplicate_checker(
+            new_json_data[ENUM_JSK.ITEMS.value]
+        )
+
+        if has_duplicates:
+            print(duplicate_report)
+            print('Choose "Find duplicate startup items" in the editor to go through them')
+
+        # Checking the program paths touches the disk, so it's only done on save if the variable preflight_on_save in CompStart.py is set
+        if deps_helper.is_preflight_on_save():
+            json_preflight(new_json_data)
+
+    # In journaled storage mode, work out if the changes can be saved as journal records instead
+    journal_records = None
+    if deps_helper.is_journal_mode() and len(new_json_data) > 0:
+        cache_hit, orig_json_data = deps_cache.cache_lookup(data_file)
+        if cache_hit:
+            journal_records = deps_journal.journal_differ(orig_json_data, new_json_data)
+
     # Save the actual data
-    status_state, status_message = json_writer(data_file, 2, new_json_data)
+    if journal_records:
+        status_state, status_message = deps_journal.journal_saver(
+            data_file, new_json_data, journal_records
+        )
+    else:
+        status_state, status_message = json_writer(data_file, 2, new_json_data)
+
+    # The edited startup data is now on disk, so it can be cached and is no longer dirty
+    if status_state and len(new_json_data) > 0:
+        if isinstance(json_data, deps_document.StartupDocument):
+            deps_cache.cache_store(data_file, json_data)
+        else:
+            deps_cache.cache_store(data_file, new_json_data)
+        deps_cache.set_dirty(data_file, False)
 
     return (status_state, status_message)
 
 
-def json_pruner(curr_json_data: dict, item_number: int):
+def json_pruner(curr_json_document: deps_document.StartupDocument, item_number: int):
     """Function to remove a whole startup item from existing startup data
 
     This function will remove the item and update the startup data as necessary
 
     Args:
-        curr_json_data (dict): The existing full startup data
+        curr_json_document (StartupDocument): The existing full startup data
 
         item_number (int): The number of the startup item to delete
 
     Returns:
-        dict: A dictionary containing the updated startup data
+        StartupDocument: The updated startup data, or the existing startup data if the startup item couldn't be deleted
     """
-    temp_json_data = copy.deepcopy(curr_json_data)
-    prune_item = temp_json_data[ENUM_JSK.ITEMS.value][item_number - 1]
+    updated_json_document = curr_json_document
+    prune_item = curr_json_document.get_item(item_number)
 
-    updated_json_data = deps_data_gen.generate_user_edited_data(
-        prune_item, ENUM_ITV.DELETE.value, temp_json_data
+    new_json_document = deps_data_gen.generate_user_edited_data(
+        prune_item, ENUM_ITV.DELETE.value, curr_json_document
     )
 
-    print("\nStartup item {} was successfully deleted".format(item_number))
+    if isinstance(new_json_document, deps_document.StartupDocument):
+        updated_json_document = new_json_document
+        print("\nStartup item {} was successfully deleted".format(item_number))
 
-    return updated_json_data
+    return updated_json_document
 
 
-def json_adder(curr_json_data: dict):
+def json_adder(curr_json_document: deps_document.StartupDocument):
     """Function to add one or more startup items to the existing startup file
 
     This function will allow the user to choose how many startup items they want to add, and then loop through so they can add each item one by one
 
     Args:
-        curr_json_data (dict): The existing full startup data
+        curr_json_document (StartupDocument): The existing full startup data
 
     Returns:
-        dict: A dictionary containing the updated startup data
+        StartupDocument: The updated startup data
     """
     # Initialize function variables
     num_startup_items = 0
 
-    # Get a temp copy of the passed in startup data
-    new_json_data = copy.deepcopy(curr_json_data)
+    # A StartupDocument can't be modified, so there's no need to copy it
+    new_json_document = curr_json_document
 
     # Ask user how many startup items they want to add and loop until the user enters a valid integer
     quit_loop = False
@@ -467,8 +931,8 @@ def json_adder(curr_json_data: dict):
 
     # Make sure the user specified a number greater than 0
     if num_startup_items > 0:
-        # Get the current total items in the startup file
-        curr_total_items = deps_helper.get_count_total_items()
+        # Get the current total items in the startup data, which can include unsaved startup items
+        curr_total_items = curr_json_document.total_items()
 
         # Create an item counter
         item_num = 0
@@ -479,19 +943,24 @@ def json_adder(curr_json_data: dict):
 
             # Check if the user actually created a startup item
             if not len(startup_item) == 0:
-                new_json_data = deps_data_gen.generate_user_edited_data(
-                    startup_item, ENUM_ITV.ADD.value, new_json_data
+                updated_json_document = deps_data_gen.generate_user_edited_data(
+                    startup_item, ENUM_ITV.ADD.value, new_json_document
                 )
 
-                print(
-                    "\nStartup item {} was successfully created".format(startup_item["ItemNumber"])
-                )
+                if isinstance(updated_json_document, deps_document.StartupDocument):
+                    new_json_document = updated_json_document
+
+                    print(
+                        "\nStartup item {} was successfully created".format(
+                            new_json_document.total_items()
+                        )
+                    )
 
-                # Update the item counter
-                item_num += 1
+                    # Update the item counter
+                    item_num += 1
             else:
                 print("\nSkipped creating the startup item")
     else:
         print("\nNo startup items were added...")
 
-    return copy.deepcopy(new_json_data)
+    return new_json_document
@@ -0,0 +1,365 @@
+# Dependency to store the helper functions that launch the startup items, which is the Python version of what CompStart.ps1 does
+
+import os, time
+
+import dependencies.cs_helper as deps_helper
+import dependencies.cs_jsonfn as deps_json
+import dependencies.cs_pretty as deps_pretty
+import dependencies.cs_enum as deps_enum
+import dependencies.cs_model as deps_model
+import dependencies.cs_schedule as deps_schedule
+import dependencies.cs_throttle as deps_throttle
+import dependencies.cs_timing as deps_timing
+import dependencies.cs_coalesce as deps_coalesce
+
+ENUM_JSK = deps_enum.JsonSchemaKeys
+
+# Each launched startup item gives back a launch result, which is a dictionary with the following keys:
+# ItemNumber: the ItemNumber of the startup item
+# Name: the Name of the startup item
+# Started: whether the program was started successfully
+# ProcessId: the process ID of the started program, or 0 if it wasn't started
+# QueueDelay: the number of seconds from the start of the launch until a worker picked up the startup item
+# SpawnLatency: the number of seconds it took to start the program
+# SpawnStart: the time, in seconds since the epoch, that starting the program began, or None if it was never tried
+# SpawnEnd: the time, in seconds since the epoch, that starting the program finished, or None if it was never tried
+# ExitStatus: the exit status of the program if it had already exited by the end of its launch, or None if it was still running or wasn't started
+# ReadyTime: the number of seconds from starting the program until it was ready for input, or None if that wasn't measured
+# Error: the error message if the program couldn't be started, or blank otherwise
+# MergedItems: the ItemNumbers of the startup items launched along with this one, or an empty list if it was launched on its own
+
+
+def get_spawn_options():
+    """Helper function to get the options that start a program detached from CompStart
+
+    The started programs shouldn't be tied to the console CompStart runs in, the same way Start-Process in CompStart.ps1 starts them. On Windows, each program gets its own process group without a console, while on other systems each program gets its own session. The standard streams aren't passed on either way.
+
+    Returns:
+        dict: The keyword arguments to pass to subprocess.Popen
+    """
+    # subprocess is only needed once something is launched
+    import subprocess
+
+    spawn_options = {
+        "stdin": subprocess.DEVNULL,
+        "stdout": subprocess.DEVNULL,
+        "stderr": subprocess.DEVNULL,
+        "close_fds": True,
+    }
+
+    if os.name == "nt":
+        spawn_options["creationflags"] = (
+            subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+        )
+    else:
+        spawn_options["start_new_session"] = True
+
+    return spawn_options
+
+
+def wait_for_ready(process: "subprocess.Popen", ready_timeout: float):
+    """Helper function to wait until a started program is ready for input
+
+    A program is ready once it has finished loading and is waiting for the user, which is measured with the WaitForInputIdle function on Windows. There is no equivalent on other systems, and programs without a window, such as console programs, never become ready in this sense, so the time isn't measured for those.
+
+    Args:
+        process (subprocess.Popen): The started program
+
+        ready_timeout (float): The most seconds to wait
+
+    Returns:
+        float: The number of seconds until the program was ready, or None if it couldn't be measured or the program wasn't ready in time
+    """
+    ready_time = None
+    wait_start = time.perf_counter()
+
+    if os.name == "nt":
+        import ctypes
+
+        try:
+            # WaitForInputIdle gives back 0 once the program is ready, or an error or timeout value otherwise
+            if ctypes.windll.user32.WaitForInputIdle(int(process._handle), int(ready_timeout * 1000)) == 0:
+                ready_time = time.perf_counter() - wait_start
+        except (OSError, AttributeError):
+            pass
+
+    return ready_time
+
+
+def launch_startup_item(startup_item: dict, launch_start: float):
+    """Function to start the program for a single startup item without waiting for it to finish
+
+    The program at FilePath is started with each string in ArgumentList passed as its own argument, exactly as startup_item.schema.json defines them. Unlike CompStart.ps1, the arguments aren't joined into one string first, so an argument with a space in it stays a single argument.
+
+    If the variable launch_ready_timeout in CompStart.py is more than 0, the worker also waits for the program to be ready before moving on to the next startup item, so the launch result can include how long that took.
+
+    Args:
+        startup_item (dict): The startup item to launch
+
+        launch_start (float): The time, from time.perf_counter, that the launch of all the startup items started
+
+    Returns:
+        dict: The launch result for the startup item. See the comment at the top of this module for the keys.
+    """
+    import subprocess
+
+    spawn_start = time.perf_counter()
+
+    launch_result = {
+        "ItemNumber": startup_item[ENUM_JSK.ITEMNUMBER.value],
+        "Name": startup_item[ENUM_JSK.NAME.value],
+        "Started": False,
+        "ProcessId": 0,
+        "QueueDelay": spawn_start - launch_start,
+        "SpawnLatency": 0.0,
+        "SpawnStart": time.time(),
+        "SpawnEnd": None,
+        "ExitStatus": None,
+        "ReadyTime": None,
+        "Error": "",
+        "MergedItems": [],
+    }
+    process = None
+
+    try:
+        process = subprocess.Popen(
+            [startup_item[ENUM_JSK.FILEPATH.value]] + startup_item[ENUM_JSK.ARGUMENTLIST.value],
+            **get_spawn_options(),
+        )
+
+        launch_result["Started"] = True
+        launch_result["ProcessId"] = process.pid
+    except Exception as error:
+        launch_result["Error"] = deps_pretty.prettify_io_error(error)
+
+    launch_result["SpawnLatency"] = time.perf_counter() - spawn_start
+    launch_result["SpawnEnd"] = time.time()
+
+    if process is not None:
+        ready_timeout = deps_helper.get_launch_ready_timeout()
+        if ready_timeout > 0:
+            launch_result["ReadyTime"] = wait_for_ready(process, ready_timeout)
+
+        # A program that has already exited, such as one that handed off to an instance that was already running, has an exit status
+        launch_result["ExitStatus"] = process.poll()
+
+    return launch_result
+
+
+def launch_startup_items(json_data: dict, max_workers: int = 0):
+    """Function to launch all the startup items in the startup data at the same time
+
+    The startup items are handed to a pool of worker threads, and each worker starts one program at a time. Starting a program mostly means waiting on the operating system, so with enough workers the time until all programs are started depends on the number of workers rather than the number of startup items.
+
+    The order comes from the class LaunchScheduler in the module cs_schedule. A startup item is only handed to a worker once all the startup items in its After key have been started, and of the startup items that are ready, the ones with a higher Priority go first. Startup data without any Priority or After keys is launched in ItemNumber order.
+
+    Startup items with the same FilePath are combined first where the program can open all of their URLs or files in one program start, by the function coalesce_items in the module cs_coalesce. Only the startup item leading each combined launch has a launch result, with the others in its MergedItems.
+
+    How many startup items are started at the same time comes from the class LaunchThrottle in the module cs_throttle. If the startup data has a LaunchPolicy object, the next startup item is held back while the computer is busy and the number of workers is MaxInFlight. Otherwise, the number of workers is the only limit.
+
+    Args:
+        json_data (dict): The full startup data, which has already been validated. This can also be a StartupData or StartupDocument.
+
+        max_workers (int, optional): The most programs to start at the same time when the startup data has no LaunchPolicy object. Defaults to 0, in which case the variable launch_workers in CompStart.py is used.
+
+    Returns:
+        bool: True if every startup item was started successfully, False if not
+
+        string: A message with how many startup items were started and how long it took
+
+        list: The launch result for each launch in the order of the startup items. See the comment at the top of this module for the keys.
+    """
+    # concurrent.futures is only needed once the startup items are launched
+    from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+    # Initialize function variables
+    json_data = deps_model.model_to_json(json_data)
+    items_list, merged_numbers, merged_policies = deps_coalesce.coalesce_items(json_data[ENUM_JSK.ITEMS.value])
+    launch_results = [None] * len(items_list)
+    running_items = {}
+
+    if max_workers < 1:
+        max_workers = deps_helper.get_launch_workers()
+
+    launch_scheduler = deps_schedule.LaunchScheduler(items_list)
+    launch_throttle = deps_throttle.LaunchThrottle(
+        deps_throttle.get_launch_policy(json_data), max_workers
+    )
+    launch_start = time.perf_counter()
+
+    if len(items_list) > 0:
+        # There's no need for more workers than startup items
+        with ThreadPoolExecutor(
+            max_workers=min(launch_throttle.max_in_flight, len(items_list))
+        ) as executor:
+            while launch_scheduler.has_ready() or running_items:
+                # Only hand out startup items the throttle lets through, so a startup item that becomes ready later can still go ahead of ones with a lower Priority
+                while launch_scheduler.has_ready() and launch_throttle.admit(len(running_items)):
+                    item_index = launch_scheduler.next_ready()
+                    running_items[
+                        executor.submit(launch_startup_item, items_list[item_index], launch_start)
+                    ] = item_index
+
+                # If the throttle is holding back a startup item, check again after the poll interval
+                poll_interval = None
+                if launch_scheduler.has_ready():
+                    poll_interval = launch_throttle.get_poll_interval()
+
+                if running_items:
+                    done_items = wait(
+                        running_items, timeout=poll_interval, return_when=FIRST_COMPLETED
+                    )[0]
+                else:
+                    done_items = set()
+                    time.sleep(poll_interval)
+
+                for done_item in done_items:
+                    item_index = running_items.pop(done_item)
+                    launch_results[item_index] = done_item.result()
+                    launch_scheduler.mark_launched(item_index)
+
+    # Startup items waiting on each other in a loop are never handed out, which validation should already have stopped
+    for item_index, startup_item in enumerate(items_list):
+        if launch_results[item_index] is None:
+            launch_results[item_index] = {
+                "ItemNumber": startup_item[ENUM_JSK.ITEMNUMBER.value],
+                "Name": startup_item[ENUM_JSK.NAME.value],
+                "Started": False,
+                "ProcessId": 0,
+                "QueueDelay": 0.0,
+                "SpawnLatency": 0.0,
+                "SpawnStart": None,
+                "SpawnEnd": None,
+                "ExitStatus": None,
+                "ReadyTime": None,
+                "Error": "The startup item waits on startup items that wait on it in turn",
+                "MergedItems": [],
+            }
+
+    for launch_result in launch_results:
+        launch_result["MergedItems"] = merged_numbers.get(launch_result["ItemNumber"], [])
+
+    launch_time = time.perf_counter() - launch_start
+    # A combined launch starts every startup item in it
+    started_count = sum(
+        1 + len(launch_result["MergedItems"]) for launch_result in launch_results if launch_result["Started"]
+    )
+    total_items = len(json_data[ENUM_JSK.ITEMS.value])
+
+    launch_success = started_count == total_items
+    return_message = (
+        f"Started {started_count} of {total_items} startup items in {launch_time * 1000:.1f} ms"
+    )
+
+    if len(merged_numbers) > 0:
+        return_message += (
+            f", combining startup items saved {deps_coalesce.get_saved_launches(merged_numbers)} program start(s)"
+        )
+
+    if launch_throttle.hold_count > 0:
+        return_message += (
+            f", holding back startup items {launch_throttle.hold_count} times while the computer was busy"
+        )
+
+    return (launch_success, return_message, launch_results)
+
+
+def launch_previewer(json_path: list, json_filename: str):
+    """Function to read in the startup file and work out how its startup items would be launched, without launching anything
+
+    This is a dry run of the function startup_launcher. The startup items are combined by the function coalesce_items in the module cs_coalesce and put in launch order the same way, so the preview shows exactly which startup items would share a program start.
+
+    Args:
+        json_path (list): A list containing the relative or absolute path to the JSON file with each list item representing one subfolder from Current Working Directory (CWD)
+
+        json_filename (str): The filename of the JSON file
+
+    Returns:
+        bool: True if the startup data was read in successfully, False if not
+
+        string: An error message to display if the startup data couldn't be read in, or a message with how many program starts the launch would take
+
+        list: A dictionary for each launch in launch order, with the keys ItemNumber, Name, CommandLine, MergedItems and Policy, or an empty list if the startup data couldn't be read in. Policy is the name of the policy the startup items were combined with, or blank if the startup item is launched on its own.
+    """
+    import subprocess
+
+    # Initialize function variables
+    plan_rows = []
+
+    status_state, status_message, json_document = deps_json.document_reader(
+        json_path, json_filename
+    )
+
+    if status_state:
+        items_list = json_document.to_json()[ENUM_JSK.ITEMS.value]
+        merged_items, merged_numbers, merged_policies = deps_coalesce.coalesce_items(items_list)
+
+        for item_index in deps_schedule.get_launch_order(merged_items):
+            startup_item = merged_items[item_index]
+            item_number = startup_item[ENUM_JSK.ITEMNUMBER.value]
+
+            plan_rows.append(
+                {
+                    "ItemNumber": item_number,
+                    "Name": startup_item[ENUM_JSK.NAME.value],
+                    "CommandLine": subprocess.list2cmdline(
+                        [startup_item[ENUM_JSK.FILEPATH.value]] + startup_item[ENUM_JSK.ARGUMENTLIST.value]
+                    ),
+                    "MergedItems": merged_numbers.get(item_number, []),
+                    "Policy": merged_policies.get(item_number, ""),
+                }
+            )
+
+        status_message = (
+            f"Launching {len(items_list)} startup items would take {len(plan_rows)} program start(s)"
+        )
+
+        if len(merged_numbers) > 0:
+            status_message += (
+                f", since combining startup items saves {deps_coalesce.get_saved_launches(merged_numbers)}"
+            )
+    else:
+        status_message = "Could not read in the startup data to preview"
+        deps_pretty.prettify_custom_error(status_message, "launch_previewer")
+
+    return (status_state, status_message, plan_rows)
+
+
+def startup_launcher(json_path: list, json_filename: str):
+    """Function to read in the startup file and launch all of its startup items
+
+    Args:
+        json_path (list): A list containing the relative or absolute path to the JSON file with each list item representing one subfolder from Current Working Directory (CWD)
+
+        json_filename (str): The filename of the JSON file
+
+    Returns:
+        bool: True if every startup item was started successfully, False if not
+
+        string: An error message to display if the startup data couldn't be read in, or a message with how many startup items were started
+
+        list: The launch result for each startup item, or an empty list if the startup data couldn't be read in
+    """
+    # Initialize function variables
+    launch_results = []
+
+    status_state, status_message, json_document = deps_json.document_reader(
+        json_path, json_filename
+    )
+
+    if status_state:
+        status_state, status_message, launch_results = launch_startup_items(json_document)
+
+        # Keep the launch timings for the slowest items report, which doesn't stop the launch from counting if it fails
+        history_success, history_message = deps_timing.history_writer(
+            deps_helper.parse_full_path(json_path, json_filename), launch_results
+        )
+        if not history_success:
+            deps_pretty.prettify_custom_error(history_message, "startup_launcher > history_writer")
+    else:
+        status_message = "Could not read in the startup data to launch"
+
+    if not status_state:
+        deps_pretty.prettify_custom_error(status_message, "startup_launcher")
+
+    return (status_state, status_message, launch_results)
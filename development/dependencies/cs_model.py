@@ -0,0 +1,170 @@
+# Dependency to store the record types for startup data, which are a compact alternative to holding startup items as dictionaries
+
+from dataclasses import dataclass, field
+
+import dependencies.cs_enum as deps_enum
+import dependencies.cs_document as deps_document
+
+ENUM_JSK = deps_enum.JsonSchemaKeys
+
+
+@dataclass(slots=True)
+class StartupItem:
+    """Class for a single startup item based on startup_item.schema.json
+
+    Each key of a startup item is stored as an attribute in a slot instead of as a dictionary entry, which takes up less memory per startup item and is faster to read than looking up the key through the Enum class JsonSchemaKeys. The function to_json turns the startup item back into the dictionary the JSON schema describes and from_json does the reverse, so no data is lost going either way.
+
+    Attributes:
+        item_number (int): The ItemNumber of the startup item
+
+        name (str): The Name of the startup item
+
+        file_path (str): The FilePath of the program to run
+
+        description (str): The Description of the startup item
+
+        browser (bool): The Browser property, which is True if the startup item is for a browser window
+
+        argument_count (int): The ArgumentCount, or number of arguments to pass to the program
+
+        argument_list (list): The ArgumentList, or arguments to pass to the program
+
+        priority (int): The optional Priority of the startup item, or None if the startup item doesn't have one
+
+        after (list): The optional After array with the Names of the startup items to launch first, or None if the startup item doesn't have one
+
+        separate_launch (bool): The optional SeparateLaunch property, which is True if the startup item is never launched together with other startup items, or None if the startup item doesn't have one
+    """
+
+    item_number: int
+    name: str
+    file_path: str
+    description: str = ""
+    browser: bool = False
+    argument_count: int = 0
+    argument_list: list = field(default_factory=list)
+    priority: int = None
+    after: list = None
+    separate_launch: bool = None
+
+    @classmethod
+    def from_json(cls, startup_item: dict):
+        """Function to create a StartupItem from a startup item dictionary
+
+        Args:
+            startup_item (dict): The startup item, which must be valid against startup_item.schema.json. It is copied, so it can still be modified afterwards.
+
+        Returns:
+            StartupItem: The new StartupItem
+        """
+        return cls(
+            startup_item[ENUM_JSK.ITEMNUMBER.value],
+            startup_item[ENUM_JSK.NAME.value],
+            startup_item[ENUM_JSK.FILEPATH.value],
+            startup_item[ENUM_JSK.DESCRIPTION.value],
+            startup_item[ENUM_JSK.BROWSER.value],
+            startup_item[ENUM_JSK.ARGUMENTCOUNT.value],
+            list(startup_item[ENUM_JSK.ARGUMENTLIST.value]),
+            startup_item.get(ENUM_JSK.PRIORITY.value),
+            list(startup_item[ENUM_JSK.AFTER.value]) if ENUM_JSK.AFTER.value in startup_item else None,
+            startup_item.get(ENUM_JSK.SEPARATELAUNCH.value),
+        )
+
+    def to_json(self):
+        """Function to turn the StartupItem back into a startup item dictionary
+
+        Returns:
+            dict: A new dictionary with the keys in the order of startup_item.schema.json, which can be modified freely. The optional keys are only included if the StartupItem has them.
+        """
+        startup_item = {
+            ENUM_JSK.ITEMNUMBER.value: self.item_number,
+            ENUM_JSK.NAME.value: self.name,
+            ENUM_JSK.FILEPATH.value: self.file_path,
+            ENUM_JSK.DESCRIPTION.value: self.description,
+            ENUM_JSK.BROWSER.value: self.browser,
+            ENUM_JSK.ARGUMENTCOUNT.value: self.argument_count,
+            ENUM_JSK.ARGUMENTLIST.value: list(self.argument_list),
+        }
+
+        if self.priority is not None:
+            startup_item[ENUM_JSK.PRIORITY.value] = self.priority
+
+        if self.after is not None:
+            startup_item[ENUM_JSK.AFTER.value] = list(self.after)
+
+        if self.separate_launch is not None:
+            startup_item[ENUM_JSK.SEPARATELAUNCH.value] = self.separate_launch
+
+        return startup_item
+
+
+@dataclass(slots=True)
+class StartupData:
+    """Class for the full startup data based on startup_data.schema.json
+
+    The startup items are held as StartupItem objects. The TotalItems property is kept as its own attribute rather than worked out from the startup items, so startup data where TotalItems is wrong still turns back into exactly the same JSON data.
+
+    Attributes:
+        total_items (int): The TotalItems property of the startup data
+
+        items (list): The startup items as StartupItem objects
+
+        launch_policy (dict): The optional LaunchPolicy object, or None if the startup data doesn't have one
+    """
+
+    total_items: int = 0
+    items: list = field(default_factory=list)
+    launch_policy: dict = None
+
+    @classmethod
+    def from_json(cls, json_data: dict):
+        """Function to create a StartupData from the full startup data
+
+        Args:
+            json_data (dict): The full startup data, which must be valid against startup_data.schema.json. It is copied, so it can still be modified afterwards.
+
+        Returns:
+            StartupData: The new StartupData
+        """
+        return cls(
+            json_data[ENUM_JSK.TOTALITEMS.value],
+            [StartupItem.from_json(startup_item) for startup_item in json_data[ENUM_JSK.ITEMS.value]],
+            (
+                dict(json_data[ENUM_JSK.LAUNCHPOLICY.value])
+                if ENUM_JSK.LAUNCHPOLICY.value in json_data
+                else None
+            ),
+        )
+
+    def to_json(self):
+        """Function to turn the StartupData back into the full startup data
+
+        Returns:
+            dict: A new dictionary with the full startup data, which can be modified freely
+        """
+        json_data = {
+            ENUM_JSK.TOTALITEMS.value: self.total_items,
+            ENUM_JSK.ITEMS.value: [startup_item.to_json() for startup_item in self.items],
+        }
+
+        if self.launch_policy is not None:
+            json_data[ENUM_JSK.LAUNCHPOLICY.value] = dict(self.launch_policy)
+
+        return json_data
+
+
+def model_to_json(json_value):
+    """Helper function to turn a StartupItem, StartupData or StartupDocument into the matching JSON data
+
+    This lets functions that work with startup data as dictionaries also accept the record types. Any other value, such as a dictionary, is returned as it is.
+
+    Args:
+        json_value: A StartupItem, StartupData, StartupDocument or JSON data
+
+    Returns:
+        dict: The JSON data, which is a new dictionary if json_value had to be converted
+    """
+    if isinstance(json_value, (StartupItem, StartupData, deps_document.StartupDocument)):
+        json_value = json_value.to_json()
+
+    return json_value
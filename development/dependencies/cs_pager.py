@@ -0,0 +1,175 @@
+# Dependency to store the functions that show the startup data a page at a time
+
+import dependencies.cs_helper as deps_helper
+import dependencies.cs_jsonfn as deps_json
+import dependencies.cs_pretty as deps_pretty
+import dependencies.cs_cache as deps_cache
+import dependencies.cs_journal as deps_journal
+import dependencies.cs_document as deps_document
+import dependencies.cs_stream as deps_stream
+
+# How many startup items are shown on each page
+VIEW_PAGE_SIZE = 10
+
+
+def page_reader(item_source, page_start: int, max_items: int):
+    """Helper function to get the startup items for a page from either a StartupDocument or a StartupFileReader
+
+    Args:
+        item_source (StartupDocument | StartupFileReader): Where to get the startup items from
+
+        page_start (int): The index of the first startup item on the page
+
+        max_items (int): The most startup items to get
+
+    Returns:
+        list: The startup items, which is shorter than max_items if the last startup item was reached
+
+    Raises:
+        ValueError: If the startup items are read in from a startup file that isn't valid JSON
+    """
+    if isinstance(item_source, deps_document.StartupDocument):
+        last_number = min(page_start + max_items, item_source.total_items())
+        page_items = [item_source.get_item(item_number) for item_number in range(page_start + 1, last_number + 1)]
+    else:
+        page_items = item_source.read_items(page_start, max_items)
+
+    return page_items
+
+
+def get_viewer_total(item_source):
+    """Helper function to get the number of startup items to show in the viewer
+
+    Args:
+        item_source (StartupDocument | StartupFileReader): Where the startup items are read in from
+
+    Returns:
+        int: The number of startup items, or None if it isn't known yet
+    """
+    if isinstance(item_source, deps_document.StartupDocument):
+        total_items = item_source.total_items()
+    elif item_source.item_count is not None:
+        total_items = item_source.item_count
+    else:
+        total_items = item_source.header_data.get("TotalItems")
+
+    return total_items
+
+
+def startup_viewer(json_path: list, json_filename: str):
+    """Function to show the startup data a page at a time, letting the user move to the next or previous page or jump to any startup item
+
+    The startup items are read in from the startup file only as each page is shown, using a StartupFileReader from the module cs_stream. This means the first page of even a very large startup file is shown right away, and only the startup items on the page are kept in memory. Each startup item is validated as it is read in.
+
+    If the startup data is already in the document cache, the pages are taken from there instead. The startup file is also read in as a whole if it has a journal, since the startup items on disk don't have the journal records replayed over them.
+
+    Args:
+        json_path (list): A list containing the relative or absolute path to the JSON file with each list item representing one subfolder from Current Working Directory (CWD)
+
+        json_filename (str): The filename of the JSON file
+
+    Returns:
+        bool: True if the startup data was shown without any errors, False otherwise
+
+        str: A message about the result
+    """
+    # Initialize function variables
+    view_success = False
+    return_message = ""
+    item_source = None
+    page_start = 0
+    quit_loop = False
+
+    # Get the full path to the file in string format
+    json_file = deps_helper.parse_full_path(json_path, json_filename)
+
+    # Use the cached startup data if there is any, and read in the whole startup file if a journal has to be replayed
+    cache_hit, item_source = deps_cache.document_lookup(json_file)
+
+    if not cache_hit and deps_journal.journal_exists(json_file):
+        cache_hit, return_message, item_source = deps_json.document_reader(json_path, json_filename)
+    elif not cache_hit:
+        try:
+            file_reader = deps_stream.StartupFileReader(json_file)
+            file_reader.open()
+            item_source = file_reader
+        except Exception as error:
+            return_message = deps_pretty.prettify_io_error(error, "r")
+            deps_pretty.prettify_custom_error(return_message, "startup_viewer")
+
+    if item_source is not None:
+        try:
+            while not quit_loop:
+                # Get one more startup item than fits on the page to know if there is a next page
+                page_items = page_reader(item_source, page_start, VIEW_PAGE_SIZE + 1)
+                has_next_page = len(page_items) > VIEW_PAGE_SIZE
+                page_items = page_items[:VIEW_PAGE_SIZE]
+
+                # The startup items in the document cache were validated when they were read in
+                if not cache_hit:
+                    schema_validator = deps_helper.get_schema_validator(True)
+                    for item_offset, startup_item in enumerate(page_items):
+                        deps_json.stream_item_validator(startup_item, page_start + item_offset, schema_validator)
+
+                if page_start == 0 and len(page_items) == 0:
+                    print("\nThere are no startup items to display!")
+                    break
+
+                # Show the page
+                total_items = get_viewer_total(item_source)
+                page_header = f"\nStartup items {page_start + 1}-{page_start + len(page_items)}"
+                if total_items is not None:
+                    page_count = (total_items + VIEW_PAGE_SIZE - 1) // VIEW_PAGE_SIZE
+                    page_header += f" of {total_items} (page {page_start // VIEW_PAGE_SIZE + 1} of {page_count})"
+                print(page_header)
+
+                for pretty_item in deps_pretty.iter_pretty_items(page_items):
+                    print(pretty_item, end="")
+
+                # Ask the user where to go next, staying on the same page if the choice is invalid
+                user_input = input(
+                    "\n[N] Next page  [P] Previous page  [J] Jump to a startup item  [B] Back to the main menu"
+                    "\nWhat would you like to do? (press enter for the next page) "
+                ).strip().upper()
+
+                if user_input in ["", "N"]:
+                    if has_next_page:
+                        page_start += VIEW_PAGE_SIZE
+                    else:
+                        print("\nThis is the last page.")
+                elif user_input == "P":
+                    if page_start > 0:
+                        page_start -= VIEW_PAGE_SIZE
+                    else:
+                        print("\nThis is the first page.")
+                elif user_input == "J":
+                    question_prompt = "Which startup item would you like to jump to"
+                    if total_items is not None:
+                        question_prompt += f" [1-{total_items}]"
+                    user_input = input(question_prompt + "? ")
+
+                    # The page is only changed if there is a startup item with that number
+                    if not user_input.isnumeric() or int(user_input) < 1:
+                        print("\nThat choice is invalid!")
+                    else:
+                        item_index = int(user_input) - 1
+
+                        if len(page_reader(item_source, item_index, 1)) == 0:
+                            print(f"\nThere is no startup item #{user_input}!")
+                        else:
+                            page_start = item_index // VIEW_PAGE_SIZE * VIEW_PAGE_SIZE
+                elif user_input == "B":
+                    quit_loop = True
+                else:
+                    print("\nThat choice is invalid!")
+
+            view_success = True
+            return_message = "Finished viewing the startup data"
+        except Exception as error:
+            return_message = deps_pretty.prettify_io_error(error, "r")
+            deps_pretty.prettify_custom_error(return_message, "startup_viewer")
+        finally:
+            if not cache_hit:
+                item_source.close()
+
+    return (view_success, return_message)
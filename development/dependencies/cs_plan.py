@@ -0,0 +1,165 @@
+# Dependency to store the helper functions that write the launch plan, which is a precompiled list of the startup items in launch order that CompStart.ps1 can start without reading in the startup file
+
+import os
+
+import dependencies.cs_helper as deps_helper
+import dependencies.cs_pretty as deps_pretty
+import dependencies.cs_enum as deps_enum
+import dependencies.cs_atomic as deps_atomic
+import dependencies.cs_journal as deps_journal
+import dependencies.cs_schedule as deps_schedule
+import dependencies.cs_model as deps_model
+import dependencies.cs_coalesce as deps_coalesce
+
+ENUM_JSK = deps_enum.JsonSchemaKeys
+
+# The extension added to the full path of the startup file to get the full path of its launch plan file
+PLAN_EXTENSION = ".plan"
+
+# The first field of the launch plan file, and the version of its format, which CompStart.ps1 checks before using it
+PLAN_MAGIC = "CompStartPlan"
+PLAN_VERSION = "1"
+
+# The launch plan file is a UTF-8 text file where each line is a list of fields separated by tabs:
+# The first line is the header, with PLAN_MAGIC, PLAN_VERSION, the SHA-256 digest of the startup file and the SHA-256 digest of its journal file, which is blank if there is no journal
+# Each line after that is one startup item in the order it's launched in, with the ItemNumber, the FilePath and the ArgumentList joined into one command line string
+# CompStart.ps1 only uses the launch plan if both digests match the files on disk, and otherwise reads in the startup file instead
+PLAN_SEPARATOR = "\t"
+
+# Characters that can't be written in a field of the launch plan file
+PLAN_RESERVED_CHARS = ("\t", "\r", "\n")
+
+
+def get_plan_file(json_file: str):
+    """Helper function to get the full path of the launch plan file for a startup file
+
+    Args:
+        json_file (str): The full absolute path of the startup file including filename and extension
+
+    Returns:
+        str: The full absolute path of the launch plan file
+    """
+    return json_file + PLAN_EXTENSION
+
+
+def get_file_digest(file_path: str):
+    """Helper function to get the digest of the bytes of a file, the same way the PowerShell cmdlet Get-FileHash does
+
+    Args:
+        file_path (str): The full absolute path of the file
+
+    Returns:
+        str: The SHA-256 digest of the file as a hexadecimal string, or a blank string if the file doesn't exist
+    """
+    # hashlib is only needed to get the file digests written to the launch plan
+    import hashlib
+
+    file_digest = ""
+
+    if os.path.isfile(file_path):
+        with open(file_path, "rb") as file:
+            file_digest = hashlib.sha256(file.read()).hexdigest()
+
+    return file_digest
+
+
+def plan_builder(json_data: dict, json_digest: str, journal_digest: str):
+    """Helper function to build the lines of the launch plan file
+
+    Startup items that can be launched together are combined first by the function coalesce_items in the module cs_coalesce, so each combined launch is a single line. The startup items are put in the order they're launched in, which comes from the function get_launch_order in the module cs_schedule. The ArgumentList of each startup item is joined into one string the same way Windows splits it back up, so an argument with a space in it stays a single argument, just like when the startup items are launched from CompStart.py.
+
+    Args:
+        json_data (dict): The full startup data. This can also be a StartupData or StartupDocument.
+
+        json_digest (str): The digest of the startup file
+
+        journal_digest (str): The digest of the journal file, or a blank string if there is no journal
+
+    Returns:
+        list: The lines of the launch plan file, or None if a FilePath or argument has a character that can't be written in the launch plan file
+    """
+    # subprocess is slow to import and is only needed once the startup data is saved
+    import subprocess
+
+    json_data = deps_model.model_to_json(json_data)
+    items_list = deps_coalesce.coalesce_items(json_data[ENUM_JSK.ITEMS.value])[0]
+
+    plan_lines = [PLAN_SEPARATOR.join((PLAN_MAGIC, PLAN_VERSION, json_digest, journal_digest))]
+
+    for item_index in deps_schedule.get_launch_order(items_list):
+        startup_item = items_list[item_index]
+
+        plan_fields = (
+            str(startup_item[ENUM_JSK.ITEMNUMBER.value]),
+            startup_item[ENUM_JSK.FILEPATH.value],
+            subprocess.list2cmdline(startup_item[ENUM_JSK.ARGUMENTLIST.value]),
+        )
+
+        if any(reserved_char in plan_field for plan_field in plan_fields for reserved_char in PLAN_RESERVED_CHARS):
+            plan_lines = None
+            break
+
+        plan_lines.append(PLAN_SEPARATOR.join(plan_fields))
+
+    return plan_lines
+
+
+def plan_writer(json_file: str, json_data: dict, json_digest: str = ""):
+    """Function to write the launch plan file for a startup file that has just been saved
+
+    If the launch plan can't be written, any old launch plan file is deleted so that CompStart.ps1 doesn't have to rely on the digests to know it's outdated. Either way, CompStart.ps1 then reads in the startup file like it did before there were launch plans.
+
+    Args:
+        json_file (str): The full absolute path of the startup file including filename and extension
+
+        json_data (dict): The full startup data that was saved, including any changes only saved to the journal. This can also be a StartupData or StartupDocument.
+
+        json_digest (str, optional): The digest of the bytes of the startup file, as returned by get_text_digest in the module cs_cache for the text just written to it, if it's already known. Defaults to a blank string, in which case the startup file is read in to get it.
+
+    Returns:
+        bool: True if the launch plan file was written successfully, False if not
+
+        string: An error message to display if the launch plan file couldn't be written or a message that it was written successfully
+    """
+    # Initialize function variables
+    write_plan_success = False
+    return_message = ""
+
+    try:
+        if json_digest == "":
+            json_digest = get_file_digest(json_file)
+
+        journal_digest = get_file_digest(deps_journal.get_journal_file(json_file))
+        plan_lines = plan_builder(json_data, json_digest, journal_digest)
+
+        if plan_lines is None:
+            return_message = "The startup data has a tab or line break in a program path or argument, so no launch plan was written"
+
+            plan_remover(json_file)
+        else:
+            deps_atomic.atomic_writer(
+                get_plan_file(json_file), "\n".join(plan_lines) + "\n", deps_helper.get_write_durability(), "utf-8"
+            )
+
+            write_plan_success = True
+            return_message = "Launch plan written successfully"
+    except Exception as error:
+        return_message = deps_pretty.prettify_io_error(error, "w")
+        plan_remover(json_file)
+
+    if not write_plan_success:
+        deps_pretty.prettify_custom_error(return_message, "plan_writer")
+
+    return (write_plan_success, return_message)
+
+
+def plan_remover(json_file: str):
+    """Helper function to delete the launch plan file for a startup file, if there is one
+
+    Args:
+        json_file (str): The full absolute path of the startup file including filename and extension
+    """
+    try:
+        os.remove(get_plan_file(json_file))
+    except OSError:
+        pass
@@ -0,0 +1,231 @@
+# Dependency to store the helper functions that check the FilePath of every startup item can still be launched, so a missing program is found while editing instead of at the next login
+
+import os, stat, time
+
+import dependencies.cs_helper as deps_helper
+import dependencies.cs_enum as deps_enum
+import dependencies.cs_model as deps_model
+
+ENUM_JSK = deps_enum.JsonSchemaKeys
+ENUM_PSV = deps_enum.PreflightStatusVals
+
+# The status of each FilePath already checked, by the folder it's in
+# Each folder has a tuple of the modification time of the folder when its FilePaths were checked, in nanoseconds, and a dictionary of the status of each FilePath in it
+# Adding, deleting or renaming anything in a folder changes its modification time, so the statuses are only used again while the modification time is the same
+# This means checking the startup data again only needs one stat of each folder instead of one for each FilePath, which matters most when the folders are on a network drive
+PREFLIGHT_CACHE = {}
+
+# The file extensions Windows runs as programs if the PATHEXT environment variable isn't set
+DEFAULT_PROGRAM_EXTENSIONS = ".COM;.EXE;.BAT;.CMD"
+
+# Each preflight result is a dictionary with the following keys:
+# ItemNumber: the ItemNumber of the startup item
+# Name: the Name of the startup item
+# FilePath: the FilePath of the startup item, as it is in the startup data
+# Status: one of the values of the Enum class PreflightStatusVals
+
+
+def get_program_extensions():
+    """Helper function to get the file extensions that can be run as programs
+
+    On Windows, whether a file can be run as a program depends on its extension. On other systems, it depends on the file's permissions instead.
+
+    Returns:
+        set: The file extensions in lower case, including the leading dot, or None if the file's permissions decide
+    """
+    program_extensions = None
+
+    if os.name == "nt":
+        program_extensions = {
+            file_extension.lower()
+            for file_extension in os.environ.get("PATHEXT", DEFAULT_PROGRAM_EXTENSIONS).split(os.pathsep)
+            if file_extension
+        }
+
+    return program_extensions
+
+
+def resolve_file_path(file_path: str):
+    """Helper function to get the full path that a FilePath launches
+
+    Any quotes around the FilePath are removed and any environment variables in it are filled in. A FilePath that is only a program name, such as notepad.exe, is looked for in the folders of the PATH environment variable, the same way it is when the startup item is launched.
+
+    Args:
+        file_path (str): The FilePath of a startup item
+
+    Returns:
+        str: The full absolute path
+    """
+    # shutil is only needed to look for a program in the PATH folders
+    import shutil
+
+    file_path = os.path.expandvars(file_path.strip().strip('"'))
+
+    if not os.path.dirname(file_path):
+        file_path = shutil.which(file_path) or file_path
+
+    return os.path.abspath(file_path)
+
+
+def file_status(file_path: str, program_extensions: set):
+    """Helper function to check a single full path
+
+    Args:
+        file_path (str): The full absolute path, as returned by resolve_file_path
+
+        program_extensions (set): The file extensions that can be run as programs, as returned by get_program_extensions
+
+    Returns:
+        str: One of the values of the Enum class PreflightStatusVals
+    """
+    try:
+        file_stat = os.stat(file_path)
+
+        if stat.S_ISDIR(file_stat.st_mode):
+            path_status = ENUM_PSV.NOT_FILE.value
+        elif program_extensions is not None:
+            if os.path.splitext(file_path)[1].lower() in program_extensions:
+                path_status = ENUM_PSV.OK.value
+            else:
+                path_status = ENUM_PSV.NOT_EXECUTABLE.value
+        elif os.access(file_path, os.X_OK):
+            path_status = ENUM_PSV.OK.value
+        else:
+            path_status = ENUM_PSV.NOT_EXECUTABLE.value
+    except (FileNotFoundError, NotADirectoryError):
+        path_status = ENUM_PSV.MISSING.value
+    except OSError:
+        path_status = ENUM_PSV.INACCESSIBLE.value
+
+    return path_status
+
+
+def folder_checker(folder_path: str, file_paths: list, program_extensions: set):
+    """Helper function to check all the full paths in one folder, using PREFLIGHT_CACHE where it's still up to date
+
+    Each folder is only ever checked by one worker thread at a time, so the statuses of a folder in PREFLIGHT_CACHE are never changed by two threads at once.
+
+    Args:
+        folder_path (str): The full absolute path of the folder
+
+        file_paths (list): The full absolute paths in the folder, as returned by resolve_file_path
+
+        program_extensions (set): The file extensions that can be run as programs, as returned by get_program_extensions
+
+    Returns:
+        dict: The status of each full path, which is one of the values of the Enum class PreflightStatusVals
+    """
+    # Initialize function variables
+    folder_mtime = None
+    folder_status = ""
+    path_statuses = {}
+
+    try:
+        folder_mtime = os.stat(folder_path).st_mtime_ns
+    except (FileNotFoundError, NotADirectoryError):
+        folder_status = ENUM_PSV.MISSING.value
+    except OSError:
+        folder_status = ENUM_PSV.INACCESSIBLE.value
+
+    if folder_status:
+        # Nothing in a folder that can't be found or opened can be launched, so there's no need to check each full path
+        path_statuses = {file_path: folder_status for file_path in file_paths}
+    else:
+        cached_folder = PREFLIGHT_CACHE.get(folder_path)
+
+        if cached_folder is not None and cached_folder[0] == folder_mtime:
+            cached_statuses = cached_folder[1]
+        else:
+            cached_statuses = {}
+            PREFLIGHT_CACHE[folder_path] = (folder_mtime, cached_statuses)
+
+        for file_path in file_paths:
+            if file_path not in cached_statuses:
+                cached_statuses[file_path] = file_status(file_path, program_extensions)
+
+            path_statuses[file_path] = cached_statuses[file_path]
+
+    return path_statuses
+
+
+def preflight_checker(startup_items, max_workers: int = 0):
+    """Function to check that the FilePath of every startup item can be launched
+
+    The FilePaths are grouped by the folder they're in, and the folders are handed to a pool of worker threads. Checking a FilePath mostly means waiting on the file system, so on a network drive the time taken depends on the number of workers rather than the number of folders. Each FilePath is only checked once, even if many startup items launch it, and the statuses are kept in PREFLIGHT_CACHE so checking the same startup data again only needs one stat of each folder.
+
+    Args:
+        startup_items (iterable): The startup items, such as the Items array of the startup data or the iter_items generator of a StartupDocument
+
+        max_workers (int, optional): The most folders to check at the same time. Defaults to 0, in which case the variable preflight_workers in CompStart.py is used.
+
+    Returns:
+        bool: True if every FilePath can be launched, False if not
+
+        string: A message with how many FilePaths were checked and how long it took
+
+        list: The preflight result for each startup item with a FilePath that can't be launched, in order. See the comment at the top of this module for the keys.
+    """
+    # concurrent.futures is only needed once the program paths are checked
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Initialize function variables
+    preflight_results = []
+    resolved_paths = {}
+    folder_paths = {}
+    path_statuses = {}
+
+    if max_workers < 1:
+        max_workers = deps_helper.get_preflight_workers()
+
+    preflight_start = time.perf_counter()
+    program_extensions = get_program_extensions()
+    startup_items = [deps_model.model_to_json(startup_item) for startup_item in startup_items]
+
+    # Many startup items can launch the same program, so each FilePath is only resolved and checked once
+    for startup_item in startup_items:
+        item_path = startup_item[ENUM_JSK.FILEPATH.value]
+
+        if item_path not in resolved_paths:
+            resolved_paths[item_path] = resolve_file_path(item_path)
+            folder_paths.setdefault(os.path.dirname(resolved_paths[item_path]), set()).add(resolved_paths[item_path])
+
+    # There's no need for worker threads if there's only one folder to check
+    if len(folder_paths) == 1:
+        for folder_path, file_paths in folder_paths.items():
+            path_statuses.update(folder_checker(folder_path, list(file_paths), program_extensions))
+    elif len(folder_paths) > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(folder_paths))) as executor:
+            folder_results = [
+                executor.submit(folder_checker, folder_path, list(file_paths), program_extensions)
+                for folder_path, file_paths in folder_paths.items()
+            ]
+
+            for folder_result in folder_results:
+                path_statuses.update(folder_result.result())
+
+    for startup_item in startup_items:
+        path_status = path_statuses[resolved_paths[startup_item[ENUM_JSK.FILEPATH.value]]]
+
+        if not path_status == ENUM_PSV.OK.value:
+            preflight_results.append(
+                {
+                    "ItemNumber": startup_item[ENUM_JSK.ITEMNUMBER.value],
+                    "Name": startup_item[ENUM_JSK.NAME.value],
+                    "FilePath": startup_item[ENUM_JSK.FILEPATH.value],
+                    "Status": path_status,
+                }
+            )
+
+    preflight_time = time.perf_counter() - preflight_start
+
+    preflight_success = len(preflight_results) == 0
+    return_message = (
+        f"Checked {len(resolved_paths)} program path(s) in {len(folder_paths)} folder(s) in {preflight_time * 1000:.1f} ms"
+    )
+
+    if preflight_success:
+        return_message += ", and every startup item can be launched"
+    else:
+        return_message += f", and {len(preflight_results)} startup item(s) can't be launched"
+
+    return (preflight_success, return_message, preflight_results)
@@ -1,19 +1,35 @@
 # Dependency to store the helper functions that print out data structures, such as errors or JSON data, in a prettified way to the screen
 
+import dependencies.cs_model as deps_model
+
 
 def prettify_json(json_data: dict):
     """Helper function to prettify the passed-in JSON data
 
-    This function will go through the JSON data dictionary and format the data to display it in a human readable manner
+    This function will go through the JSON data dictionary and format the data to display it in a human readable manner. The text is made by the generator iter_pretty_json and joined together once at the end.
 
     Args:
-        json_data (dict): The JSON data to prettify
+        json_data (dict): The JSON data to prettify. This can also be a StartupData or StartupDocument.
 
     Returns:
         str: The JSON data in a nicely formatted manner as a string
     """
+    return "".join(iter_pretty_json(json_data))
+
+
+def iter_pretty_json(json_data: dict):
+    """Helper function to prettify the passed-in JSON data one startup item at a time
+
+    This works the same as the function prettify_json, except that the text is handed back in parts as it is made instead of as one string. The parts joined together are the same as what prettify_json returns.
+
+    Args:
+        json_data (dict): The JSON data to prettify. This can also be a StartupData or StartupDocument.
+
+    Yields:
+        str: The line with the number of startup items first, and then each startup item in a nicely formatted manner
+    """
     # Create and initialize our function variables
-    pretty_data = "\n"
+    json_data = deps_model.model_to_json(json_data)
     total_items = json_data["TotalItems"]
     items_list = json_data["Items"]
 
@@ -21,22 +37,27 @@ def prettify_json(json_data: dict):
     if total_items > 0 and len(items_list) == 0:
         total_items = 0
 
-    # Start populating pretty_data
-    pretty_data += "Number of startup items: " + str(total_items) + "\n"
+    # If there are no startup items, display a different message
+    if total_items == 0:
+        yield "There are no startup items to display!"
+    else:
+        yield "\nNumber of startup items: " + str(total_items) + "\n"
 
-    # Go through all the startup items
-    for i in range(total_items):
-        # Get the specific startup item
-        item = items_list[i]
+        # Go through all the startup items
+        yield from iter_pretty_items(items_list[:total_items])
 
-        # Prettify the startup item data
-        pretty_data += prettify_startup_item(item) + "\n"
 
-    # If there are no startup items, display a different message
-    if total_items == 0:
-        pretty_data = "There are no startup items to display!"
+def iter_pretty_items(startup_items):
+    """Helper function to prettify startup items one at a time as they are needed
 
-    return pretty_data
+    Args:
+        startup_items (iterable): The startup items to prettify, which can be any iterable, such as a list or a generator reading them in from a file. Each one can also be a StartupItem.
+
+    Yields:
+        str: Each startup item in a nicely formatted manner, followed by a new line
+    """
+    for startup_item in startup_items:
+        yield prettify_startup_item(startup_item) + "\n"
 
 
 def prettify_startup_item(startup_item: dict):
@@ -45,11 +66,13 @@ def prettify_startup_item(startup_item: dict):
     This function will go through the JSON data dictionary and format the data to display it in a human readable manner
 
     Args:
-        startup_item (dict): A dictionary representing the JSON data for one startup item.
+        startup_item (dict): A dictionary representing the JSON data for one startup item. This can also be a StartupItem.
 
     Returns:
         str: The startup item JSON data in a nicely formatted manner as a string
     """
+    startup_item = deps_model.model_to_json(startup_item)
+
     # Used to add a new line or tab
     line = "\n"
     tab = "\t"
@@ -88,9 +111,211 @@ def prettify_startup_item(startup_item: dict):
     else:
         startup_data += "No"
 
+    # Add the optional launch order keys, if the startup item has them
+    if "Priority" in startup_item:
+        startup_data += line + tab + "Launch priority: " + str(startup_item["Priority"])
+
+    if startup_item.get("After"):
+        startup_data += line + tab + "Launched after: " + ", ".join(startup_item["After"])
+
+    if startup_item.get("SeparateLaunch"):
+        startup_data += line + tab + "Launched on its own: Yes"
+
     return startup_data
 
 
+def prettify_launch_results(launch_results: list):
+    """Helper function to prettify the launch results from the function launch_startup_items in the module cs_launch
+
+    Args:
+        launch_results (list): The launch result for each startup item
+
+    Returns:
+        str: The launch results in a nicely formatted manner as a string
+    """
+    # Used to add a new line or tab
+    line = "\n"
+    tab = "\t"
+
+    pretty_results = ""
+
+    for launch_result in launch_results:
+        pretty_results += line + "Startup item #" + str(launch_result["ItemNumber"])
+        pretty_results += " (" + launch_result["Name"] + "): "
+
+        if launch_result["Started"]:
+            pretty_results += "started as process " + str(launch_result["ProcessId"])
+        else:
+            pretty_results += "not started"
+
+        pretty_results += (
+            line
+            + tab
+            + "Waited {:.1f} ms, took {:.1f} ms to start".format(
+                launch_result["QueueDelay"] * 1000, launch_result["SpawnLatency"] * 1000
+            )
+        )
+
+        if launch_result["ReadyTime"] is not None:
+            pretty_results += ", ready after {:.1f} ms".format(launch_result["ReadyTime"] * 1000)
+
+        if launch_result["ExitStatus"] is not None:
+            pretty_results += ", already exited with status " + str(launch_result["ExitStatus"])
+
+        if launch_result["Error"]:
+            pretty_results += line + tab + launch_result["Error"].strip().replace("\n", " ")
+
+        if launch_result.get("MergedItems"):
+            pretty_results += line + tab + "Also launched startup item(s) " + ", ".join(
+                "#" + str(item_number) for item_number in launch_result["MergedItems"]
+            )
+
+    return pretty_results
+
+
+def prettify_launch_plan(plan_rows: list):
+    """Helper function to prettify the launch plan from the function launch_previewer in the module cs_launch
+
+    Args:
+        plan_rows (list): The launches, in launch order
+
+    Returns:
+        str: The launch plan in a nicely formatted manner as a string
+    """
+    # Used to add a new line or tab
+    line = "\n"
+    tab = "\t"
+
+    pretty_plan = line + "Launch plan (nothing has been launched):" + line
+
+    for plan_rank, plan_row in enumerate(plan_rows, start=1):
+        pretty_plan += line + str(plan_rank) + ". Startup item #" + str(plan_row["ItemNumber"])
+        pretty_plan += " (" + plan_row["Name"] + ")"
+        pretty_plan += line + tab + plan_row["CommandLine"]
+
+        if plan_row["MergedItems"]:
+            pretty_plan += line + tab + "Combined with startup item(s) " + ", ".join(
+                "#" + str(item_number) for item_number in plan_row["MergedItems"]
+            )
+            pretty_plan += " as " + plan_row["Policy"]
+
+    return pretty_plan
+
+
+def prettify_launch_report(report_rows: list, total_runs: int):
+    """Helper function to prettify the slowest items report from the function get_slowest_items in the module cs_timing
+
+    Args:
+        report_rows (list): The rows of the report, sorted from slowest to fastest
+
+        total_runs (int): The number of launch runs in the launch history
+
+    Returns:
+        str: The report in a nicely formatted manner as a string
+    """
+    # Used to add a new line or tab
+    line = "\n"
+    tab = "\t"
+
+    pretty_report = line + "Slowest startup items over the last " + str(total_runs) + " launch(es):" + line
+
+    for report_rank, report_row in enumerate(report_rows, start=1):
+        pretty_report += line + str(report_rank) + ". Startup item #" + str(report_row["ItemNumber"])
+        pretty_report += " (" + report_row["Name"] + ")"
+
+        pretty_report += (
+            line
+            + tab
+            + "Average {:.1f} ms to start, at most {:.1f} ms".format(
+                report_row["AverageSpawn"], report_row["MaxSpawn"]
+            )
+        )
+
+        if report_row["AverageReady"] is not None:
+            pretty_report += ", ready after {:.1f} ms on average".format(report_row["AverageReady"])
+
+        pretty_report += line + tab + "Launched " + str(report_row["Runs"]) + " time(s)"
+
+        if report_row["Failures"] > 0:
+            pretty_report += ", failed to start " + str(report_row["Failures"]) + " time(s)"
+
+        pretty_report += ", last as process " + str(report_row["LastProcessId"])
+
+        if report_row["LastExitStatus"] is not None:
+            pretty_report += " which exited with status " + str(report_row["LastExitStatus"])
+
+    return pretty_report
+
+
+def prettify_duplicate_report(duplicate_groups: list, overlap_pairs: list, item_names: dict):
+    """Helper function to prettify the duplicate startup items from the function find_duplicates in the module cs_dedup
+
+    Args:
+        duplicate_groups (list): The groups of exact duplicates, each a list of ItemNumbers
+
+        overlap_pairs (list): The overlapping startup items, each a tuple of two ItemNumbers
+
+        item_names (dict): The Name of each startup item, by ItemNumber
+
+    Returns:
+        str: The report in a nicely formatted manner as a string
+    """
+    # Used to add a new line or tab
+    line = "\n"
+    tab = "\t"
+
+    pretty_report = ""
+
+    if len(duplicate_groups) > 0:
+        saved_launches = sum(len(item_numbers) - 1 for item_numbers in duplicate_groups)
+
+        pretty_report += line + "Startup items that launch exactly the same thing with the same Name and scheduling:"
+
+        for item_numbers in duplicate_groups:
+            pretty_report += line + tab + ", ".join(
+                "#" + str(item_number) + " (" + item_names[item_number] + ")" for item_number in item_numbers
+            )
+
+        pretty_report += (
+            line + "Removing the duplicates would save " + str(saved_launches) + " program start(s) at each login"
+        )
+
+    if len(overlap_pairs) > 0:
+        if pretty_report:
+            pretty_report += line
+
+        pretty_report += line + "Startup items with all their arguments already in another startup item:"
+
+        for item_number, overlap_number in overlap_pairs:
+            pretty_report += line + tab + "#" + str(item_number) + " (" + item_names[item_number] + ")"
+            pretty_report += " is covered by #" + str(overlap_number) + " (" + item_names[overlap_number] + ")"
+
+    return pretty_report
+
+
+def prettify_preflight_report(preflight_results: list):
+    """Helper function to prettify the preflight results from the function preflight_checker in the module cs_preflight
+
+    Args:
+        preflight_results (list): The preflight result for each startup item that can't be launched
+
+    Returns:
+        str: The preflight results in a nicely formatted manner as a string
+    """
+    # Used to add a new line or tab
+    line = "\n"
+    tab = "\t"
+
+    pretty_report = line + "Startup items that can't be launched:"
+
+    for preflight_result in preflight_results:
+        pretty_report += line + "Startup item #" + str(preflight_result["ItemNumber"])
+        pretty_report += " (" + preflight_result["Name"] + "): " + preflight_result["Status"]
+        pretty_report += line + tab + preflight_result["FilePath"]
+
+    return pretty_report
+
+
 def prettify_io_error(error: Exception, file_mode: str = ""):
     """Helper function to prettify an error or exception when performing an I/O operation
 
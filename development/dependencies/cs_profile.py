@@ -0,0 +1,163 @@
+# Dependency to store the class that profiles each menu action of CompStart.py, for finding out where the time and memory go when something is slow
+
+import os, time
+
+import dependencies.cs_pretty as deps_pretty
+
+# The environment variable that turns on profiling, which can be set to the folder to write the profiles to, or to 1 to use PROFILE_DIR_NAME
+PROFILE_ENV_VAR = "COMPSTART_PROFILE"
+
+# The command-line flag that turns on profiling, which can also be given as --profile=FOLDER
+PROFILE_FLAG = "--profile"
+
+# The folder the profiles are written to if no other folder is given, inside the folder CompStart.py was started from
+PROFILE_DIR_NAME = "profiles"
+
+# How many stack frames are kept for each memory allocation in the allocation snapshots
+PROFILE_TRACE_FRAMES = 5
+
+# Characters that can't be used in the name of a profile file, as a regular expression
+PROFILE_NAME_CHARS = r"[^a-z0-9]+"
+
+
+def get_profile_dir(cli_args: list, start_cwd: str):
+    """Helper function to work out if profiling is turned on and which folder the profiles go in
+
+    The command-line flag is looked at first, then the environment variable. A relative folder is relative to the folder CompStart.py was started from.
+
+    Args:
+        cli_args (list): The command-line arguments, not including the name of the script
+
+        start_cwd (str): The current working directory when CompStart.py was started
+
+    Returns:
+        str: The full path of the folder to write the profiles to, or a blank string if profiling is turned off
+
+        list: The command-line arguments without the profiling flag
+    """
+    # Initialize function variables
+    profile_dir = ""
+    other_args = []
+
+    for cli_arg in cli_args:
+        if cli_arg == PROFILE_FLAG:
+            profile_dir = PROFILE_DIR_NAME
+        elif cli_arg.startswith(PROFILE_FLAG + "="):
+            profile_dir = cli_arg[len(PROFILE_FLAG) + 1 :] or PROFILE_DIR_NAME
+        else:
+            other_args.append(cli_arg)
+
+    if not profile_dir:
+        profile_dir = os.environ.get(PROFILE_ENV_VAR, "").strip()
+
+        if profile_dir.lower() in ["0", "false", "no", "off"]:
+            profile_dir = ""
+        elif profile_dir.lower() in ["1", "true", "yes", "on"]:
+            profile_dir = PROFILE_DIR_NAME
+
+    if profile_dir:
+        profile_dir = os.path.join(start_cwd, profile_dir)
+
+    return (profile_dir, other_args)
+
+
+class ActionProfiler:
+    """Class for profiling the menu actions of CompStart.py one at a time
+
+    Each action is run under cProfile, with tracemalloc tracing every memory allocation. When the action is done, two files are written to a folder for this run of CompStart.py inside profile_dir, both named after the number and name of the action:
+        .prof: the cProfile statistics, which can be opened with the module pstats or a viewer such as snakeviz
+        .snapshot: the tracemalloc snapshot of the memory still allocated at the end of the action, which can be opened with tracemalloc.Snapshot.load
+
+    A one-line summary with the wall time, CPU time and peak memory of the action is also printed out.
+
+    CompStart.py only creates an ActionProfiler if profiling is turned on, so there's nothing extra to run for each action when it's off.
+
+    Attributes:
+        run_dir (str): The full path of the folder the profiles for this run of CompStart.py are written to
+
+        action_count (int): The number of actions profiled so far
+
+        action_name (str): The name of the action being profiled, or a blank string if there isn't one
+
+        profiler (cProfile.Profile): The profiler for the action being profiled, or None if there isn't one
+
+        wall_start (float): The time, from time.perf_counter, that the action started
+
+        cpu_start (float): The CPU time, from time.process_time, that the action started
+    """
+
+    __slots__ = ("run_dir", "action_count", "action_name", "profiler", "wall_start", "cpu_start")
+
+    def __init__(self, profile_dir: str):
+        self.run_dir = os.path.join(profile_dir, time.strftime("%Y%m%d-%H%M%S"))
+        self.action_count = 0
+        self.action_name = ""
+        self.profiler = None
+        self.wall_start = 0.0
+        self.cpu_start = 0.0
+
+    def start(self, action_name: str):
+        """Function to start profiling an action
+
+        Args:
+            action_name (str): The name of the action, such as the menu choice the user picked
+        """
+        # cProfile and tracemalloc are only needed once profiling is turned on
+        import cProfile, tracemalloc
+
+        self.action_count += 1
+        self.action_name = action_name
+
+        tracemalloc.start(PROFILE_TRACE_FRAMES)
+        self.profiler = cProfile.Profile()
+
+        self.wall_start = time.perf_counter()
+        self.cpu_start = time.process_time()
+        self.profiler.enable()
+
+    def stop(self):
+        """Function to stop profiling the action, write its profiles and print out its summary
+
+        Nothing is done if no action is being profiled, so this can also be called when CompStart.py exits in the middle of an action, such as when the user quits from the editor menu.
+
+        Returns:
+            bool: True if the profiles were written successfully, False if not
+        """
+        import re, tracemalloc
+
+        # Initialize function variables
+        write_success = False
+
+        if self.profiler is not None:
+            self.profiler.disable()
+            wall_time = time.perf_counter() - self.wall_start
+            cpu_time = time.process_time() - self.cpu_start
+
+            memory_snapshot = tracemalloc.take_snapshot()
+            peak_memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            file_name = "{:03d}-{}".format(
+                self.action_count, re.sub(PROFILE_NAME_CHARS, "-", self.action_name.lower()).strip("-") or "action"
+            )
+            profile_file = os.path.join(self.run_dir, file_name + ".prof")
+
+            try:
+                os.makedirs(self.run_dir, exist_ok=True)
+                self.profiler.dump_stats(profile_file)
+                memory_snapshot.dump(os.path.join(self.run_dir, file_name + ".snapshot"))
+                write_success = True
+            except Exception as error:
+                deps_pretty.prettify_custom_error(deps_pretty.prettify_io_error(error), "ActionProfiler.stop")
+
+            summary_line = "\n[profile] {}: wall {:.1f} ms, CPU {:.1f} ms, peak memory {:.1f} MB".format(
+                self.action_name, wall_time * 1000, cpu_time * 1000, peak_memory / 1048576
+            )
+            if write_success:
+                summary_line += " -> " + profile_file
+            print(summary_line)
+
+            self.action_name = ""
+            self.profiler = None
+
+        return write_success
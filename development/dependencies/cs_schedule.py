@@ -0,0 +1,216 @@
+# Dependency to store the helper functions that work out the order startup items are launched in, based on their optional Priority and After keys
+
+import heapq
+
+import dependencies.cs_enum as deps_enum
+
+ENUM_JSK = deps_enum.JsonSchemaKeys
+
+
+def get_launch_graph(items_list: list):
+    """Helper function to turn the startup items into a dependency graph
+
+    Each startup item is a node of the graph, identified by its index in items_list. For every Name in the After array of a startup item, there is an edge from each startup item with that Name to the startup item itself, since those have to be launched first. A Name in After that no startup item has is ignored, so deleting or renaming a startup item doesn't stop the ones that depended on it from launching.
+
+    Args:
+        items_list (list): The startup items
+
+    Returns:
+        list: For each startup item, the indexes of the startup items that have to wait for it
+
+        list: For each startup item, the number of startup items it has to wait for
+    """
+    # Initialize function variables
+    waiting_items = [[] for startup_item in items_list]
+    wait_counts = [0] * len(items_list)
+    name_indexes = {}
+
+    # Find every startup item with each Name, since the Name doesn't have to be unique
+    for item_index, startup_item in enumerate(items_list):
+        name_indexes.setdefault(startup_item[ENUM_JSK.NAME.value], []).append(item_index)
+
+    for item_index, startup_item in enumerate(items_list):
+        for after_name in startup_item.get(ENUM_JSK.AFTER.value, []):
+            for after_index in name_indexes.get(after_name, []):
+                waiting_items[after_index].append(item_index)
+                wait_counts[item_index] += 1
+
+    return (waiting_items, wait_counts)
+
+
+def get_launch_rank(startup_item: dict, item_index: int):
+    """Helper function to get the value that decides which of the startup items ready to launch goes first
+
+    Startup items with a higher Priority go first, and startup items with the same Priority go in ItemNumber order. Since startup items without a Priority have a Priority of 0, startup data without any Priority keys is launched in ItemNumber order.
+
+    Args:
+        startup_item (dict): The startup item
+
+        item_index (int): The index of the startup item in the Items array
+
+    Returns:
+        tuple: The rank of the startup item, where a lower rank goes first
+    """
+    return (-startup_item.get(ENUM_JSK.PRIORITY.value, 0), item_index)
+
+
+def find_launch_cycle(items_list: list):
+    """Helper function to check if the After keys of the startup items depend on each other in a loop
+
+    Startup items in a loop could never be launched, since each one would be waiting for another one in the loop. The check removes every startup item that doesn't have to wait for anything, along with its edges, until there are none left. Any startup items still left over are part of, or waiting on, a loop.
+
+    Args:
+        items_list (list): The startup items
+
+    Returns:
+        list: The Names of the startup items in one of the loops, in order, or an empty list if there are no loops
+    """
+    # Initialize function variables
+    launch_cycle = []
+
+    waiting_items, wait_counts = get_launch_graph(items_list)
+    ready_indexes = [item_index for item_index, wait_count in enumerate(wait_counts) if wait_count == 0]
+
+    while ready_indexes:
+        item_index = ready_indexes.pop()
+
+        for waiting_index in waiting_items[item_index]:
+            wait_counts[waiting_index] -= 1
+            if wait_counts[waiting_index] == 0:
+                ready_indexes.append(waiting_index)
+
+    left_indexes = [item_index for item_index, wait_count in enumerate(wait_counts) if wait_count > 0]
+
+    if left_indexes:
+        # Every startup item left over waits for another one left over, so following those edges backwards has to end up going around a loop
+        waited_on = {}
+        for item_index in left_indexes:
+            for waiting_index in waiting_items[item_index]:
+                if wait_counts[waiting_index] > 0:
+                    waited_on.setdefault(waiting_index, item_index)
+
+        visit_order = {}
+        item_index = left_indexes[0]
+        while item_index not in visit_order:
+            visit_order[item_index] = len(visit_order)
+            item_index = waited_on[item_index]
+
+        cycle_indexes = [
+            visit_index
+            for visit_index in visit_order
+            if visit_order[visit_index] >= visit_order[item_index]
+        ]
+        cycle_indexes.reverse()
+
+        launch_cycle = [items_list[cycle_index][ENUM_JSK.NAME.value] for cycle_index in cycle_indexes]
+
+    return launch_cycle
+
+
+def launch_cycle_validator(items_list: list):
+    """Helper function to check startup items for After keys that depend on each other in a loop
+
+    Only startup data where at least one startup item has an After key is checked, so older startup data without it isn't affected.
+
+    Args:
+        items_list (list): The startup items
+
+    Returns:
+        bool: True if the startup items can be launched, False if there's a loop
+
+        string: An error message describing the loop, or blank otherwise
+    """
+    # Initialize function variables
+    valid_order = True
+    return_message = ""
+
+    if any(startup_item.get(ENUM_JSK.AFTER.value) for startup_item in items_list):
+        launch_cycle = find_launch_cycle(items_list)
+
+        if launch_cycle:
+            valid_order = False
+            return_message = (
+                "The After keys of these startup items depend on each other in a loop, where each one has to be launched before the next: "
+                + " -> ".join(launch_cycle + launch_cycle[:1])
+            )
+
+    return (valid_order, return_message)
+
+
+class LaunchScheduler:
+    """Class to hand out startup items in launch order as the startup items they wait for are launched
+
+    A startup item is ready once every startup item in its After key has been launched. Of the startup items that are ready, the one with the best rank from get_launch_rank is handed out first. More than one startup item can be handed out before any of them are marked as launched, which is what lets the launch engine start them at the same time.
+
+    Attributes:
+        items_list (list): The startup items
+
+        waiting_items (list): For each startup item, the indexes of the startup items that have to wait for it
+
+        wait_counts (list): For each startup item, the number of startup items it's still waiting for
+
+        ready_heap (list): A heap of the ranks of the startup items that are ready but haven't been handed out yet
+    """
+
+    __slots__ = ("items_list", "waiting_items", "wait_counts", "ready_heap")
+
+    def __init__(self, items_list: list):
+        self.items_list = items_list
+        self.waiting_items, self.wait_counts = get_launch_graph(items_list)
+        self.ready_heap = [
+            get_launch_rank(items_list[item_index], item_index)
+            for item_index, wait_count in enumerate(self.wait_counts)
+            if wait_count == 0
+        ]
+        heapq.heapify(self.ready_heap)
+
+    def has_ready(self):
+        """Function to check if there are startup items ready to be handed out
+
+        Returns:
+            bool: True if there is at least one startup item ready, False if not
+        """
+        return len(self.ready_heap) > 0
+
+    def next_ready(self):
+        """Function to hand out the next startup item that is ready
+
+        Returns:
+            int: The index of the startup item in items_list
+        """
+        return heapq.heappop(self.ready_heap)[1]
+
+    def mark_launched(self, item_index: int):
+        """Function to mark a startup item as launched, which can make the startup items waiting for it ready
+
+        Args:
+            item_index (int): The index of the startup item in items_list
+        """
+        for waiting_index in self.waiting_items[item_index]:
+            self.wait_counts[waiting_index] -= 1
+
+            if self.wait_counts[waiting_index] == 0:
+                heapq.heappush(
+                    self.ready_heap,
+                    get_launch_rank(self.items_list[waiting_index], waiting_index),
+                )
+
+
+def get_launch_order(items_list: list):
+    """Helper function to get the order the startup items are launched in when they're launched one at a time
+
+    Args:
+        items_list (list): The startup items
+
+    Returns:
+        list: The indexes of the startup items in launch order. Startup items in a loop are left out.
+    """
+    launch_order = []
+    launch_scheduler = LaunchScheduler(items_list)
+
+    while launch_scheduler.has_ready():
+        item_index = launch_scheduler.next_ready()
+        launch_order.append(item_index)
+        launch_scheduler.mark_launched(item_index)
+
+    return launch_order
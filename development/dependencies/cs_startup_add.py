@@ -8,6 +8,9 @@ import dependencies.cs_chooser as deps_chooser
 import dependencies.cs_jsonfn as deps_json
 import dependencies.cs_enum as deps_enum
 import dependencies.cs_pretty as deps_pretty
+import dependencies.cs_cache as deps_cache
+import dependencies.cs_journal as deps_journal
+import dependencies.cs_document as deps_document
 
 ENUM_JSS = deps_enum.JsonSchemaStructure
 ENUM_JSK = deps_enum.JsonSchemaKeys
@@ -270,7 +273,7 @@ def save_new_startup_item(new_startup_item: dict, json_path: list, json_filename
     """Helper function to save a new startup item
 
     Args:
-        new_startup_item (dict): A dictionary with the single startup item, which will be saved to disk
+        new_startup_item (dict): A dictionary with the single startup item, which will be saved to disk. This can also be a StartupItem.
 
         json_path (list): A list containing the relative or absolute path to the JSON file with each list item representing one subfolder from Current Working Directory (CWD)
 
@@ -282,17 +285,41 @@ def save_new_startup_item(new_startup_item: dict, json_path: list, json_filename
         string: An error message to display if the JSON data couldn't be written to disk or the existing data couldn't be read in, or a message that it was written successfully
     """
     # Read in existing JSON file and store the return results of the json_read function
-    status_state, status_message, json_data = deps_json.json_reader(json_path, json_filename)
+    status_state, status_message, json_document = deps_json.document_reader(
+        json_path, json_filename
+    )
 
     if status_state:
-        new_json_data = deps_data_gen.generate_user_edited_data(
-            copy.deepcopy(new_startup_item),
-            ENUM_ITV.ADD.value,
-            copy.deepcopy(json_data),
+        # The StartupDocument only copies the path to the new startup item, so nothing else needs to be copied
+        new_json_document = deps_data_gen.generate_user_edited_data(
+            new_startup_item, ENUM_ITV.ADD.value, json_document
         )
 
         data_file = deps_helper.parse_full_path(json_path, json_filename)
-        status_state, status_message = deps_json.json_writer(data_file, 2, new_json_data)
+
+        if not isinstance(new_json_document, deps_document.StartupDocument):
+            status_state = False
+        # In journaled storage mode, only the single startup item change is saved
+        elif deps_helper.is_journal_mode():
+            new_total_items = new_json_document.total_items()
+            journal_records = [
+                deps_journal.make_journal_record(
+                    ENUM_ITV.ADD.value,
+                    new_total_items,
+                    new_json_document.get_item(new_total_items),
+                )
+            ]
+            status_state, status_message = deps_journal.journal_saver(
+                data_file, new_json_document, journal_records
+            )
+        else:
+            status_state, status_message = deps_json.json_writer(
+                data_file, 2, new_json_document
+            )
+
+        # Cache the validated startup data that was just written so the next read doesn't need to parse and validate it again
+        if status_state:
+            deps_cache.cache_store(data_file, new_json_document)
 
     if not status_state:
         status_message = "Could not save the startup item"
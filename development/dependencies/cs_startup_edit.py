@@ -1,13 +1,15 @@
 # Dependency to store the helper functions that are used when editing a startup item
 
-import copy
-
 import dependencies.cs_data_generate as deps_data_gen
 import dependencies.cs_helper as deps_helper
 import dependencies.cs_chooser as deps_chooser
 import dependencies.cs_jsonfn as deps_json
 import dependencies.cs_enum as deps_enum
 import dependencies.cs_pretty as deps_pretty
+import dependencies.cs_cache as deps_cache
+import dependencies.cs_journal as deps_journal
+import dependencies.cs_document as deps_document
+import dependencies.cs_model as deps_model
 import dependencies.cs_startup_add as deps_item_add
 
 ENUM_JSK = deps_enum.JsonSchemaKeys
@@ -20,7 +22,7 @@ def edit_startup_item(orig_startup_item: dict, json_path: list, json_filename: s
     This function will take the specific startup item passed in, display it and allow the user to edit any part of that item. A copy of the startup item dictionary is created to work with and that copy is what's returned.
 
     Args:
-        orig_startup_item (dict): A dictionary with the single startup item
+        orig_startup_item (dict): A dictionary with the single startup item. This can also be a StartupItem.
 
         json_path (list): A list containing the relative or absolute path to the JSON file with each list item representing one subfolder from Current Working Directory (CWD)
 
@@ -29,8 +31,8 @@ def edit_startup_item(orig_startup_item: dict, json_path: list, json_filename: s
     Returns:
         dict: The modified and updated startup item dictionary passed in.
     """
-    # Create a copy of the orig_startup_item dictionary
-    startup_item = copy.deepcopy(orig_startup_item)
+    # Create a copy of the orig_startup_item dictionary, which can also be a StartupItem
+    startup_item = deps_document.copy_startup_item(deps_model.model_to_json(orig_startup_item))
 
     # Show startup item selected
     prettified_item = deps_pretty.prettify_startup_item(startup_item)
@@ -92,7 +94,8 @@ def edit_startup_item(orig_startup_item: dict, json_path: list, json_filename: s
             case 7:
                 quit_loop = True
 
-    return copy.deepcopy(startup_item)
+    # The copy made above is only used by this function, so it can be returned as is
+    return startup_item
 
 
 def edit_startup_item_name(item_name: str):
@@ -280,7 +283,7 @@ def save_modified_startup_item(modified_startup_item: dict, json_path: list, jso
     """Helper function to save a modified startup item
 
     Args:
-        modified_startup_item (dict): A dictionary with the single startup item, which will be saved to disk
+        modified_startup_item (dict): A dictionary with the single startup item, which will be saved to disk. This can also be a StartupItem.
 
         json_path (list): A list containing the relative or absolute path to the JSON file with each list item representing one subfolder from Current Working Directory (CWD)
 
@@ -292,13 +295,18 @@ def save_modified_startup_item(modified_startup_item: dict, json_path: list, jso
         string: An error message to display if the JSON data couldn't be written to disk or the existing data couldn't be read in, or a message that it was written successfully
     """
     # Read in existing JSON file and store the return results of the json_read function
-    status_state, status_message, json_data = deps_json.json_reader(json_path, json_filename)
+    status_state, status_message, json_document = deps_json.document_reader(
+        json_path, json_filename
+    )
     print("\n" + status_message)
 
     if status_state:
+        # A StartupItem is compared and saved as a regular startup item
+        modified_startup_item = deps_model.model_to_json(modified_startup_item)
+
         # Get the item number of the startup item being worked with and then the original version of that startup item
         modified_item_number = modified_startup_item[ENUM_JSK.ITEMNUMBER.value]
-        original_startup_item = json_data[ENUM_JSK.ITEMS.value][modified_item_number - 1]
+        original_startup_item = json_document.get_item(modified_item_number)
 
         # Check to see if the data was actually changed
         if modified_startup_item == original_startup_item:
@@ -307,14 +315,36 @@ def save_modified_startup_item(modified_startup_item: dict, json_path: list, jso
                 "\nThe startup data hasn't changed. There was nothing to save!",
             )
 
-        new_json_data = deps_data_gen.generate_user_edited_data(
-            copy.deepcopy(modified_startup_item),
-            ENUM_ITV.REPLACE.value,
-            copy.deepcopy(json_data),
+        # The StartupDocument only copies the path to the replaced startup item, so nothing else needs to be copied
+        new_json_document = deps_data_gen.generate_user_edited_data(
+            modified_startup_item, ENUM_ITV.REPLACE.value, json_document
         )
 
         data_file = deps_helper.parse_full_path(json_path, json_filename)
-        status_state, status_message = deps_json.json_writer(data_file, 2, new_json_data)
+
+        if not isinstance(new_json_document, deps_document.StartupDocument):
+            status_state = False
+            status_message = "Could not update the startup data with the modified startup item"
+        # In journaled storage mode, only the single startup item change is saved
+        elif deps_helper.is_journal_mode():
+            journal_records = [
+                deps_journal.make_journal_record(
+                    ENUM_ITV.REPLACE.value,
+                    modified_item_number,
+                    new_json_document.get_item(modified_item_number),
+                )
+            ]
+            status_state, status_message = deps_journal.journal_saver(
+                data_file, new_json_document, journal_records
+            )
+        else:
+            status_state, status_message = deps_json.json_writer(
+                data_file, 2, new_json_document
+            )
+
+        # Cache the validated startup data that was just written so the next read doesn't need to parse and validate it again
+        if status_state:
+            deps_cache.cache_store(data_file, new_json_document)
 
     return (status_state, status_message)
 
@@ -0,0 +1,274 @@
+# Dependency to store the class that reads startup items from a startup file a few at a time, instead of reading in the whole file at once
+
+import codecs, json, re
+
+# How many bytes of the startup file are read in at a time
+READ_CHUNK_SIZE = 65536
+
+# The byte offset of every startup item that is a multiple of this many startup items from the start is remembered while reading, so reading can start again close to any startup item already read past without going through the file from the beginning
+OFFSET_INTERVAL = 64
+
+# The whitespace allowed between JSON values
+JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class FileWindow:
+    """Class for the part of an open JSON file that has been read in but not used yet
+
+    The file is read in READ_CHUNK_SIZE bytes at a time, only when the text already read in runs out. The byte offset in the file of the current position is kept up to date, so that it can be remembered and later used to start reading from the same place again.
+
+    Attributes:
+        file (io.BufferedReader): The JSON file, opened in binary mode
+
+        text_decoder (codecs.IncrementalDecoder): The UTF-8 decoder for the file, which keeps any character split between two reads until the rest of it is read in
+
+        json_decoder (json.JSONDecoder): The decoder used to read in each JSON value
+
+        text (str): The text read in from the file that hasn't been used yet, along with any that has since the last time more of the file was read in
+
+        text_pos (int): The index in text of the current position
+
+        is_ascii (bool): Whether text only has ASCII characters, in which case each character is one byte in the file
+
+        byte_offset (int): The byte offset in the file of the current position
+
+        at_eof (bool): Whether the whole file has been read in
+    """
+
+    __slots__ = ("file", "text_decoder", "json_decoder", "text", "text_pos", "is_ascii", "byte_offset", "at_eof")
+
+    def __init__(self, file, byte_offset: int):
+        self.file = file
+        self.text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self.json_decoder = json.JSONDecoder()
+        self.text = ""
+        self.text_pos = 0
+        self.is_ascii = True
+        self.byte_offset = byte_offset
+        self.at_eof = False
+
+        self.file.seek(byte_offset)
+
+    def read_more(self):
+        """Function to read in the next part of the file
+
+        The text that has already been used is dropped at the same time, so it isn't copied again each time the current position moves forward.
+
+        Returns:
+            bool: True if more text was read in, False if the whole file had already been read in
+        """
+        if self.at_eof:
+            return False
+
+        file_chunk = self.file.read(READ_CHUNK_SIZE)
+        self.at_eof = len(file_chunk) == 0
+
+        self.text = self.text[self.text_pos :] + self.text_decoder.decode(file_chunk, final=self.at_eof)
+        self.text_pos = 0
+        self.is_ascii = self.text.isascii()
+
+        return True
+
+    def advance(self, char_count: int):
+        """Function to move the current position forward past text that has been used
+
+        Args:
+            char_count (int): How many characters to move forward by
+        """
+        if self.is_ascii:
+            self.byte_offset += char_count
+        else:
+            self.byte_offset += len(self.text[self.text_pos : self.text_pos + char_count].encode("utf-8"))
+
+        self.text_pos += char_count
+
+    def next_char(self):
+        """Function to move the current position past any whitespace and get the character found there
+
+        Returns:
+            str: The next character that isn't whitespace, or a blank string if the end of the file was reached
+        """
+        while True:
+            self.advance(JSON_WHITESPACE.match(self.text, self.text_pos).end() - self.text_pos)
+
+            if self.text_pos < len(self.text) or not self.read_more():
+                return self.text[self.text_pos : self.text_pos + 1]
+
+    def next_value(self):
+        """Function to read in the JSON value at the current position, after any whitespace, and move past it
+
+        If the JSON value doesn't parse, more of the file is read in until it does or the end of the file is reached. A JSON value that ends right where the text read in ends could be a number that carries on in the next part of the file, so more is read in for it as well.
+
+        Returns:
+            The JSON value, which can be any JSON type
+
+        Raises:
+            json.JSONDecodeError: If there is no valid JSON value at the current position
+        """
+        self.next_char()
+
+        while True:
+            try:
+                json_value, value_end = self.json_decoder.raw_decode(self.text, self.text_pos)
+                if value_end < len(self.text) or not self.read_more():
+                    break
+            except json.JSONDecodeError:
+                if not self.read_more():
+                    raise
+
+        self.advance(value_end - self.text_pos)
+
+        return json_value
+
+
+class StartupFileReader:
+    """Class for reading the startup items of a startup file a few at a time
+
+    Only the startup items that are asked for are read in, along with the ones before them that haven't been read past yet, so the first startup items of even a very large startup file are ready right away and the memory used doesn't grow with the size of the file. The byte offsets of some of the startup items are remembered as they are read past, so going back to an earlier startup item only reads in the file from the closest one of those.
+
+    Note that the startup items are read from the file as it is on disk. They aren't validated and any journal isn't replayed over them. Also, only one iter_items generator can be used at a time, since they all share the open file.
+
+    Attributes:
+        json_file (str): The full absolute path of the startup file including filename and extension
+
+        file (io.BufferedReader): The startup file, or None if it isn't open
+
+        header_data (dict): The keys of the startup file that come before the Items array, such as TotalItems, with their values. Any keys after the Items array aren't read in.
+
+        item_offsets (list): The byte offset of every startup item that is a multiple of OFFSET_INTERVAL from the start, for as far into the file as has been read
+
+        item_count (int): The number of startup items in the Items array, or None if the end of the array hasn't been reached yet
+    """
+
+    __slots__ = ("json_file", "file", "header_data", "item_offsets", "item_count")
+
+    def __init__(self, json_file: str):
+        self.json_file = json_file
+        self.file = None
+        self.header_data = {}
+        self.item_offsets = []
+        self.item_count = None
+
+    def open(self):
+        """Function to open the startup file and read in everything before the first startup item
+
+        Raises:
+            OSError: If the startup file can't be opened
+
+            ValueError: If the startup file isn't a JSON object with an Items array
+        """
+        self.file = open(self.json_file, "rb")
+
+        try:
+            file_window = FileWindow(self.file, 0)
+
+            if not file_window.next_char() == "{":
+                raise ValueError("The startup file doesn't hold a JSON object")
+            file_window.advance(1)
+
+            # Go through the keys of the JSON object until the Items array is found
+            while True:
+                if not file_window.next_char() == '"':
+                    raise ValueError("The startup file has no Items array")
+                json_key = file_window.next_value()
+
+                if not file_window.next_char() == ":":
+                    raise ValueError(f'Expected ":" after the key "{json_key}" in the startup file')
+                file_window.advance(1)
+
+                if json_key == "Items":
+                    break
+
+                self.header_data[json_key] = file_window.next_value()
+
+                if not file_window.next_char() == ",":
+                    raise ValueError("The startup file has no Items array")
+                file_window.advance(1)
+
+            if not file_window.next_char() == "[":
+                raise ValueError("The Items key of the startup file isn't an array")
+            file_window.advance(1)
+
+            # The Items array could also be empty
+            if file_window.next_char() == "]":
+                self.item_count = 0
+            else:
+                self.item_offsets.append(file_window.byte_offset)
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self):
+        """Function to close the startup file, if it is open"""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def iter_items(self, start_index: int = 0):
+        """Function to go through the startup items in order, starting from any one of them
+
+        Args:
+            start_index (int, optional): The index in the Items array of the first startup item to return. Defaults to 0.
+
+        Yields:
+            tuple: The (index, startup item) of each startup item from start_index to the end of the Items array
+
+        Raises:
+            ValueError: If a startup item or the Items array isn't valid JSON
+        """
+        if self.item_count == 0:
+            return
+
+        # Start reading from the closest remembered startup item before start_index
+        offset_index = min(start_index // OFFSET_INTERVAL, len(self.item_offsets) - 1)
+        item_index = offset_index * OFFSET_INTERVAL
+        file_window = FileWindow(self.file, self.item_offsets[offset_index])
+
+        while True:
+            file_window.next_char()
+
+            if item_index == len(self.item_offsets) * OFFSET_INTERVAL:
+                self.item_offsets.append(file_window.byte_offset)
+
+            startup_item = file_window.next_value()
+
+            if item_index >= start_index:
+                yield (item_index, startup_item)
+
+            item_index += 1
+
+            # After each startup item is either a comma and another startup item, or the end of the Items array
+            separator = file_window.next_char()
+
+            if separator == "]":
+                self.item_count = item_index
+                return
+            elif separator == ",":
+                file_window.advance(1)
+            else:
+                raise ValueError(f'Expected "," or "]" after startup item {item_index} in the startup file')
+
+    def read_items(self, start_index: int, max_items: int):
+        """Function to read in a number of startup items starting from any one of them
+
+        Args:
+            start_index (int): The index in the Items array of the first startup item to read in
+
+            max_items (int): The most startup items to read in
+
+        Returns:
+            list: The startup items, which is shorter than max_items if the end of the Items array was reached
+
+        Raises:
+            ValueError: If a startup item or the Items array isn't valid JSON
+        """
+        startup_items = []
+
+        if max_items > 0:
+            for item_index, startup_item in self.iter_items(start_index):
+                startup_items.append(startup_item)
+
+                if len(startup_items) == max_items:
+                    break
+
+        return startup_items
@@ -0,0 +1,250 @@
+# Dependency to store the launch throttle, which holds back the next startup item while the computer is too busy so launching doesn't slow everything down
+
+import os, time
+
+import dependencies.cs_enum as deps_enum
+import dependencies.cs_helper as deps_helper
+
+ENUM_JSK = deps_enum.JsonSchemaKeys
+
+# The settings used for any key missing from the LaunchPolicy object of the startup data, except for MaxInFlight, which defaults to the variable launch_workers in CompStart.py. See startup_data.schema.json for what each setting does.
+LAUNCH_POLICY_DEFAULTS = {
+    "MaxRunnablePerCpu": 2.0,
+    "MaxIoPressure": 40.0,
+    "MinAvailableMemoryMB": 512,
+    "PollInterval": 0.1,
+    "MaxHoldTime": 3.0,
+}
+
+# The files the load signals are read from, which only exist on Linux
+LOADAVG_FILE = "/proc/loadavg"
+IO_PRESSURE_FILE = "/proc/pressure/io"
+MEMINFO_FILE = "/proc/meminfo"
+
+
+def get_launch_policy(json_data: dict):
+    """Helper function to get the launch policy for the startup data
+
+    Args:
+        json_data (dict): The full startup data
+
+    Returns:
+        dict: The LaunchPolicy object of the startup data with every missing setting filled in, or None if the startup data doesn't have one. Without a LaunchPolicy object, startup items are only limited by the variable launch_workers in CompStart.py.
+    """
+    launch_policy = None
+
+    if ENUM_JSK.LAUNCHPOLICY.value in json_data:
+        launch_policy = {"MaxInFlight": deps_helper.get_launch_workers()}
+        launch_policy.update(LAUNCH_POLICY_DEFAULTS)
+        launch_policy.update(json_data[ENUM_JSK.LAUNCHPOLICY.value])
+
+    return launch_policy
+
+
+def read_runnable_per_cpu():
+    """Helper function to read the number of processes waiting to run for each CPU
+
+    The fourth field of /proc/loadavg holds the number of processes that are running or waiting to run right now, followed by the total number of processes. This reacts straight away, unlike the load averages in the same file, which take several seconds to catch up.
+
+    Returns:
+        float: The number of processes waiting to run per CPU, not counting this one, or None if it can't be read
+    """
+    runnable_per_cpu = None
+
+    try:
+        with open(LOADAVG_FILE, "r") as file:
+            runnable_count = int(file.read().split()[3].split("/")[0])
+
+        runnable_per_cpu = max(runnable_count - 1, 0) / (os.cpu_count() or 1)
+    except (OSError, ValueError, IndexError):
+        pass
+
+    return runnable_per_cpu
+
+
+def read_io_stall_total():
+    """Helper function to read the total time processes have been stalled waiting on the disk
+
+    Returns:
+        int: The total from the "some" line of /proc/pressure/io in microseconds, or None if it can't be read
+    """
+    stall_total = None
+
+    try:
+        with open(IO_PRESSURE_FILE, "r") as file:
+            for pressure_line in file:
+                if pressure_line.startswith("some"):
+                    stall_total = int(pressure_line.rsplit("total=", 1)[1])
+    except (OSError, ValueError, IndexError):
+        pass
+
+    return stall_total
+
+
+def read_available_memory_mb():
+    """Helper function to read the amount of memory available to start new programs
+
+    On Linux this is MemAvailable from /proc/meminfo. On Windows it's read with the GlobalMemoryStatusEx function, which doesn't need any service to be running.
+
+    Returns:
+        float: The available memory in megabytes, or None if it can't be read
+    """
+    available_memory = None
+
+    try:
+        if os.name == "nt":
+            import ctypes
+
+            class MemoryStatus(ctypes.Structure):
+                _fields_ = [
+                    ("dwLength", ctypes.c_ulong),
+                    ("dwMemoryLoad", ctypes.c_ulong),
+                    ("ullTotalPhys", ctypes.c_ulonglong),
+                    ("ullAvailPhys", ctypes.c_ulonglong),
+                    ("ullTotalPageFile", ctypes.c_ulonglong),
+                    ("ullAvailPageFile", ctypes.c_ulonglong),
+                    ("ullTotalVirtual", ctypes.c_ulonglong),
+                    ("ullAvailVirtual", ctypes.c_ulonglong),
+                    ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+                ]
+
+            memory_status = MemoryStatus()
+            memory_status.dwLength = ctypes.sizeof(MemoryStatus)
+
+            if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(memory_status)):
+                available_memory = memory_status.ullAvailPhys / (1024 * 1024)
+        else:
+            with open(MEMINFO_FILE, "r") as file:
+                for meminfo_line in file:
+                    if meminfo_line.startswith("MemAvailable:"):
+                        available_memory = int(meminfo_line.split()[1]) / 1024
+                        break
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+
+    return available_memory
+
+
+class LaunchThrottle:
+    """Class to decide when the next startup item can be launched
+
+    Starting a program only takes a moment, but the program then keeps the CPU and disk busy while it loads. Launching every startup item at once makes them all compete, so the desktop takes longer to become usable than if they were started a few at a time. The throttle holds back the next startup item while the load signals show the computer is busy:
+
+    - the number of processes waiting to run per CPU, from /proc/loadavg
+    - the share of time processes were stalled waiting on the disk since the last check, from /proc/pressure/io
+    - the available memory, from /proc/meminfo or GlobalMemoryStatusEx on Windows
+
+    Any signal that can't be read is ignored. No startup item is ever held back for longer than MaxHoldTime, and no more than MaxInFlight startup items are being started at the same time. Without a launch policy, or where none of the signals can be read, only that fixed limit applies.
+
+    Attributes:
+        launch_policy (dict): The launch policy from get_launch_policy, or None to only use the fixed limit
+
+        max_in_flight (int): The most startup items being started at the same time
+
+        last_admit (float): The time, from time.monotonic, that the last startup item was let through
+
+        last_check (float): The time, from time.monotonic, that the load signals were last read, or 0.0 if they haven't been read yet
+
+        last_stall (int): The total time stalled on the disk when it was last read, or None if it can't be read
+
+        stall_time (float): The time, from time.monotonic, that the total time stalled on the disk was last read
+
+        is_busy (bool): Whether the computer was too busy at the last check
+
+        hold_count (int): The number of checks that held back a startup item
+
+        forced_count (int): The number of startup items launched anyway after being held back for MaxHoldTime
+    """
+
+    __slots__ = (
+        "launch_policy",
+        "max_in_flight",
+        "last_admit",
+        "last_check",
+        "last_stall",
+        "stall_time",
+        "is_busy",
+        "hold_count",
+        "forced_count",
+    )
+
+    def __init__(self, launch_policy: dict, max_workers: int):
+        self.launch_policy = launch_policy
+        self.max_in_flight = launch_policy["MaxInFlight"] if launch_policy else max_workers
+        self.last_admit = time.monotonic()
+        self.last_check = 0.0
+        self.last_stall = read_io_stall_total() if launch_policy else None
+        self.stall_time = time.monotonic()
+        self.is_busy = False
+        self.hold_count = 0
+        self.forced_count = 0
+
+    def get_poll_interval(self):
+        """Function to get how many seconds to wait before asking again after a startup item was held back
+
+        Returns:
+            float: The PollInterval of the launch policy, or None if there is no launch policy
+        """
+        return self.launch_policy["PollInterval"] if self.launch_policy else None
+
+    def check_busy(self):
+        """Function to read the load signals and check them against the launch policy
+
+        The signals are read at most once every PollInterval, since reading them too often would just add to the load.
+
+        Returns:
+            bool: True if any of the load signals is over its limit, False if not
+        """
+        check_time = time.monotonic()
+
+        if check_time - self.last_check >= self.launch_policy["PollInterval"]:
+            busy_signals = []
+
+            runnable_per_cpu = read_runnable_per_cpu()
+            if runnable_per_cpu is not None:
+                busy_signals.append(runnable_per_cpu > self.launch_policy["MaxRunnablePerCpu"])
+
+            # The I/O pressure is worked out from the change in stalled time, in microseconds, since it was last read
+            stall_total = read_io_stall_total()
+            if stall_total is not None and self.last_stall is not None:
+                stall_percent = (stall_total - self.last_stall) / (
+                    max(check_time - self.stall_time, 0.001) * 10000
+                )
+                busy_signals.append(stall_percent > self.launch_policy["MaxIoPressure"])
+            self.last_stall = stall_total
+            self.stall_time = check_time
+
+            available_memory = read_available_memory_mb()
+            if available_memory is not None:
+                busy_signals.append(available_memory < self.launch_policy["MinAvailableMemoryMB"])
+
+            self.is_busy = any(busy_signals)
+            self.last_check = check_time
+
+        return self.is_busy
+
+    def admit(self, in_flight: int):
+        """Function to check if the next startup item can be launched now
+
+        Args:
+            in_flight (int): The number of startup items being started right now
+
+        Returns:
+            bool: True if the next startup item can be launched, False if it has to wait
+        """
+        can_launch = False
+
+        if in_flight < self.max_in_flight:
+            if self.launch_policy is None or not self.check_busy():
+                can_launch = True
+            elif time.monotonic() - self.last_admit >= self.launch_policy["MaxHoldTime"]:
+                # Don't hold back startup items forever on a computer that stays busy
+                can_launch = True
+                self.forced_count += 1
+            else:
+                self.hold_count += 1
+
+        if can_launch:
+            self.last_admit = time.monotonic()
+
+        return can_launch
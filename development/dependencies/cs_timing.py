@@ -0,0 +1,288 @@
+# Dependency to store the helper functions that keep a history of how long each startup item took to launch and report on the slowest ones
+
+import json, os, time
+
+import dependencies.cs_helper as deps_helper
+import dependencies.cs_pretty as deps_pretty
+import dependencies.cs_chooser as deps_chooser
+import dependencies.cs_enum as deps_enum
+import dependencies.cs_atomic as deps_atomic
+
+ENUM_RFV = deps_enum.ReportFormatVals
+
+# The extension added to the full path of the startup file to get the full path of its launch history file
+HISTORY_EXTENSION = ".history"
+
+# The filename, without extension, of the file the slowest items report is exported to, which is saved in the same folder as the startup file
+REPORT_FILENAME = "launch_report"
+
+# Each line of the launch history file is a launch run, which is a JSON object with the following keys:
+# LaunchedAt: the date and time the launch started, in the local time of the computer
+# LaunchTime: the number of seconds from the first program starting to start until the last one was started
+# Items: the launch result for each startup item, as described at the top of the module cs_launch
+
+# Each row of the slowest items report is a dictionary with the following keys:
+# ItemNumber: the ItemNumber of the startup item
+# Name: the Name of the startup item
+# Runs: the number of launch runs in the launch history that included the startup item
+# Failures: the number of those launch runs where the startup item couldn't be started
+# AverageSpawn: the average number of milliseconds it took to start the program
+# MaxSpawn: the longest number of milliseconds it took to start the program
+# AverageReady: the average number of milliseconds until the program was ready, or None if that was never measured
+# LastProcessId: the process ID from the latest launch run
+# LastExitStatus: the exit status from the latest launch run, or None if the program was still running
+REPORT_KEYS = (
+    "ItemNumber",
+    "Name",
+    "Runs",
+    "Failures",
+    "AverageSpawn",
+    "MaxSpawn",
+    "AverageReady",
+    "LastProcessId",
+    "LastExitStatus",
+)
+
+
+def get_history_file(json_file: str):
+    """Helper function to get the full path of the launch history file for a startup file
+
+    Args:
+        json_file (str): The full absolute path of the startup file including filename and extension
+
+    Returns:
+        str: The full absolute path of the launch history file
+    """
+    return json_file + HISTORY_EXTENSION
+
+
+def history_reader(json_file: str):
+    """Function to read in the launch runs from the launch history file
+
+    A line that can't be read, such as one cut off by a crash part way through a write, is skipped rather than losing the whole launch history.
+
+    Args:
+        json_file (str): The full absolute path of the startup file including filename and extension
+
+    Returns:
+        bool: True if the launch history could be read in or doesn't exist yet, False if not
+
+        string: An error message to display if the launch history couldn't be read in, or blank otherwise
+
+        list: The launch runs from oldest to newest, or an empty list if there aren't any
+    """
+    # Initialize function variables
+    read_success = True
+    return_message = ""
+    launch_runs = []
+    history_file = get_history_file(json_file)
+
+    if os.path.isfile(history_file):
+        try:
+            with open(history_file, "r") as file:
+                for history_line in file:
+                    try:
+                        launch_runs.append(json.loads(history_line))
+                    except json.JSONDecodeError:
+                        continue
+        except Exception as error:
+            read_success = False
+            return_message = deps_pretty.prettify_io_error(error, "r")
+
+    return (read_success, return_message, launch_runs)
+
+
+def history_writer(json_file: str, launch_results: list):
+    """Function to add a launch run to the launch history file
+
+    Only the newest launch runs are kept, up to the variable launch_history_runs in CompStart.py, so the launch history file never grows past a few kilobytes per startup item. The file is rewritten in the same way as the startup file, so a crash part way through never loses the older launch runs.
+
+    Args:
+        json_file (str): The full absolute path of the startup file including filename and extension
+
+        launch_results (list): The launch result for each startup item from the function launch_startup_items in the module cs_launch
+
+    Returns:
+        bool: True if the launch run was added, False if not
+
+        string: An error message to display if the launch run couldn't be added, or blank otherwise
+    """
+    # Initialize function variables
+    spawn_starts = [launch_result["SpawnStart"] for launch_result in launch_results if launch_result["SpawnStart"] is not None]
+    spawn_ends = [launch_result["SpawnEnd"] for launch_result in launch_results if launch_result["SpawnEnd"] is not None]
+
+    launch_run = {
+        "LaunchedAt": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "LaunchTime": max(spawn_ends) - min(spawn_starts) if spawn_starts else 0.0,
+        "Items": launch_results,
+    }
+
+    write_success, return_message, launch_runs = history_reader(json_file)
+
+    if write_success:
+        launch_runs.append(launch_run)
+        launch_runs = launch_runs[-max(deps_helper.get_launch_history_runs(), 1) :]
+
+        try:
+            deps_atomic.atomic_writer(
+                get_history_file(json_file),
+                "".join(json.dumps(launch_run) + "\n" for launch_run in launch_runs),
+                deps_helper.get_write_durability(),
+            )
+        except Exception as error:
+            write_success = False
+            return_message = deps_pretty.prettify_io_error(error, "w")
+
+    return (write_success, return_message)
+
+
+def get_slowest_items(launch_runs: list):
+    """Helper function to work out the slowest items report from the launch runs
+
+    Startup items are matched across launch runs by their ItemNumber and Name together, so a startup item that was renamed or moved starts a new row rather than mixing its timings with a different program. The rows are sorted from slowest to fastest by the average time to start the program plus the average time until it was ready, where that was measured.
+
+    Args:
+        launch_runs (list): The launch runs from oldest to newest
+
+    Returns:
+        list: The rows of the report. See the comment at the top of this module for the keys.
+    """
+    # Initialize function variables
+    report_rows = {}
+    spawn_totals = {}
+    ready_totals = {}
+
+    for launch_run in launch_runs:
+        for launch_result in launch_run.get("Items", []):
+            item_key = (launch_result["ItemNumber"], launch_result["Name"])
+            spawn_time = launch_result.get("SpawnLatency", 0.0) * 1000
+
+            if item_key not in report_rows:
+                report_rows[item_key] = dict.fromkeys(REPORT_KEYS)
+                report_rows[item_key].update(
+                    {
+                        "ItemNumber": item_key[0],
+                        "Name": item_key[1],
+                        "Runs": 0,
+                        "Failures": 0,
+                        "MaxSpawn": 0.0,
+                    }
+                )
+                spawn_totals[item_key] = 0.0
+                ready_totals[item_key] = []
+
+            report_row = report_rows[item_key]
+            report_row["Runs"] += 1
+            report_row["MaxSpawn"] = max(report_row["MaxSpawn"], spawn_time)
+            report_row["LastProcessId"] = launch_result.get("ProcessId", 0)
+            report_row["LastExitStatus"] = launch_result.get("ExitStatus")
+            spawn_totals[item_key] += spawn_time
+
+            if not launch_result.get("Started", False):
+                report_row["Failures"] += 1
+
+            if launch_result.get("ReadyTime") is not None:
+                ready_totals[item_key].append(launch_result["ReadyTime"] * 1000)
+
+    # Work out the averages now that every launch run has been counted
+    for item_key, report_row in report_rows.items():
+        report_row["AverageSpawn"] = spawn_totals[item_key] / report_row["Runs"]
+
+        if ready_totals[item_key]:
+            report_row["AverageReady"] = sum(ready_totals[item_key]) / len(ready_totals[item_key])
+
+    return sorted(
+        report_rows.values(),
+        key=lambda report_row: report_row["AverageSpawn"] + (report_row["AverageReady"] or 0.0),
+        reverse=True,
+    )
+
+
+def report_exporter(report_file: str, report_rows: list, export_format: str):
+    """Function to save the slowest items report to a file
+
+    Args:
+        report_file (str): The full absolute path of the report file including filename and extension
+
+        report_rows (list): The rows of the report from get_slowest_items
+
+        export_format (str): One of the values of the Enum class ReportFormatVals
+
+    Returns:
+        bool: True if the report was saved, False if not
+
+        string: An error message to display if the report couldn't be saved, or a message with where it was saved
+    """
+    # Initialize function variables
+    export_success = True
+    return_message = ""
+
+    try:
+        if export_format == ENUM_RFV.CSV.value:
+            # csv is only needed to export the report
+            import csv
+
+            with open(report_file, "w", newline="") as file:
+                csv_writer = csv.DictWriter(file, fieldnames=REPORT_KEYS)
+                csv_writer.writeheader()
+                csv_writer.writerows(report_rows)
+        else:
+            with open(report_file, "w") as file:
+                json.dump(report_rows, file, indent=4)
+
+        return_message = f"Saved the slowest items report to {report_file}"
+    except Exception as error:
+        export_success = False
+        return_message = deps_pretty.prettify_io_error(error)
+
+    return (export_success, return_message)
+
+
+def timing_reporter(json_path: list, json_filename: str):
+    """Function to show the slowest items report and let the user export it
+
+    Args:
+        json_path (list): A list containing the relative or absolute path to the JSON file with each list item representing one subfolder from Current Working Directory (CWD)
+
+        json_filename (str): The filename of the JSON file
+
+    Returns:
+        bool: True if the report was shown, and saved if the user asked for that, False if not
+
+        string: An error message to display if something went wrong, or a message with what was done
+    """
+    # Initialize function variables
+    json_file = deps_helper.parse_full_path(json_path, json_filename)
+    menu_choices = [
+        "Export the report as a CSV file",
+        "Export the report as a JSON file",
+        "Return to the main menu",
+    ]
+
+    status_state, status_message, launch_runs = history_reader(json_file)
+
+    if status_state:
+        if len(launch_runs) == 0:
+            status_message = "There is no launch history yet. Launch the startup items to start one."
+        else:
+            report_rows = get_slowest_items(launch_runs)
+            print(deps_pretty.prettify_launch_report(report_rows, len(launch_runs)))
+            status_message = "No report exported..."
+
+            # Loop until the user makes a valid choice
+            user_choice = 0
+            while user_choice not in range(1, len(menu_choices) + 1):
+                user_choice = deps_chooser.user_menu_chooser(menu_choices, False)
+
+            if user_choice < len(menu_choices):
+                export_format = [ENUM_RFV.CSV.value, ENUM_RFV.JSON.value][user_choice - 1]
+                status_state, status_message = report_exporter(
+                    os.path.join(os.path.dirname(json_file), REPORT_FILENAME + "." + export_format),
+                    report_rows,
+                    export_format,
+                )
+
+    if not status_state:
+        deps_pretty.prettify_custom_error(status_message, "timing_reporter")
+
+    return (status_state, status_message)